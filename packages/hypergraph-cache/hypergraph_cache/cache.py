@@ -8,6 +8,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from hypergraph_common.sync import run_sync
+
 if TYPE_CHECKING:
     from hypergraph_storage import Storage
 
@@ -41,6 +43,30 @@ class Cache(ABC):
             - value - The value to set.
         """
 
+    def get_sync(self, key: str) -> Any:
+        """Get the value for the given key from synchronous code.
+
+        Caches should override this to avoid an event loop; the default runs
+        `get` on an event loop reused by the calling thread.
+
+        Args:
+            - key - The key to get the value for.
+
+        Returns
+        -------
+            - output - The value for the given key.
+        """
+        return run_sync(self.get(key))
+
+    def set_sync(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set the value for the given key from synchronous code.
+
+        Args:
+            - key - The key to set the value for.
+            - value - The value to set.
+        """
+        run_sync(self.set(key, value, debug_data))
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the cache.
@@ -65,6 +91,10 @@ class Cache(ABC):
     async def clear(self) -> None:
         """Clear the cache."""
 
+    async def close(self) -> None:
+        """Close the connections held by the cache storage."""
+        return
+
     @abstractmethod
     def child(self, name: str) -> Cache:
         """Create a child cache with the given name.
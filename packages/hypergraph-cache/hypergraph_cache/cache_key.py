@@ -5,7 +5,7 @@
 
 from typing import Any, Protocol, runtime_checkable
 
-from hypergraph_common.hasher import hash_data
+from hypergraph_common.hasher import hash_json
 
 
 @runtime_checkable
@@ -32,5 +32,9 @@ class CacheKeyCreator(Protocol):
 
 
 def create_cache_key(input_args: dict[str, Any]) -> str:
-    """Create a cache key based on the input arguments."""
-    return hash_data(input_args)
+    """Create a cache key based on the input arguments.
+
+    The key is a hash of the canonical JSON serialization of the input
+    arguments, see `hypergraph_common.hasher.canonical_json`.
+    """
+    return hash_json(input_args)
@@ -54,6 +54,25 @@ class JsonCache(Cache):
         data = {"result": value, **(debug_data or {})}
         await self._storage.set(key, json.dumps(data, ensure_ascii=False))
 
+    def get_sync(self, key: str) -> Any | None:
+        """Get method definition, without an event loop."""
+        try:
+            data = self._storage.get_sync(key)
+            if data is None:
+                return None
+            data = json.loads(data)
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            self._storage.delete_sync(key)
+            return None
+        return data.get("result")
+
+    def set_sync(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition, without an event loop."""
+        if value is None:
+            return
+        data = {"result": value, **(debug_data or {})}
+        self._storage.set_sync(key, json.dumps(data, ensure_ascii=False))
+
     async def has(self, key: str) -> bool:
         """Has method definition."""
         return await self._storage.has(key)
@@ -67,6 +86,10 @@ class JsonCache(Cache):
         """Clear method definition."""
         await self._storage.clear()
 
+    async def close(self) -> None:
+        """Close method definition."""
+        await self._storage.close()
+
     def child(self, name: str) -> "Cache":
         """Child method definition."""
         return JsonCache(storage=self._storage.child(name))
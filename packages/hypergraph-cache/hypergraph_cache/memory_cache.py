@@ -40,6 +40,14 @@ class MemoryCache(Cache):
         """
         self._cache[key] = value
 
+    def get_sync(self, key: str) -> Any:
+        """Get the value for the given key without an event loop."""
+        return self._cache.get(key)
+
+    def set_sync(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set the value for the given key without an event loop."""
+        self._cache[key] = value
+
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
 
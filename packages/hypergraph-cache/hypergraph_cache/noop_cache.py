@@ -37,6 +37,15 @@ class NoopCache(Cache):
             - value - The value to set.
         """
 
+    def get_sync(self, key: str) -> Any:
+        """Get the value for the given key without an event loop."""
+        return None
+
+    def set_sync(
+        self, key: str, value: str | bytes | None, debug_data: dict | None = None
+    ) -> None:
+        """Set the value for the given key without an event loop."""
+
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the cache.
 
@@ -5,14 +5,18 @@
 
 from hypergraph_common.hasher.hasher import (
     Hasher,
+    canonical_json,
     hash_data,
+    hash_json,
     make_yaml_serializable,
     sha256_hasher,
 )
 
 __all__ = [
     "Hasher",
+    "canonical_json",
     "hash_data",
+    "hash_json",
     "make_yaml_serializable",
     "sha256_hasher",
 ]
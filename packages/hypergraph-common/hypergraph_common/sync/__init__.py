@@ -0,0 +1,10 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The Hypergraph sync module."""
+
+from hypergraph_common.sync.run_sync import run_sync
+
+__all__ = [
+    "run_sync",
+]
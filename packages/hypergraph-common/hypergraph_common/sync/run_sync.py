@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run coroutines from synchronous code."""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _ThreadLoop:
+    """An event loop owned by one thread, closed when the thread exits."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self) -> None:
+        if not self.loop.is_closed():
+            self.loop.close()
+
+
+_local = threading.local()
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the event loop of the calling thread.
+
+    The loop is reused by every call from the same thread, so synchronous code
+    calling async-only APIs does not pay for a new event loop per call. Must not
+    be called from a thread that is already running an event loop.
+
+    Args
+    ----
+        coroutine: Coroutine[Any, Any, T]
+            The coroutine to run.
+
+    Returns
+    -------
+        T
+            The result of the coroutine.
+    """
+    thread_loop: _ThreadLoop | None = getattr(_local, "thread_loop", None)
+    if thread_loop is None or thread_loop.loop.is_closed():
+        thread_loop = _local.thread_loop = _ThreadLoop()
+    return thread_loop.loop.run_until_complete(coroutine)
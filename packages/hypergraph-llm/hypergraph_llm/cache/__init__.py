@@ -3,8 +3,15 @@
 
 """Cache module."""
 
-from hypergraph_llm.cache.create_cache_key import create_cache_key
+from hypergraph_llm.cache.create_cache_key import (
+    create_cache_key,
+    get_cache_key_parameters,
+)
+from hypergraph_llm.cache.migrate_cache import MigrateCacheResult, migrate_cache
 
 __all__ = [
+    "MigrateCacheResult",
     "create_cache_key",
+    "get_cache_key_parameters",
+    "migrate_cache",
 ]
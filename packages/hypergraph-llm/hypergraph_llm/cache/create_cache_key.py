@@ -7,7 +7,7 @@ from typing import Any
 
 from hypergraph_cache import create_cache_key as default_create_cache_key
 
-_CACHE_VERSION = 4
+_CACHE_VERSION = 5
 """
 If there's a breaking change in what we cache, we should increment this version number to invalidate existing caches.
 
@@ -20,6 +20,11 @@ hypergraph-llm package is now on version 4.
 This is to account for changes to the ModelConfig that affect the cache key and
 occurred when pulling this package out of hypergraph.
 hypergraph-llm, now that is supports metrics, also caches metrics which were not cached before.
+
+Version 5 hashes the canonical JSON of the input arguments instead of their YAML
+dump, and suffixes keys with the version. Entries written with `cache_parameters`
+enabled in the ModelConfig record their cache key parameters, so `migrate_cache`
+can re-key them for later versions.
 """
 
 
@@ -36,16 +41,16 @@ def create_cache_key(
     Returns
     -------
         str
-            The generated cache key in the format
-            `{prefix}_{data_hash}_v{version}` if prefix is provided.
+            The generated cache key in the format `{data_hash}_v{version}`.
     """
-    cache_key_parameters = _get_parameters(
+    cache_key_parameters = get_cache_key_parameters(
         input_args=input_args,
     )
-    return default_create_cache_key(cache_key_parameters)
+    data_hash = default_create_cache_key(cache_key_parameters)
+    return f"{data_hash}_v{_CACHE_VERSION}"
 
 
-def _get_parameters(
+def get_cache_key_parameters(
     # model_config: "ModelConfig",
     input_args: dict[str, Any],
 ) -> dict[str, Any]:
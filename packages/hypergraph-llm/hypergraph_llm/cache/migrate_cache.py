@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Re-key the entries of a cache directory."""
+
+import json
+import logging
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hypergraph_llm.cache.create_cache_key import create_cache_key
+
+if TYPE_CHECKING:
+    from hypergraph_cache import CacheKeyCreator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MigrateCacheResult:
+    """Counts of the cache entries seen by `migrate_cache`."""
+
+    migrated: int = 0
+    """Entries moved to their current cache key."""
+
+    unchanged: int = 0
+    """Entries already stored under their current cache key."""
+
+    skipped: int = 0
+    """Entries that do not record their cache key parameters, such as those
+    written without `cache_parameters` enabled, or that are not valid JSON."""
+
+
+def migrate_cache(
+    cache_dir: str | Path,
+    *,
+    cache_key_creator: "CacheKeyCreator" = create_cache_key,
+    keep_stale: bool = False,
+) -> MigrateCacheResult:
+    """Move the entries of a JSON cache directory to their current cache keys.
+
+    Run this after changing the cache version so existing responses are
+    reused instead of requested again. Use the cache key creator the models
+    are created with, so the migrated keys are the ones they look up. Subdirectories, one per
+    cache child, are migrated in place.
+
+    Args
+    ----
+        cache_dir: str | Path
+            The base directory of the file cache.
+        cache_key_creator: CacheKeyCreator (default: create_cache_key)
+            The cache key creator the new cache keys are created with.
+        keep_stale: bool (default: False)
+            Copy entries instead of moving them, keeping the old keys.
+
+    Returns
+    -------
+        MigrateCacheResult
+            The number of migrated, unchanged and skipped entries.
+    """
+    result = MigrateCacheResult()
+    for path in sorted(Path(cache_dir).rglob("*")):
+        if not path.is_file():
+            continue
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            result.skipped += 1
+            continue
+        parameters = entry.get("parameters") if isinstance(entry, dict) else None
+        if not isinstance(parameters, dict):
+            result.skipped += 1
+            continue
+
+        key = cache_key_creator(parameters)
+        if key == path.name:
+            result.unchanged += 1
+            continue
+        target = path.with_name(key)
+        if keep_stale:
+            shutil.copyfile(path, target)
+        else:
+            path.replace(target)
+        result.migrated += 1
+
+    logger.info(
+        "Migrated %d cache entries in %s, %d unchanged, %d skipped",
+        result.migrated,
+        cache_dir,
+        result.unchanged,
+        result.skipped,
+    )
+    return result
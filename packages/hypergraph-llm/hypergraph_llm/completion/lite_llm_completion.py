@@ -126,6 +126,7 @@ class LiteLLMCompletion(LLMCompletion):
             metrics_processor=self._metrics_processor,
             rate_limiter=self._rate_limiter,
             retrier=self._retrier,
+            metrics_store=self._metrics_store,
         )
 
     def completion(
@@ -150,6 +151,9 @@ class LiteLLMCompletion(LLMCompletion):
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
 
+        if request_metrics is not None:
+            self._metrics_store.update_metrics(metrics={"in_flight_requests": 1})
+
         try:
             response = self._completion(
                 messages=messages,
@@ -165,6 +169,7 @@ class LiteLLMCompletion(LLMCompletion):
             return response
         finally:
             if request_metrics is not None:
+                self._metrics_store.update_metrics(metrics={"in_flight_requests": -1})
                 self._metrics_store.update_metrics(metrics=request_metrics)
 
     async def completion_async(
@@ -189,6 +194,9 @@ class LiteLLMCompletion(LLMCompletion):
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
 
+        if request_metrics is not None:
+            self._metrics_store.update_metrics(metrics={"in_flight_requests": 1})
+
         try:
             response = await self._completion_async(
                 messages=messages,
@@ -204,6 +212,7 @@ class LiteLLMCompletion(LLMCompletion):
             return response
         finally:
             if request_metrics is not None:
+                self._metrics_store.update_metrics(metrics={"in_flight_requests": -1})
                 self._metrics_store.update_metrics(metrics=request_metrics)
 
     @property
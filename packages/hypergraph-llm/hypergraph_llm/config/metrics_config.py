@@ -30,7 +30,7 @@ class MetricsConfig(BaseModel):
 
     writer: str | None = Field(
         default=MetricsWriterType.Log,
-        description="MetricsWriter implementation to use. [log, file] (default: log).",
+        description="MetricsWriter implementation to use. [log, file, openmetrics] (default: log).",
     )
 
     log_level: int | None = Field(
@@ -43,15 +43,60 @@ class MetricsConfig(BaseModel):
         description="Base directory for file-based metrics writer. (default: ./metrics)",
     )
 
+    openmetrics_port: int | None = Field(
+        default=None,
+        description="Port to serve metrics on at /metrics when using the 'openmetrics' metrics writer. 0 picks a free port. (default: None, not served)",
+    )
+
+    openmetrics_host: str | None = Field(
+        default=None,
+        description="Address to serve metrics on when using the 'openmetrics' metrics writer. (default: 127.0.0.1)",
+    )
+
+    textfile_path: str | None = Field(
+        default=None,
+        description="File to write metrics to for the node exporter textfile collector when using the 'openmetrics' metrics writer. (default: None, not written)",
+    )
+
+    textfile_interval: float | None = Field(
+        default=None,
+        description="Seconds between two writes of the metrics textfile. (default: 15)",
+    )
+
+    histograms: list[str] | None = Field(
+        default=None,
+        description="Metrics whose distribution is tracked in a histogram and reported as p50, p95, p99 and max. (default: compute_duration_seconds, time_to_first_token_seconds, rate_limit_wait_seconds, retry_delay_seconds)",
+    )
+
     def _validate_file_metrics_writer_config(self) -> None:
         """Validate parameters for file-based metrics writer."""
         if self.base_dir is not None and self.base_dir.strip() == "":
             msg = "base_dir must be specified for file-based metrics writer."
             raise ValueError(msg)
 
+    def _validate_openmetrics_metrics_writer_config(self) -> None:
+        """Validate parameters for the OpenMetrics metrics writer."""
+        if self.openmetrics_port is None and self.textfile_path is None:
+            msg = "openmetrics_port or textfile_path must be specified for the OpenMetrics metrics writer."
+            raise ValueError(msg)
+        if (
+            self.openmetrics_port is not None
+            and not 0 <= self.openmetrics_port <= 65535
+        ):
+            msg = "openmetrics_port must be between 0 and 65535."
+            raise ValueError(msg)
+        if self.textfile_path is not None and self.textfile_path.strip() == "":
+            msg = "textfile_path must not be empty."
+            raise ValueError(msg)
+        if self.textfile_interval is not None and self.textfile_interval <= 0:
+            msg = "textfile_interval must be a positive number."
+            raise ValueError(msg)
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the metrics configuration based on its writer type."""
         if self.writer == MetricsWriterType.File:
             self._validate_file_metrics_writer_config()
+        elif self.writer == MetricsWriterType.OpenMetrics:
+            self._validate_openmetrics_metrics_writer_config()
         return self
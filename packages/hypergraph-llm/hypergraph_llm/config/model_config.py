@@ -80,6 +80,11 @@ class ModelConfig(BaseModel):
         description="Specify and configure the metric services.",
     )
 
+    cache_parameters: bool = Field(
+        default=False,
+        description="Record the cache key parameters of every request in its cache entry, so the cache can be re-keyed by migrate_cache.",
+    )
+
     mock_responses: list[str] | list[float] = Field(
         default_factory=list,
         description="List of mock responses for testing.",
@@ -16,7 +16,7 @@ class RateLimitConfig(BaseModel):
 
     type: str = Field(
         default=RateLimitType.SlidingWindow,
-        description="The type of rate limit strategy to use. [sliding_window] (default: sliding_window).",
+        description="The type of rate limit strategy to use. [sliding_window, adaptive] (default: sliding_window).",
     )
 
     period_in_seconds: int | None = Field(
@@ -34,6 +34,26 @@ class RateLimitConfig(BaseModel):
         description="The maximum number of tokens allowed per period. (default: None, no limit).",
     )
 
+    initial_concurrency: int | None = Field(
+        default=None,
+        description="The number of concurrent requests allowed before any feedback, for adaptive rate limiting. (default: 8).",
+    )
+
+    min_concurrency: int | None = Field(
+        default=None,
+        description="The lower bound of the concurrency limit for adaptive rate limiting. (default: 1).",
+    )
+
+    max_concurrency: int | None = Field(
+        default=None,
+        description="The upper bound of the concurrency limit for adaptive rate limiting. (default: 64).",
+    )
+
+    latency_tolerance: float | None = Field(
+        default=None,
+        description="Reduce the concurrency limit when the smoothed latency per token exceeds this multiple of its baseline, for adaptive rate limiting. (default: None, only rate limit errors reduce the limit).",
+    )
+
     def _validate_sliding_window_config(self) -> None:
         """Validate Sliding Window rate limit configuration."""
         if self.period_in_seconds is not None and self.period_in_seconds <= 0:
@@ -52,9 +72,31 @@ class RateLimitConfig(BaseModel):
             msg = "tokens_per_period must be a positive integer for Sliding Window rate limit."
             raise ValueError(msg)
 
+    def _validate_adaptive_config(self) -> None:
+        """Validate Adaptive rate limit configuration."""
+        for name in ("initial_concurrency", "min_concurrency", "max_concurrency"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                msg = f"{name} must be a positive integer for Adaptive rate limit."
+                raise ValueError(msg)
+
+        if (
+            self.min_concurrency is not None
+            and self.max_concurrency is not None
+            and self.min_concurrency > self.max_concurrency
+        ):
+            msg = "min_concurrency must not be greater than max_concurrency for Adaptive rate limit."
+            raise ValueError(msg)
+
+        if self.latency_tolerance is not None and self.latency_tolerance <= 1.0:
+            msg = "latency_tolerance must be greater than 1.0 for Adaptive rate limit."
+            raise ValueError(msg)
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the rate limit configuration based on its type."""
         if self.type == RateLimitType.SlidingWindow:
             self._validate_sliding_window_config()
+        elif self.type == RateLimitType.Adaptive:
+            self._validate_adaptive_config()
         return self
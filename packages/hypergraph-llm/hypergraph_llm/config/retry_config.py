@@ -16,7 +16,7 @@ class RetryConfig(BaseModel):
 
     type: str = Field(
         default=RetryType.ExponentialBackoff,
-        description="The type of retry strategy to use. [exponential_backoff, immediate] (default: exponential_backoff).",
+        description="The type of retry strategy to use. [exponential_backoff, immediate, cooldown] (default: exponential_backoff).",
     )
 
     max_retries: int | None = Field(
@@ -39,6 +39,11 @@ class RetryConfig(BaseModel):
         description="The maximum delay in seconds between retries.",
     )
 
+    release_interval: float | None = Field(
+        default=None,
+        description="The seconds between two requests released after a cool-down for cooldown retry. (default: 0.1).",
+    )
+
     def _validate_exponential_backoff_config(self) -> None:
         """Validate Exponential Backoff retry configuration."""
         if self.max_retries is not None and self.max_retries <= 1:
@@ -59,6 +64,24 @@ class RetryConfig(BaseModel):
             msg = "max_retries must be greater than 1 for Immediate retry."
             raise ValueError(msg)
 
+    def _validate_cooldown_config(self) -> None:
+        """Validate Cooldown retry configuration."""
+        if self.max_retries is not None and self.max_retries <= 1:
+            msg = "max_retries must be greater than 1 for Cooldown retry."
+            raise ValueError(msg)
+
+        if self.base_delay is not None and self.base_delay <= 1.0:
+            msg = "base_delay must be greater than 1.0 for Cooldown retry."
+            raise ValueError(msg)
+
+        if self.max_delay is not None and self.max_delay <= 1:
+            msg = "max_delay must be greater than 1 for Cooldown retry."
+            raise ValueError(msg)
+
+        if self.release_interval is not None and self.release_interval < 0:
+            msg = "release_interval must not be negative for Cooldown retry."
+            raise ValueError(msg)
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the retry configuration based on its type."""
@@ -66,4 +89,6 @@ class RetryConfig(BaseModel):
             self._validate_exponential_backoff_config()
         elif self.type == RetryType.Immediate:
             self._validate_immediate_config()
+        elif self.type == RetryType.Cooldown:
+            self._validate_cooldown_config()
         return self
@@ -29,6 +29,11 @@ class TokenizerConfig(BaseModel):
         description="The encoding name for the tokenizer. Example: gpt-4o.",
     )
 
+    token_count_cache_size: int = Field(
+        default=4096,
+        description="The number of token counts to memoize per tokenizer. Set to 0 to disable. (default: 4096).",
+    )
+
     def _validate_litellm_config(self) -> None:
         """Validate LiteLLM tokenizer configuration."""
         if self.model_id is None or self.model_id.strip() == "":
@@ -44,6 +49,9 @@ class TokenizerConfig(BaseModel):
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the tokenizer configuration based on its type."""
+        if self.token_count_cache_size < 0:
+            msg = "token_count_cache_size must be a non-negative integer."
+            raise ValueError(msg)
         if self.type == TokenizerType.LiteLLM:
             self._validate_litellm_config()
         elif self.type == TokenizerType.Tiktoken:
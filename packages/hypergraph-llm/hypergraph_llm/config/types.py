@@ -32,6 +32,7 @@ class MetricsWriterType(StrEnum):
 
     Log = "log"
     File = "file"
+    OpenMetrics = "openmetrics"
 
 
 class MetricsStoreType(StrEnum):
@@ -44,6 +45,7 @@ class RateLimitType(StrEnum):
     """Enum for built-in RateLimit types."""
 
     SlidingWindow = "sliding_window"
+    Adaptive = "adaptive"
 
 
 class RetryType(StrEnum):
@@ -51,6 +53,7 @@ class RetryType(StrEnum):
 
     ExponentialBackoff = "exponential_backoff"
     Immediate = "immediate"
+    Cooldown = "cooldown"
 
 
 class TemplateEngineType(StrEnum):
@@ -107,17 +107,23 @@ def create_embedding(
 
     tokenizer = tokenizer or create_tokenizer(TokenizerConfig(model_id=model_id))
 
+    # Requests to the same endpoint share adaptive rate limits and cool-downs
+    endpoint = f"{model_config.api_base or model_config.model_provider}/{model_config.azure_deployment_name or model_config.model}"
+
     rate_limiter: RateLimiter | None = None
     if model_config.rate_limit:
         from hypergraph_llm.rate_limit.rate_limit_factory import create_rate_limiter
 
-        rate_limiter = create_rate_limiter(rate_limit_config=model_config.rate_limit)
+        rate_limiter = create_rate_limiter(
+            rate_limit_config=model_config.rate_limit,
+            endpoint=endpoint,
+        )
 
     retrier: Retry | None = None
     if model_config.retry:
         from hypergraph_llm.retry.retry_factory import create_retry
 
-        retrier = create_retry(retry_config=model_config.retry)
+        retrier = create_retry(retry_config=model_config.retry, endpoint=endpoint)
 
     metrics_store: MetricsStore = NoopMetricsStore()
     metrics_processor: MetricsProcessor | None = None
@@ -133,6 +139,13 @@ def create_embedding(
         )
         metrics_processor = create_metrics_processor(model_config.metrics)
 
+        from hypergraph_llm.rate_limit.adaptive_rate_limiter import (
+            AdaptiveRateLimiter,
+        )
+
+        if isinstance(rate_limiter, AdaptiveRateLimiter):
+            rate_limiter.add_metrics_store(metrics_store)
+
     return embedding_factory.create(
         strategy=strategy,
         init_args={
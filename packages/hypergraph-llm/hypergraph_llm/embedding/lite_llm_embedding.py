@@ -116,6 +116,7 @@ class LiteLLMEmbedding(LLMEmbedding):
             metrics_processor=self._metrics_processor,
             rate_limiter=self._rate_limiter,
             retrier=self._retrier,
+            metrics_store=self._metrics_store,
         )
 
     def embedding(
@@ -126,9 +127,14 @@ class LiteLLMEmbedding(LLMEmbedding):
         if not self._track_metrics:
             request_metrics = None
 
+        if request_metrics is not None:
+            self._metrics_store.update_metrics(metrics={"in_flight_requests": 1})
+
         try:
             return self._embedding(metrics=request_metrics, **kwargs)
         finally:
+            if request_metrics is not None:
+                self._metrics_store.update_metrics(metrics={"in_flight_requests": -1})
             if request_metrics:
                 self._metrics_store.update_metrics(metrics=request_metrics)
 
@@ -140,9 +146,14 @@ class LiteLLMEmbedding(LLMEmbedding):
         if not self._track_metrics:
             request_metrics = None
 
+        if request_metrics is not None:
+            self._metrics_store.update_metrics(metrics={"in_flight_requests": 1})
+
         try:
             return await self._embedding_async(metrics=request_metrics, **kwargs)
         finally:
+            if request_metrics is not None:
+                self._metrics_store.update_metrics(metrics={"in_flight_requests": -1})
             if request_metrics:
                 self._metrics_store.update_metrics(metrics=request_metrics)
 
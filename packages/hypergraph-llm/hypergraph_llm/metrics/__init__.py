@@ -3,6 +3,7 @@
 
 """Metrics module for hypergraph-llm."""
 
+from hypergraph_llm.metrics.histogram import Histogram
 from hypergraph_llm.metrics.metrics_aggregator import metrics_aggregator
 from hypergraph_llm.metrics.metrics_processor import MetricsProcessor
 from hypergraph_llm.metrics.metrics_processor_factory import (
@@ -19,15 +20,24 @@ from hypergraph_llm.metrics.metrics_writer_factory import (
     create_metrics_writer,
     register_metrics_writer,
 )
+from hypergraph_llm.metrics.openmetrics_exporter import (
+    MetricFamily,
+    OpenMetricsExporter,
+    openmetrics_exporter,
+)
 
 __all__ = [
+    "Histogram",
+    "MetricFamily",
     "MetricsProcessor",
     "MetricsStore",
     "MetricsWriter",
+    "OpenMetricsExporter",
     "create_metrics_processor",
     "create_metrics_store",
     "create_metrics_writer",
     "metrics_aggregator",
+    "openmetrics_exporter",
     "register_metrics_processor",
     "register_metrics_store",
     "register_metrics_writer",
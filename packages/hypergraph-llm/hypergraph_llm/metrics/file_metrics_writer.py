@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 from hypergraph_llm.metrics.metrics_writer import MetricsWriter
 
 if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
     from hypergraph_llm.types import Metrics
 
 
@@ -30,8 +31,19 @@ class FileMetricsWriter(MetricsWriter):
 
         self._base_dir.mkdir(parents=True, exist_ok=True)
 
-    def write_metrics(self, *, id: str, metrics: "Metrics") -> None:
-        """Write the given metrics."""
-        record = json.dumps({"id": id, "metrics": metrics})
+    def write_metrics(
+        self,
+        *,
+        id: str,
+        metrics: "Metrics",
+        histograms: dict[str, "Histogram"] | None = None,
+    ) -> None:
+        """Write the given metrics, and the buckets of the given histograms."""
+        data: dict[str, Any] = {"id": id, "metrics": metrics}
+        if histograms:
+            data["histograms"] = {
+                name: histogram.to_dict() for name, histogram in histograms.items()
+            }
+        record = json.dumps(data)
         with self._file_path.open("a", encoding="utf-8") as f:
             f.write(f"{record}\n")
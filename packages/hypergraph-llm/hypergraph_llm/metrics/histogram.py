@@ -0,0 +1,163 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Histogram with fixed logarithmic buckets."""
+
+import math
+from typing import Any
+
+_default_growth = 2 ** (1 / 8)
+
+
+class Histogram:
+    """Distribution of observed values in fixed logarithmic buckets.
+
+    A positive value is counted in the bucket `i` with
+    `growth ** (i - 1) < value <= growth ** i`, so any value is known within a
+    relative error of `growth - 1` (about 9% by default) whatever its scale.
+    Values of 0 or less share a single bucket with an upper bound of 0.
+    Recording a value only computes a logarithm and increments a counter, and
+    only the buckets that were hit are kept.
+
+    Histograms with the same growth factor can be merged, e.g. to combine the
+    histograms of several runs.
+    """
+
+    _growth: float
+    _log_growth: float
+    _buckets: dict[int | None, int]
+    _count: int
+    _sum: float
+    _min: float
+    _max: float
+
+    def __init__(self, *, growth: float = _default_growth) -> None:
+        """Initialize Histogram.
+
+        Args
+        ----
+            growth: float (default=2 ** (1 / 8))
+                The ratio between the upper bounds of two consecutive buckets.
+                Must be greater than 1.
+
+        Raises
+        ------
+            ValueError
+                If growth is not greater than 1.
+        """
+        if growth <= 1:
+            msg = "growth must be greater than 1."
+            raise ValueError(msg)
+        self._growth = growth
+        self._log_growth = math.log(growth)
+        self._buckets = {}
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def growth(self) -> float:
+        """The ratio between the upper bounds of two consecutive buckets."""
+        return self._growth
+
+    @property
+    def count(self) -> int:
+        """The number of recorded values."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """The sum of the recorded values."""
+        return self._sum
+
+    @property
+    def min(self) -> float:
+        """The smallest recorded value, or 0 if no value was recorded."""
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """The largest recorded value, or 0 if no value was recorded."""
+        return self._max if self._count else 0.0
+
+    def record(self, value: float) -> None:
+        """Record a single value."""
+        index = math.ceil(math.log(value) / self._log_growth) if value > 0 else None
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the values recorded by another histogram with the same growth factor.
+
+        Raises
+        ------
+            ValueError
+                If the growth factors of the histograms differ.
+        """
+        if other.growth != self._growth:
+            msg = "Cannot merge histograms with different growth factors."
+            raise ValueError(msg)
+        if not other.count:
+            return
+        for upper_bound, count in other.buckets():
+            index = (
+                round(math.log(upper_bound) / self._log_growth)
+                if upper_bound > 0
+                else None
+            )
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._count += other.count
+        self._sum += other.sum
+        self._min = min(self._min, other.min)
+        self._max = max(self._max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Return the value below or at which the given percentage of values fall.
+
+        The result is the upper bound of the bucket holding the value,
+        clamped to the smallest and largest recorded values, so the 0th and
+        100th percentiles are exact.
+
+        Args
+        ----
+            percentile: float
+                The percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+            float: The percentile, or 0 if no value was recorded.
+        """
+        if not self._count:
+            return 0.0
+        if percentile <= 0:
+            return self._min
+        rank = math.ceil(percentile / 100 * self._count)
+        seen = 0
+        for upper_bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(max(upper_bound, self._min), self._max)
+        return self._max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Return the upper bound and count of every non-empty bucket, in increasing order."""
+        indexes = sorted(index for index in self._buckets if index is not None)
+        result = [(self._growth**index, self._buckets[index]) for index in indexes]
+        if None in self._buckets:
+            result.insert(0, (0.0, self._buckets[None]))
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the histogram."""
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "min": self.min,
+            "max": self.max,
+            "growth": self._growth,
+            "buckets": [[upper_bound, count] for upper_bound, count in self.buckets()],
+        }
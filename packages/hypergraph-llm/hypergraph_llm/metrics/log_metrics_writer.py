@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 from hypergraph_llm.metrics.metrics_writer import MetricsWriter
 
 if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
     from hypergraph_llm.types import Metrics
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,16 @@ class LogMetricsWriter(MetricsWriter):
         if log_level and log_level in _log_methods:
             self._log_method = _log_methods[log_level]
 
-    def write_metrics(self, *, id: str, metrics: "Metrics") -> None:
-        """Write the given metrics."""
+    def write_metrics(
+        self,
+        *,
+        id: str,
+        metrics: "Metrics",
+        histograms: dict[str, "Histogram"] | None = None,
+    ) -> None:
+        """Write the given metrics.
+
+        Histograms are summarized by the percentiles already in the metrics,
+        so their buckets are not logged.
+        """
         self._log_method(f"Metrics for {id}: {json.dumps(metrics, indent=2)}")
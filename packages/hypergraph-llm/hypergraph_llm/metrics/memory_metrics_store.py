@@ -7,6 +7,7 @@ import atexit
 import threading
 from typing import TYPE_CHECKING, Any
 
+from hypergraph_llm.metrics.histogram import Histogram
 from hypergraph_llm.metrics.metrics_aggregator import metrics_aggregator
 from hypergraph_llm.metrics.metrics_store import MetricsStore
 
@@ -22,11 +23,19 @@ _default_sort_order: list[str] = [
     "requests_with_retries",
     "retries",
     "retry_rate",
+    "concurrency_limit",
+    "in_flight_requests",
     "compute_duration_seconds",
     "compute_duration_per_response_seconds",
+    "time_to_first_token_seconds",
+    "rate_limit_wait_seconds",
+    "retry_delay_seconds",
     "runtime_duration_seconds",
     "cached_responses",
     "cache_hit_rate",
+    "coalesced_responses",
+    "embedding_cache_hits",
+    "embedding_cache_misses",
     "streaming_responses",
     "responses_with_tokens",
     "prompt_tokens",
@@ -40,6 +49,16 @@ _default_sort_order: list[str] = [
     "cost_per_response",
 ]
 
+_default_histograms: list[str] = [
+    "compute_duration_seconds",
+    "time_to_first_token_seconds",
+    "rate_limit_wait_seconds",
+    "retry_delay_seconds",
+]
+
+_percentiles: list[int] = [50, 95, 99]
+_histogram_suffixes: list[str] = [*(f"p{p}" for p in _percentiles), "max"]
+
 
 class MemoryMetricsStore(MetricsStore):
     """Store for metrics."""
@@ -49,6 +68,8 @@ class MemoryMetricsStore(MetricsStore):
     _sort_order: list[str]
     _thread_lock: threading.Lock
     _metrics: "Metrics"
+    _histogram_names: frozenset[str]
+    _histograms: dict[str, Histogram]
 
     def __init__(
         self,
@@ -56,21 +77,45 @@ class MemoryMetricsStore(MetricsStore):
         id: str,
         metrics_writer: "MetricsWriter | None" = None,
         sort_order: list[str] | None = None,
+        histograms: list[str] | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize MemoryMetricsStore."""
+        """Initialize MemoryMetricsStore.
+
+        Args
+        ----
+            id: str
+                The ID of the metrics store.
+            metrics_writer: MetricsWriter | None
+                The metrics writer used to write the metrics on exit.
+            sort_order: list[str] | None
+                The order of the metrics returned by `get_metrics`.
+            histograms: list[str] | None
+                The metrics whose distribution is tracked in a histogram, and
+                reported as `<name>_p50`, `<name>_p95`, `<name>_p99` and
+                `<name>_max`. Defaults to the latency metrics.
+        """
         self._id = id
         self._sort_order = sort_order or _default_sort_order
         self._thread_lock = threading.Lock()
         self._metrics = {}
+        self._histogram_names = frozenset(
+            _default_histograms if histograms is None else histograms
+        )
+        self._histograms = {}
 
         if metrics_writer:
             self._metrics_writer = metrics_writer
             atexit.register(self._on_exit_)
+            metrics_writer.add_metrics_store(self)
 
     def _on_exit_(self) -> None:
         if self._metrics_writer:
-            self._metrics_writer.write_metrics(id=self._id, metrics=self.get_metrics())
+            self._metrics_writer.write_metrics(
+                id=self._id,
+                metrics=self.get_metrics(),
+                histograms=self.get_histograms(),
+            )
 
     @property
     def id(self) -> str:
@@ -78,29 +123,63 @@ class MemoryMetricsStore(MetricsStore):
         return self._id
 
     def update_metrics(self, *, metrics: "Metrics") -> None:
-        """Update the store with multiple metrics."""
+        """Update the store with multiple metrics.
+
+        Cached and coalesced responses replay the metrics of the request that
+        called the model, so their timings are not recorded in the histograms.
+        """
+        replayed = metrics.get("cached_responses") or metrics.get("coalesced_responses")
         with self._thread_lock:
             for name, value in metrics.items():
                 if name in self._metrics:
                     self._metrics[name] += value
                 else:
                     self._metrics[name] = value
+                if name in self._histogram_names and not replayed:
+                    histogram = self._histograms.get(name)
+                    if histogram is None:
+                        histogram = self._histograms[name] = Histogram()
+                    histogram.record(value)
+
+    def set_metrics(self, *, metrics: "Metrics") -> None:
+        """Set metrics to the given values, replacing the stored ones."""
+        with self._thread_lock:
+            self._metrics.update(metrics)
 
-    def _sort_metrics(self) -> "Metrics":
+    def _sort_metrics(self, metrics: "Metrics") -> "Metrics":
         """Sort metrics based on the predefined sort order."""
         sorted_metrics: Metrics = {}
         for key in self._sort_order:
-            if key in self._metrics:
-                sorted_metrics[key] = self._metrics[key]
-        for key in self._metrics:
+            if key in metrics:
+                sorted_metrics[key] = metrics[key]
+            for suffix in _histogram_suffixes:
+                if f"{key}_{suffix}" in metrics:
+                    sorted_metrics[f"{key}_{suffix}"] = metrics[f"{key}_{suffix}"]
+        for key in metrics:
             if key not in sorted_metrics:
-                sorted_metrics[key] = self._metrics[key]
+                sorted_metrics[key] = metrics[key]
         return sorted_metrics
 
     def get_metrics(self) -> "Metrics":
         """Get all metrics from the store."""
-        metrics_aggregator.aggregate(self._metrics)
-        return self._sort_metrics()
+        with self._thread_lock:
+            # Aggregate a copy, so metrics can be read while they are updated
+            metrics = dict(self._metrics)
+            for name, histogram in self._histograms.items():
+                for percentile in _percentiles:
+                    metrics[f"{name}_p{percentile}"] = histogram.percentile(percentile)
+                metrics[f"{name}_max"] = histogram.max
+        metrics_aggregator.aggregate(metrics)
+        return self._sort_metrics(metrics)
+
+    def get_histograms(self) -> dict[str, Histogram]:
+        """Get copies of the histograms of the histogram metrics."""
+        with self._thread_lock:
+            histograms: dict[str, Histogram] = {}
+            for name, histogram in self._histograms.items():
+                histograms[name] = Histogram(growth=histogram.growth)
+                histograms[name].merge(histogram)
+            return histograms
 
     def clear_metrics(self) -> None:
         """Clear all metrics from the store.
@@ -110,3 +189,4 @@ class MemoryMetricsStore(MetricsStore):
             None
         """
         self._metrics = {}
+        self._histograms = {}
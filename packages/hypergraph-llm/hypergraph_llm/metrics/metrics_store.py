@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
     from hypergraph_llm.metrics.metrics_writer import MetricsWriter
     from hypergraph_llm.types import Metrics
 
@@ -59,6 +60,37 @@ class MetricsStore(ABC):
         """
         raise NotImplementedError
 
+    def set_metrics(self, *, metrics: "Metrics") -> None:
+        """Set metrics to the given values instead of adding to them.
+
+        Used for gauges, such as the current concurrency limit of an adaptive
+        rate limiter. Stores that do not track gauges ignore them.
+
+        Args
+        ----
+            metrics: Metrics
+                The metrics to set in the store.
+
+        Returns
+        -------
+            None
+        """
+        return
+
+    def get_histograms(self) -> dict[str, "Histogram"]:
+        """Get the distributions of the metrics tracked as histograms.
+
+        Stores that track histograms record every value of a histogram metric
+        passed to `update_metrics` in addition to adding it to its total.
+        Stores that do not track histograms return an empty dictionary.
+
+        Returns
+        -------
+            dict[str, Histogram]:
+                The histogram of each histogram metric with recorded values.
+        """
+        return {}
+
     @abstractmethod
     def get_metrics(self) -> "Metrics":
         """Get all metrics from the store.
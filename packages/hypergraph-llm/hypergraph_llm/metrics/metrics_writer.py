@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
+    from hypergraph_llm.metrics.metrics_store import MetricsStore
     from hypergraph_llm.types import Metrics
 
 
@@ -18,8 +20,28 @@ class MetricsWriter(ABC):
         """Initialize MetricsWriter."""
         raise NotImplementedError
 
+    def add_metrics_store(self, metrics_store: "MetricsStore") -> None:
+        """Register a metrics store using this writer.
+
+        Called when the store is created, so writers can report its metrics
+        before they are written at exit. Writers that only write at exit
+        ignore it.
+
+        Args
+        ----
+            metrics_store : MetricsStore
+                The metrics store using this writer.
+        """
+        return
+
     @abstractmethod
-    def write_metrics(self, *, id: str, metrics: "Metrics") -> None:
+    def write_metrics(
+        self,
+        *,
+        id: str,
+        metrics: "Metrics",
+        histograms: dict[str, "Histogram"] | None = None,
+    ) -> None:
         """Write the given metrics.
 
         Args
@@ -28,5 +50,8 @@ class MetricsWriter(ABC):
                 The identifier for the metrics.
             metrics : Metrics
                 The metrics data to write.
+            histograms : dict[str, Histogram] | None
+                The distributions of the histogram metrics, if any. Their
+                percentiles are already part of `metrics`.
         """
         raise NotImplementedError
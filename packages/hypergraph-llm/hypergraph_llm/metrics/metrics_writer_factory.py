@@ -84,6 +84,16 @@ def create_metrics_writer(metrics_config: "MetricsConfig") -> MetricsWriter:
                     initializer=FileMetricsWriter,
                     scope="singleton",
                 )
+            case MetricsWriterType.OpenMetrics:
+                from hypergraph_llm.metrics.openmetrics_metrics_writer import (
+                    OpenMetricsMetricsWriter,
+                )
+
+                metrics_writer_factory.register(
+                    strategy=MetricsWriterType.OpenMetrics,
+                    initializer=OpenMetricsMetricsWriter,
+                    scope="singleton",
+                )
             case _:
                 msg = f"MetricsConfig.writer '{strategy}' is not registered in the MetricsWriterFactory. Registered strategies: {', '.join(metrics_writer_factory.keys())}"
                 raise ValueError(msg)
@@ -0,0 +1,340 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Export metrics in the Prometheus text exposition format."""
+
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
+    from hypergraph_llm.metrics.metrics_store import MetricsStore
+
+logger = logging.getLogger(__name__)
+
+MetricType = Literal["counter", "gauge", "histogram"]
+
+Sample = tuple[str, dict[str, str], float]
+"""A sample of a metric family: the sample name suffix, its labels and value."""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format."""
+
+_llm_prefix = "hypergraph_llm_"
+_gauge_metrics = {
+    "failure_rate",
+    "retry_rate",
+    "cache_hit_rate",
+    "tokens_per_response",
+    "cost_per_response",
+    "compute_duration_per_response_seconds",
+    "concurrency_limit",
+    "in_flight_requests",
+}
+_percentile_pattern = re.compile(r"_(p\d+|max)$")
+_invalid_name_characters = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class MetricFamily:
+    """Samples of one metric, ready to be rendered."""
+
+    name: str
+    type: MetricType
+    help: str
+    samples: list[Sample]
+
+    def __init__(self, name: str, metric_type: MetricType, help_text: str = "") -> None:
+        """Initialize MetricFamily.
+
+        Args
+        ----
+            name: str
+                The name of the metric. Counter names should end in `_total`.
+            metric_type: "counter" | "gauge" | "histogram"
+                The type of the metric.
+            help_text: str (default="")
+                The description of the metric.
+        """
+        self.name = metric_name(name)
+        self.type = metric_type
+        self.help = help_text
+        self.samples = []
+
+    def add(self, labels: dict[str, str], value: float, suffix: str = "") -> None:
+        """Add a sample, with a suffix such as `_bucket` for histogram samples."""
+        self.samples.append((suffix, labels, value))
+
+    def add_histogram(self, labels: dict[str, str], histogram: "Histogram") -> None:
+        """Add the cumulative buckets, sum and count of a histogram."""
+        cumulative = 0
+        for upper_bound, count in histogram.buckets():
+            cumulative += count
+            self.add(
+                {**labels, "le": _format_value(upper_bound)}, cumulative, "_bucket"
+            )
+        self.add({**labels, "le": "+Inf"}, histogram.count, "_bucket")
+        self.add(labels, histogram.sum, "_sum")
+        self.add(labels, histogram.count, "_count")
+
+    def render(self) -> str:
+        """Render the family in the text exposition format."""
+        lines = []
+        if self.help:
+            lines.append(f"# HELP {self.name} {_escape_help(self.help)}")
+        lines.append(f"# TYPE {self.name} {self.type}")
+        for suffix, labels, value in self.samples:
+            label_text = ",".join(
+                f'{key}="{_escape_label(value)}"' for key, value in labels.items()
+            )
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}{suffix}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+Collector = Callable[[], list[MetricFamily]]
+"""A function returning the current value of some metrics."""
+
+
+class OpenMetricsExporter:
+    """Serve the metrics of the process for Prometheus, live.
+
+    The exporter renders the metrics of every registered metrics store, with
+    the store ID as the `model` label, and of every registered collector, each
+    time they are scraped. Histogram metrics are exported with their buckets,
+    so Prometheus can compute any quantile with `histogram_quantile`.
+
+    Metrics can be served over HTTP from a background thread with `serve`, or
+    written periodically to a `.prom` file read by the textfile collector of
+    node exporter with `start_textfile`.
+    """
+
+    _instance: ClassVar["Self | None"] = None
+    _lock: threading.Lock
+    _metrics_stores: list["MetricsStore"]
+    _collectors: dict[str, Collector]
+    _servers: dict[tuple[str, int], ThreadingHTTPServer]
+    _textfiles: dict[Path, threading.Event]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        """Create a new instance of OpenMetricsExporter if it does not exist."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            self._initialized = True
+            self._lock = threading.Lock()
+            self._metrics_stores = []
+            self._collectors = {}
+            self._servers = {}
+            self._textfiles = {}
+
+    def add_metrics_store(self, metrics_store: "MetricsStore") -> None:
+        """Export the metrics of a metrics store."""
+        with self._lock:
+            if metrics_store not in self._metrics_stores:
+                self._metrics_stores.append(metrics_store)
+
+    def register(self, name: str, collector: Collector) -> None:
+        """Register a collector, replacing any collector with the same name.
+
+        Args
+        ----
+            name: str
+                The name of the collector.
+            collector: Collector
+                A function returning the metric families to export. It is
+                called from the exporting thread on every scrape.
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def clear(self) -> None:
+        """Forget all metrics stores and collectors."""
+        with self._lock:
+            self._metrics_stores.clear()
+            self._collectors.clear()
+
+    def render(self) -> str:
+        """Render all exported metrics in the text exposition format."""
+        with self._lock:
+            metrics_stores = list(self._metrics_stores)
+            collectors = list(self._collectors.values())
+
+        families = _metrics_store_families(metrics_stores)
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception:
+                logger.exception("Metrics collector failed")
+        return "".join(family.render() for family in families)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """Serve the metrics over HTTP from a daemon thread.
+
+        Serving the same address twice reuses the running server.
+
+        Args
+        ----
+            port: int
+                The port to listen on. 0 picks a free port.
+            host: str (default="127.0.0.1")
+                The address to listen on.
+
+        Returns
+        -------
+            int: The port the server listens on.
+        """
+        with self._lock:
+            server = self._servers.get((host, port))
+            if server is None:
+                server = ThreadingHTTPServer((host, port), _handler(self))
+                server.daemon_threads = True
+                threading.Thread(
+                    target=server.serve_forever,
+                    name=f"openmetrics-{host}:{server.server_port}",
+                    daemon=True,
+                ).start()
+                self._servers[host, port] = server
+                logger.info(
+                    "Serving metrics on http://%s:%d/metrics", host, server.server_port
+                )
+        return server.server_port
+
+    def write_textfile(self, path: str | Path) -> None:
+        """Write the metrics to a file, atomically replacing it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = self.render()
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def start_textfile(self, path: str | Path, interval: float) -> None:
+        """Write the metrics to a file every `interval` seconds from a daemon thread.
+
+        Starting the same file twice reuses the running thread.
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            if path in self._textfiles:
+                return
+            stopped = self._textfiles[path] = threading.Event()
+
+        def _run() -> None:
+            while not stopped.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except Exception:
+                    logger.exception("Failed to write metrics to %s", path)
+
+        threading.Thread(
+            target=_run, name=f"openmetrics-{path.name}", daemon=True
+        ).start()
+
+    def shutdown(self) -> None:
+        """Stop all servers and textfile threads."""
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+            for stopped in self._textfiles.values():
+                stopped.set()
+            self._textfiles.clear()
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def metric_name(name: str) -> str:
+    """Replace the characters not allowed in metric names."""
+    return _invalid_name_characters.sub("_", name)
+
+
+def _metrics_store_families(metrics_stores: list["MetricsStore"]) -> list[MetricFamily]:
+    """Group the metrics of the stores into families, labelled by store ID."""
+    families: dict[str, MetricFamily] = {}
+
+    def _family(name: str, metric_type: MetricType) -> MetricFamily:
+        if name not in families:
+            families[name] = MetricFamily(name, metric_type)
+        return families[name]
+
+    for metrics_store in metrics_stores:
+        labels = {"model": metrics_store.id}
+        try:
+            histograms = metrics_store.get_histograms()
+            metrics = metrics_store.get_metrics()
+        except Exception:
+            logger.exception("Metrics store %s failed", metrics_store.id)
+            continue
+        for name, value in metrics.items():
+            if name in histograms:
+                continue
+            if name in _gauge_metrics or (
+                _percentile_pattern.search(name)
+                and _percentile_pattern.sub("", name) in histograms
+            ):
+                _family(f"{_llm_prefix}{name}", "gauge").add(labels, value)
+            else:
+                _family(f"{_llm_prefix}{name}_total", "counter").add(labels, value)
+        for name, histogram in histograms.items():
+            _family(f"{_llm_prefix}{name}", "histogram").add_histogram(
+                labels, histogram
+            )
+    return list(families.values())
+
+
+def _handler(exporter: OpenMetricsExporter) -> type[BaseHTTPRequestHandler]:
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = exporter.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            logger.debug(format, *args)
+
+    return _MetricsHandler
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+openmetrics_exporter = OpenMetricsExporter()
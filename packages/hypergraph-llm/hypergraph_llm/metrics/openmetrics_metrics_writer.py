@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""OpenMetrics metrics writer implementation."""
+
+from typing import TYPE_CHECKING, Any
+
+from hypergraph_llm.metrics.metrics_writer import MetricsWriter
+from hypergraph_llm.metrics.openmetrics_exporter import openmetrics_exporter
+
+if TYPE_CHECKING:
+    from hypergraph_llm.metrics.histogram import Histogram
+    from hypergraph_llm.metrics.metrics_store import MetricsStore
+    from hypergraph_llm.types import Metrics
+
+_default_textfile_interval = 15.0
+
+
+class OpenMetricsMetricsWriter(MetricsWriter):
+    """Export metrics for Prometheus while the process runs.
+
+    The metrics stores using this writer are exported by the process-wide
+    `openmetrics_exporter`, served over HTTP, written periodically to a
+    textfile, or both. The textfile is written one last time when the
+    metrics are written at exit.
+    """
+
+    _textfile_path: str | None
+
+    def __init__(
+        self,
+        *,
+        openmetrics_port: int | None = None,
+        openmetrics_host: str | None = None,
+        textfile_path: str | None = None,
+        textfile_interval: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize OpenMetricsMetricsWriter.
+
+        Args
+        ----
+            openmetrics_port: int | None (default=None)
+                The port to serve the metrics on at `/metrics`. 0 picks a free
+                port. If None, metrics are not served over HTTP.
+            openmetrics_host: str | None (default="127.0.0.1")
+                The address to serve the metrics on.
+            textfile_path: str | None (default=None)
+                The file to write the metrics to, for the textfile collector of
+                node exporter. Must end in `.prom` to be picked up. If None,
+                no textfile is written.
+            textfile_interval: float | None (default=15.0)
+                The seconds between two writes of the textfile.
+        """
+        self._textfile_path = textfile_path
+        if openmetrics_port is not None:
+            openmetrics_exporter.serve(
+                openmetrics_port, host=openmetrics_host or "127.0.0.1"
+            )
+        if textfile_path is not None:
+            openmetrics_exporter.start_textfile(
+                textfile_path, textfile_interval or _default_textfile_interval
+            )
+
+    def add_metrics_store(self, metrics_store: "MetricsStore") -> None:
+        """Export the metrics of the store while the process runs."""
+        openmetrics_exporter.add_metrics_store(metrics_store)
+
+    def write_metrics(
+        self,
+        *,
+        id: str,
+        metrics: "Metrics",
+        histograms: dict[str, "Histogram"] | None = None,
+    ) -> None:
+        """Write the final metrics to the textfile, if any."""
+        if self._textfile_path is not None:
+            openmetrics_exporter.write_textfile(self._textfile_path)
@@ -4,9 +4,23 @@
 """Cache middleware."""
 
 import asyncio
+import contextlib
+import json
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any, Literal
 
-from hypergraph_llm.types import LLMCompletionResponse, LLMEmbeddingResponse
+from hypergraph_common.hasher import canonical_json
+
+from hypergraph_llm.cache import get_cache_key_parameters
+from hypergraph_llm.types import (
+    LLMCompletionResponse,
+    LLMEmbedding,
+    LLMEmbeddingResponse,
+    LLMEmbeddingUsage,
+)
 
 if TYPE_CHECKING:
     from hypergraph_cache import Cache, CacheKeyCreator
@@ -17,6 +31,9 @@ if TYPE_CHECKING:
         Metrics,
     )
 
+# The outcome of an in-flight request: its cache value, or the error it raised.
+_Flight = tuple[dict[str, Any] | None, Exception | None]
+
 
 def with_cache(
     *,
@@ -25,12 +42,21 @@ def with_cache(
     request_type: Literal["chat", "embedding"],
     cache: "Cache",
     cache_key_creator: "CacheKeyCreator",
+    record_parameters: bool = False,
 ) -> tuple[
     "LLMFunction",
     "AsyncLLMFunction",
 ]:
     """Wrap model functions with cache middleware.
 
+    Identical requests that are in flight at the same time are coalesced: the
+    first one calls the model and the others wait for its response instead of
+    missing the cache and calling the model themselves.
+
+    Embeddings are cached per input text: only the texts missing from the
+    cache are sent to the model, in a single request, and the response
+    combines cached and new embeddings in the order of the input.
+
     Args
     ----
         sync_middleware: LLMFunction
@@ -45,6 +71,9 @@ def with_cache(
             The type of request, either "chat" or "embedding".
         cache_key_creator: CacheKeyCreator
             The cache key creator to use.
+        record_parameters: bool (default=False)
+            Record the cache key parameters of each request in its cache
+            entry, so the cache can be re-keyed by `migrate_cache`.
 
     Returns
     -------
@@ -52,58 +81,214 @@ def with_cache(
             The synchronous and asynchronous model functions with caching.
 
     """
+    lock = threading.Lock()
+    flights: dict[str, Future[_Flight]] = {}
+    async_flights: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, asyncio.Future[_Flight]]
+    ] = weakref.WeakKeyDictionary()
 
-    def _cache_middleware(
-        **kwargs: Any,
-    ):
-        is_streaming = kwargs.get("stream") or False
-        is_mocked = kwargs.get("mock_response") or False
-        metrics: Metrics | None = kwargs.get("metrics")
-
-        if is_streaming or is_mocked:
-            # don't cache streaming or mocked responses
-            return sync_middleware(**kwargs)
-
-        cache_key = cache_key_creator(kwargs)
-
-        event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(event_loop)
-        cached_response = event_loop.run_until_complete(cache.get(cache_key))
+    def _response_from_cache_value(
+        cache_value: Any,
+        metrics: "Metrics | None",
+        metric_name: str,
+    ) -> LLMCompletionResponse | LLMEmbeddingResponse | None:
         if (
-            cached_response is not None
-            and isinstance(cached_response, dict)
-            and "response" in cached_response
-            and cached_response["response"] is not None
-            and isinstance(cached_response["response"], dict)
+            cache_value is not None
+            and isinstance(cache_value, dict)
+            and "response" in cache_value
+            and cache_value["response"] is not None
+            and isinstance(cache_value["response"], dict)
         ):
             try:
                 if (
                     metrics is not None
-                    and "metrics" in cached_response
-                    and cached_response["metrics"] is not None
-                    and isinstance(cached_response["metrics"], dict)
+                    and "metrics" in cache_value
+                    and cache_value["metrics"] is not None
+                    and isinstance(cache_value["metrics"], dict)
                 ):
-                    metrics.update(cached_response["metrics"])
-                    metrics["cached_responses"] = 1
+                    metrics.update(cache_value["metrics"])
+                    metrics[metric_name] = 1
 
                 if request_type == "chat":
-                    return LLMCompletionResponse(**cached_response["response"])
-                return LLMEmbeddingResponse(**cached_response["response"])
+                    return LLMCompletionResponse(**cache_value["response"])
+                return LLMEmbeddingResponse(**cache_value["response"])
             except Exception:  # noqa: BLE001
                 # Try to retrieve value from cache but if it fails, continue
                 # to make the request.
                 ...
+        return None
 
-        response = sync_middleware(**kwargs)
-        cache_value = {
-            "response": response.model_dump(),  # type: ignore
-            "metrics": metrics if metrics is not None else {},
-        }
-        event_loop.run_until_complete(cache.set(cache_key, cache_value))
-        event_loop.close()
+    def _debug_data(kwargs: dict[str, Any]) -> dict[str, Any] | None:
+        if not record_parameters:
+            return None
+        # Record the request so the entry can be re-keyed by `migrate_cache`
+        parameters = get_cache_key_parameters(input_args=kwargs)
+        return {"parameters": json.loads(canonical_json(parameters))}
+
+    def _coalesced_response(flight: _Flight, metrics: "Metrics | None"):
+        cache_value, error = flight
+        if error is not None:
+            raise error
+        return _response_from_cache_value(cache_value, metrics, "coalesced_responses")
+
+    def _per_text_keys(kwargs: dict[str, Any]) -> list[str]:
+        return [
+            cache_key_creator({**kwargs, "input": [text]}) for text in kwargs["input"]
+        ]
+
+    def _cached_embeddings(
+        keys: list[str], cache_values: list[Any]
+    ) -> dict[str, list[float]]:
+        embeddings: dict[str, list[float]] = {}
+        for key, cache_value in zip(keys, cache_values, strict=True):
+            # Skip keys that are not cached, or entries that cannot be used
+            with contextlib.suppress(TypeError, KeyError, IndexError):
+                embeddings[key] = cache_value["embedding"]
+        return embeddings
+
+    def _per_text_cache_values(
+        keys: list[str], kwargs: dict[str, Any], cache_value: dict[str, Any]
+    ) -> list[tuple[str, dict[str, Any], dict[str, Any] | None]]:
+        """Split the cache value of a batch into one embedding entry per input text."""
+        data = sorted(cache_value["response"]["data"], key=lambda item: item["index"])
+        return [
+            (
+                key,
+                {"embedding": item["embedding"]},
+                _debug_data({**kwargs, "input": [text]}),
+            )
+            for key, text, item in zip(keys, kwargs["input"], data, strict=True)
+        ]
+
+    def _embedding_response_of(response: Any) -> LLMEmbeddingResponse:
+        if not isinstance(response, LLMEmbeddingResponse):
+            msg = f"Expected an embedding response, got {type(response).__name__}."
+            raise TypeError(msg)
         return response
 
-    async def _cache_middleware_async(
+    def _embedding_response(
+        keys: list[str],
+        embeddings: dict[str, list[float]],
+        response: LLMEmbeddingResponse | None,
+        kwargs: dict[str, Any],
+        metrics: "Metrics | None",
+    ) -> LLMEmbeddingResponse:
+        """Stitch cached and new embeddings back in the order of the input."""
+        hits = len(keys) - (0 if response is None else len(response.data))
+        if metrics is not None:
+            metrics["embedding_cache_hits"] = hits
+            metrics["embedding_cache_misses"] = len(keys) - hits
+            if response is None:
+                metrics["cached_responses"] = 1
+        return LLMEmbeddingResponse(
+            data=[
+                LLMEmbedding(embedding=embeddings[key], index=index, object="embedding")
+                for index, key in enumerate(keys)
+            ],
+            model=kwargs.get("model", "") if response is None else response.model,
+            object="list",
+            usage=(
+                LLMEmbeddingUsage(prompt_tokens=0, total_tokens=0)
+                if response is None
+                else response.usage
+            ),
+        )
+
+    def _request(
+        cache_key: str,
+        kwargs: dict[str, Any],
+        entries: Callable[
+            [dict[str, Any]], list[tuple[str, Any, dict[str, Any] | None]]
+        ],
+    ):
+        """Call the model, unless an identical request is in flight, and cache the response."""
+        metrics: Metrics | None = kwargs.get("metrics")
+        with lock:
+            flight = flights.get(cache_key)
+            is_first = flight is None
+            if flight is None:
+                flight = flights[cache_key] = Future()
+        if not is_first:
+            response = _coalesced_response(flight.result(), metrics)
+            if response is not None:
+                return response
+            return sync_middleware(**kwargs)
+
+        try:
+            response = sync_middleware(**kwargs)
+            cache_value = {
+                "response": response.model_dump(),  # type: ignore
+                "metrics": metrics if metrics is not None else {},
+            }
+            flight.set_result((
+                {**cache_value, "metrics": dict(cache_value["metrics"])},
+                None,
+            ))
+            for key, value, debug_data in entries(cache_value):
+                cache.set_sync(key, value, debug_data)
+        except BaseException as e:
+            if not flight.done():
+                # Waiting requests share the error, or make their own request
+                # if the first one was interrupted
+                flight.set_result((None, e if isinstance(e, Exception) else None))
+            raise
+        finally:
+            with lock:
+                flights.pop(cache_key, None)
+        return response
+
+    async def _request_async(
+        cache_key: str,
+        kwargs: dict[str, Any],
+        entries: Callable[
+            [dict[str, Any]], list[tuple[str, Any, dict[str, Any] | None]]
+        ],
+    ):
+        """Call the model, unless an identical request is in flight, and cache the response."""
+        metrics: Metrics | None = kwargs.get("metrics")
+        loop = asyncio.get_running_loop()
+        loop_flights = async_flights.setdefault(loop, {})
+        while (flight := loop_flights.get(cache_key)) is not None:
+            try:
+                # Shield the shared future so cancelling one waiter does not
+                # cancel the others
+                response = _coalesced_response(await asyncio.shield(flight), metrics)
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    # The first request was cancelled, take over from it
+                    continue
+                raise
+            if response is not None:
+                return response
+            return await async_middleware(**kwargs)
+
+        flight = loop_flights[cache_key] = loop.create_future()
+        try:
+            response = await async_middleware(**kwargs)
+            cache_value = {
+                "response": response.model_dump(),  # type: ignore
+                "metrics": metrics if metrics is not None else {},
+            }
+            flight.set_result((
+                {**cache_value, "metrics": dict(cache_value["metrics"])},
+                None,
+            ))
+            for key, value, debug_data in entries(cache_value):
+                await cache.set(key, value, debug_data)
+        except Exception as e:
+            if not flight.done():
+                flight.set_result((None, e))
+            raise
+        except BaseException:
+            # Waiting requests take over if the first one was cancelled
+            flight.cancel()
+            raise
+        finally:
+            if loop_flights.get(cache_key) is flight:
+                del loop_flights[cache_key]
+        return response
+
+    def _cache_middleware(
         **kwargs: Any,
     ):
         is_streaming = kwargs.get("stream") or False
@@ -112,42 +297,108 @@ def with_cache(
 
         if is_streaming or is_mocked:
             # don't cache streaming or mocked responses
-            return await async_middleware(**kwargs)
+            return sync_middleware(**kwargs)
+
+        if request_type == "embedding" and isinstance(kwargs.get("input"), list):
+            # Cache embeddings per text, and only embed the texts not cached
+            keys = _per_text_keys(kwargs)
+            unique_keys = list(dict.fromkeys(keys))
+            embeddings = _cached_embeddings(
+                unique_keys, [cache.get_sync(key) for key in unique_keys]
+            )
+            misses = {
+                key: text
+                for key, text in zip(keys, kwargs["input"], strict=True)
+                if key not in embeddings
+            }
+            response = None
+            if misses:
+                miss_kwargs = {**kwargs, "input": list(misses.values())}
+                miss_keys = list(misses)
+                response = _embedding_response_of(
+                    _request(
+                        cache_key_creator(miss_kwargs),
+                        miss_kwargs,
+                        lambda value: _per_text_cache_values(
+                            miss_keys, miss_kwargs, value
+                        ),
+                    )
+                )
+                for key, item in zip(
+                    miss_keys,
+                    sorted(response.data, key=lambda item: item.index),
+                    strict=True,
+                ):
+                    embeddings[key] = item.embedding
+            return _embedding_response(keys, embeddings, response, kwargs, metrics)
 
         cache_key = cache_key_creator(kwargs)
 
-        cached_response = await cache.get(cache_key)
-        if (
-            cached_response is not None
-            and isinstance(cached_response, dict)
-            and "response" in cached_response
-            and cached_response["response"] is not None
-            and isinstance(cached_response["response"], dict)
-        ):
-            try:
-                if (
-                    metrics is not None
-                    and "metrics" in cached_response
-                    and cached_response["metrics"] is not None
-                    and isinstance(cached_response["metrics"], dict)
+        cached_response = _response_from_cache_value(
+            cache.get_sync(cache_key), metrics, "cached_responses"
+        )
+        if cached_response is not None:
+            return cached_response
+
+        return _request(
+            cache_key, kwargs, lambda value: [(cache_key, value, _debug_data(kwargs))]
+        )
+
+    async def _cache_middleware_async(
+        **kwargs: Any,
+    ):
+        is_streaming = kwargs.get("stream") or False
+        is_mocked = kwargs.get("mock_response") or False
+        metrics: Metrics | None = kwargs.get("metrics")
+
+        if is_streaming or is_mocked:
+            # don't cache streaming or mocked responses
+            return await async_middleware(**kwargs)
+
+        if request_type == "embedding" and isinstance(kwargs.get("input"), list):
+            # Cache embeddings per text, and only embed the texts not cached
+            keys = _per_text_keys(kwargs)
+            unique_keys = list(dict.fromkeys(keys))
+            embeddings = _cached_embeddings(
+                unique_keys,
+                await asyncio.gather(*[cache.get(key) for key in unique_keys]),
+            )
+            misses = {
+                key: text
+                for key, text in zip(keys, kwargs["input"], strict=True)
+                if key not in embeddings
+            }
+            response = None
+            if misses:
+                miss_kwargs = {**kwargs, "input": list(misses.values())}
+                miss_keys = list(misses)
+                response = _embedding_response_of(
+                    await _request_async(
+                        cache_key_creator(miss_kwargs),
+                        miss_kwargs,
+                        lambda value: _per_text_cache_values(
+                            miss_keys, miss_kwargs, value
+                        ),
+                    )
+                )
+                for key, item in zip(
+                    miss_keys,
+                    sorted(response.data, key=lambda item: item.index),
+                    strict=True,
                 ):
-                    metrics.update(cached_response["metrics"])
-                    metrics["cached_responses"] = 1
+                    embeddings[key] = item.embedding
+            return _embedding_response(keys, embeddings, response, kwargs, metrics)
 
-                if request_type == "chat":
-                    return LLMCompletionResponse(**cached_response["response"])
-                return LLMEmbeddingResponse(**cached_response["response"])
-            except Exception:  # noqa: BLE001
-                # Try to retrieve value from cache but if it fails, continue
-                # to make the request.
-                ...
+        cache_key = cache_key_creator(kwargs)
 
-        response = await async_middleware(**kwargs)
-        cache_value = {
-            "response": response.model_dump(),  # type: ignore
-            "metrics": metrics if metrics is not None else {},
-        }
-        await cache.set(cache_key, cache_value)
-        return response
+        cached_response = _response_from_cache_value(
+            await cache.get(cache_key), metrics, "cached_responses"
+        )
+        if cached_response is not None:
+            return cached_response
+
+        return await _request_async(
+            cache_key, kwargs, lambda value: [(cache_key, value, _debug_data(kwargs))]
+        )
 
     return (_cache_middleware, _cache_middleware_async)  # type: ignore
@@ -4,13 +4,15 @@
 """Metrics middleware to process metrics using a MetricsProcessor."""
 
 import time
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from hypergraph_llm.config import ModelConfig
-    from hypergraph_llm.metrics import MetricsProcessor
+    from hypergraph_llm.metrics import MetricsProcessor, MetricsStore
     from hypergraph_llm.types import (
         AsyncLLMFunction,
+        LLMCompletionChunk,
         LLMFunction,
         Metrics,
     )
@@ -22,6 +24,7 @@ def with_metrics(
     sync_middleware: "LLMFunction",
     async_middleware: "AsyncLLMFunction",
     metrics_processor: "MetricsProcessor",
+    metrics_store: "MetricsStore | None" = None,
 ) -> tuple[
     "LLMFunction",
     "AsyncLLMFunction",
@@ -40,6 +43,11 @@ def with_metrics(
             Either a completion function or an embedding function.
         metrics_processor: MetricsProcessor
             The metrics processor to use.
+        metrics_store: MetricsStore | None (default=None)
+            The metrics store to record `time_to_first_token_seconds` in.
+            Streaming responses are consumed after their request metrics are
+            stored, so the time to their first chunk is recorded directly.
+            If None, the time to first token is not recorded.
 
     Returns
     -------
@@ -52,9 +60,9 @@ def with_metrics(
         **kwargs: Any,
     ):
         metrics: Metrics | None = kwargs.get("metrics")
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = sync_middleware(**kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         if metrics is not None:
             metrics_processor.process_metrics(
@@ -64,8 +72,9 @@ def with_metrics(
                 response=response,
             )
             if kwargs.get("stream"):
-                metrics["compute_duration_seconds"] = 0
                 metrics["streaming_responses"] = 1
+                if metrics_store is not None and isinstance(response, Iterator):
+                    response = _time_first_chunk(response, start_time, metrics_store)
             else:
                 metrics["compute_duration_seconds"] = end_time - start_time
                 metrics["streaming_responses"] = 0
@@ -76,9 +85,9 @@ def with_metrics(
     ):
         metrics: Metrics | None = kwargs.get("metrics")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await async_middleware(**kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         if metrics is not None:
             metrics_processor.process_metrics(
@@ -88,11 +97,50 @@ def with_metrics(
                 response=response,
             )
             if kwargs.get("stream"):
-                metrics["compute_duration_seconds"] = 0
                 metrics["streaming_responses"] = 1
+                if metrics_store is not None and isinstance(response, AsyncIterator):
+                    response = _time_first_chunk_async(
+                        response, start_time, metrics_store
+                    )
             else:
                 metrics["compute_duration_seconds"] = end_time - start_time
                 metrics["streaming_responses"] = 0
         return response
 
     return (_metrics_middleware, _metrics_middleware_async)  # type: ignore
+
+
+def _time_first_chunk(
+    response: "Iterator[LLMCompletionChunk]",
+    start_time: float,
+    metrics_store: "MetricsStore",
+) -> "Iterator[LLMCompletionChunk]":
+    """Yield the chunks of a streaming response, recording when the first arrives."""
+    first = True
+    for chunk in response:
+        if first:
+            first = False
+            metrics_store.update_metrics(
+                metrics={
+                    "time_to_first_token_seconds": time.perf_counter() - start_time
+                }
+            )
+        yield chunk
+
+
+async def _time_first_chunk_async(
+    response: "AsyncIterator[LLMCompletionChunk]",
+    start_time: float,
+    metrics_store: "MetricsStore",
+) -> "AsyncIterator[LLMCompletionChunk]":
+    """Yield the chunks of a streaming response, recording when the first arrives."""
+    first = True
+    async for chunk in response:
+        if first:
+            first = False
+            metrics_store.update_metrics(
+                metrics={
+                    "time_to_first_token_seconds": time.perf_counter() - start_time
+                }
+            )
+        yield chunk
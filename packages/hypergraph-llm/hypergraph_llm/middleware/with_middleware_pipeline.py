@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from hypergraph_cache import Cache, CacheKeyCreator
 
     from hypergraph_llm.config import ModelConfig
-    from hypergraph_llm.metrics import MetricsProcessor
+    from hypergraph_llm.metrics import MetricsProcessor, MetricsStore
     from hypergraph_llm.rate_limit import RateLimiter
     from hypergraph_llm.retry import Retry
     from hypergraph_llm.tokenizer import Tokenizer
@@ -39,6 +39,7 @@ def with_middleware_pipeline(
     tokenizer: "Tokenizer",
     rate_limiter: "RateLimiter | None",
     retrier: "Retry | None",
+    metrics_store: "MetricsStore | None" = None,
 ) -> tuple[
     "LLMFunction",
     "AsyncLLMFunction",
@@ -88,6 +89,9 @@ def with_middleware_pipeline(
             The rate limiter to use. If None, rate limiting middleware is skipped.
         retrier: Retry | None
             The retrier to use. If None, retry middleware is skipped.
+        metrics_store: MetricsStore | None (default=None)
+            The metrics store of the model, used by the metrics middleware to
+            record the time to first token of streaming responses.
 
     Returns
     -------
@@ -114,6 +118,7 @@ def with_middleware_pipeline(
             sync_middleware=model_fn,
             async_middleware=async_model_fn,
             metrics_processor=metrics_processor,
+            metrics_store=metrics_store,
         )
 
     if rate_limiter:
@@ -138,6 +143,7 @@ def with_middleware_pipeline(
             request_type=request_type,
             cache=cache,
             cache_key_creator=cache_key_creator,
+            record_parameters=model_config.cache_parameters,
         )
 
     if metrics_processor:
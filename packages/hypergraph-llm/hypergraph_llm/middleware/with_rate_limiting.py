@@ -3,14 +3,19 @@
 
 """Rate limit middleware."""
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
+from hypergraph_llm.rate_limit.async_rate_limiter import AsyncRateLimiter
+
 if TYPE_CHECKING:
     from hypergraph_llm.rate_limit import RateLimiter
     from hypergraph_llm.tokenizer import Tokenizer
     from hypergraph_llm.types import (
         AsyncLLMFunction,
         LLMFunction,
+        Metrics,
     )
 
 
@@ -35,10 +40,16 @@ def with_rate_limiting(
             The asynchronous model function to wrap.
             Either a completion function or an embedding function.
         rate_limiter: RateLimiter
-            The rate limiter to use.
+            The rate limiter to use. The asynchronous middleware awaits
+            `AsyncRateLimiter.acquire_async` when the rate limiter implements it,
+            and otherwise waits for the synchronous limiter in a worker thread,
+            so the event loop is never blocked.
         tokenizer: Tokenizer
             The tokenizer to use for counting tokens.
 
+    The time a request waits for the rate limiter is added to its
+    `rate_limit_wait_seconds` metric, once per attempt.
+
     Returns
     -------
         tuple[LLMFunction, AsyncLLMFunction]
@@ -55,10 +66,14 @@ def with_rate_limiting(
         input: list[str] | None = kwargs.get("input")  # embedding call
         if messages:
             token_count += tokenizer.num_prompt_tokens(messages=messages)
+        elif isinstance(input, str):
+            token_count += tokenizer.num_tokens(input)
         elif input:
-            token_count += sum(tokenizer.num_tokens(text) for text in input)
+            token_count += sum(tokenizer.num_tokens_batch(input))
 
+        start_time = time.perf_counter()
         with rate_limiter.acquire(token_count):
+            _record_wait(kwargs.get("metrics"), start_time)
             return sync_middleware(**kwargs)
 
     async def _rate_limit_middleware_async(
@@ -71,9 +86,33 @@ def with_rate_limiting(
         input = kwargs.get("input")  # embedding call
         if messages:
             token_count += tokenizer.num_prompt_tokens(messages=messages)
+        elif isinstance(input, str):
+            token_count += tokenizer.num_tokens(input)
         elif input:
-            token_count += sum(tokenizer.num_tokens(text) for text in input)
-        with rate_limiter.acquire(token_count):
+            token_count += sum(tokenizer.num_tokens_batch(input))
+
+        start_time = time.perf_counter()
+        if isinstance(rate_limiter, AsyncRateLimiter):
+            async with rate_limiter.acquire_async(token_count):
+                _record_wait(kwargs.get("metrics"), start_time)
+                return await async_middleware(**kwargs)
+
+        acquired = rate_limiter.acquire(token_count)
+        await asyncio.to_thread(acquired.__enter__)
+        _record_wait(kwargs.get("metrics"), start_time)
+        try:
             return await async_middleware(**kwargs)
+        finally:
+            acquired.__exit__(None, None, None)
 
     return (_rate_limit_middleware, _rate_limit_middleware_async)  # type: ignore
+
+
+def _record_wait(metrics: "Metrics | None", start_time: float) -> None:
+    """Add the time since `start_time` to the rate limit wait of a request."""
+    if metrics is not None:
+        metrics["rate_limit_wait_seconds"] = (
+            metrics.get("rate_limit_wait_seconds", 0.0)
+            + time.perf_counter()
+            - start_time
+        )
@@ -3,6 +3,7 @@
 
 """Rate limit module for hypergraph-llm."""
 
+from hypergraph_llm.rate_limit.async_rate_limiter import AsyncRateLimiter
 from hypergraph_llm.rate_limit.rate_limit_factory import (
     create_rate_limiter,
     register_rate_limiter,
@@ -10,6 +11,7 @@ from hypergraph_llm.rate_limit.rate_limit_factory import (
 from hypergraph_llm.rate_limit.rate_limiter import RateLimiter
 
 __all__ = [
+    "AsyncRateLimiter",
     "RateLimiter",
     "create_rate_limiter",
     "register_rate_limiter",
@@ -0,0 +1,289 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive (AIMD) concurrency limiter."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from hypergraph_llm.rate_limit.async_rate_limiter import AsyncRateLimiter
+from hypergraph_llm.rate_limit.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from hypergraph_llm.metrics.metrics_store import MetricsStore
+
+logger = logging.getLogger(__name__)
+
+_default_rate_limit_exceptions = ["RateLimitError"]
+_latency_smoothing = 0.1
+_baseline_drift = 0.01
+
+
+@dataclass
+class _Waiter:
+    """A request waiting for a free slot, either a thread or a coroutine."""
+
+    event: threading.Event | None = None
+    future: "asyncio.Future[None] | None" = None
+    loop: asyncio.AbstractEventLoop | None = None
+    granted: bool = False
+
+
+class AdaptiveRateLimiter(RateLimiter, AsyncRateLimiter):
+    """Limit in-flight requests with additive increase, multiplicative decrease.
+
+    Every successful request grows the limit by `additive_increase / limit`, so
+    the limit grows by about `additive_increase` per round of requests. A rate
+    limit error, or a smoothed latency per token above `latency_tolerance` times
+    its baseline, multiplies the limit by `multiplicative_decrease`. Signals
+    from requests started before the last decrease are ignored, so one burst of
+    429s only cuts the limit once.
+
+    Requests wait for a slot in FIFO order. Instances are shared per endpoint by
+    the rate limit factory, so every model instance calling the same endpoint
+    adapts the same limit.
+    """
+
+    _limit: float
+    _min_concurrency: int
+    _max_concurrency: int
+    _additive_increase: float
+    _multiplicative_decrease: float
+    _latency_tolerance: float | None
+    _rate_limit_exceptions: list[str]
+    _lock: threading.Lock
+    _in_flight: int
+    _waiters: deque[_Waiter]
+    _generation: int
+    _latency: float | None
+    _baseline: float | None
+    _metrics_stores: list["MetricsStore"]
+
+    def __init__(
+        self,
+        *,
+        initial_concurrency: int | None = None,
+        min_concurrency: int | None = None,
+        max_concurrency: int | None = None,
+        additive_increase: float | None = None,
+        multiplicative_decrease: float | None = None,
+        latency_tolerance: float | None = None,
+        rate_limit_exceptions: list[str] | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the Adaptive Rate Limiter.
+
+        Args
+        ----
+            initial_concurrency: int | None (default: 8)
+                The number of concurrent requests allowed before any feedback.
+            min_concurrency: int | None (default: 1)
+                The lower bound of the limit.
+            max_concurrency: int | None (default: 64)
+                The upper bound of the limit.
+            additive_increase: float | None (default: 1.0)
+                How much the limit grows per round of successful requests.
+            multiplicative_decrease: float | None (default: 0.5)
+                The factor applied to the limit on congestion.
+            latency_tolerance: float | None (default: None)
+                Treat a smoothed latency per token above this multiple of its
+                baseline as congestion. If None, only rate limit errors count.
+            rate_limit_exceptions: list[str] | None (default: ["RateLimitError"])
+                Names of the exception classes that signal a rate limit error,
+                in addition to any exception with a 429 status code.
+        """
+        self._min_concurrency = min_concurrency or 1
+        self._max_concurrency = max_concurrency or 64
+        self._limit = float(
+            min(
+                max(initial_concurrency or 8, self._min_concurrency),
+                self._max_concurrency,
+            )
+        )
+        self._additive_increase = additive_increase or 1.0
+        self._multiplicative_decrease = multiplicative_decrease or 0.5
+        self._latency_tolerance = latency_tolerance
+        self._rate_limit_exceptions = (
+            rate_limit_exceptions or _default_rate_limit_exceptions
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters = deque()
+        self._generation = 0
+        self._latency = None
+        self._baseline = None
+        self._metrics_stores = []
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    def add_metrics_store(self, metrics_store: "MetricsStore") -> None:
+        """Export the current limit to a metrics store as `concurrency_limit`."""
+        with self._lock:
+            if metrics_store not in self._metrics_stores:
+                self._metrics_stores.append(metrics_store)
+            metrics_store.set_metrics(metrics={"concurrency_limit": self.limit})
+
+    @contextmanager
+    def acquire(self, token_count: int) -> Iterator[None]:
+        """
+        Acquire a slot, blocking the calling thread until one is free.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        waiter = None
+        with self._lock:
+            if not self._try_enter():
+                waiter = _Waiter(event=threading.Event())
+                self._waiters.append(waiter)
+        if waiter is not None and waiter.event is not None:
+            waiter.event.wait()
+
+        with self._track(token_count):
+            yield
+
+    @asynccontextmanager
+    async def acquire_async(self, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire a slot without blocking the event loop.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        waiter = None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._try_enter():
+                waiter = _Waiter(future=loop.create_future(), loop=loop)
+                self._waiters.append(waiter)
+        if waiter is not None and waiter.future is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter.granted:
+                        self._in_flight -= 1
+                        self._wake()
+                    else:
+                        self._waiters.remove(waiter)
+                raise
+
+        with self._track(token_count):
+            yield
+
+    @contextmanager
+    def _track(self, token_count: int) -> Iterator[None]:
+        """Release the slot of a request and adapt the limit to its outcome."""
+        generation = self._generation
+        start_time = time.monotonic()
+        error: BaseException | None = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            latency = (time.monotonic() - start_time) / max(token_count, 1)
+            with self._lock:
+                self._in_flight -= 1
+                if error is None:
+                    self._on_success(generation, latency)
+                elif self._is_rate_limit_error(error):
+                    self._on_congestion(generation, "rate limit error")
+                self._wake()
+
+    def _try_enter(self) -> bool:
+        """Take a free slot unless others are already waiting. Requires `_lock`."""
+        if self._waiters or self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in arrival order. Requires `_lock`."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._in_flight += 1
+            if waiter.event is not None:
+                waiter.event.set()
+            elif waiter.future is not None and waiter.loop is not None:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+
+    def _on_success(self, generation: int, latency: float) -> None:
+        """Grow the limit additively, unless latency signals congestion. Requires `_lock`."""
+        if self._latency_tolerance is not None:
+            self._latency = (
+                latency
+                if self._latency is None
+                else self._latency + _latency_smoothing * (latency - self._latency)
+            )
+            if self._baseline is None or self._latency < self._baseline:
+                self._baseline = self._latency
+            else:
+                # Let the baseline follow slow, lasting changes of the endpoint
+                self._baseline += _baseline_drift * (self._latency - self._baseline)
+            if self._latency > self._latency_tolerance * self._baseline:
+                self._on_congestion(generation, "rising latency")
+                return
+
+        limit = min(
+            self._limit + self._additive_increase / self._limit,
+            float(self._max_concurrency),
+        )
+        self._set_limit(limit)
+
+    def _on_congestion(self, generation: int, reason: str) -> None:
+        """Cut the limit multiplicatively, once per generation. Requires `_lock`."""
+        if generation < self._generation:
+            return
+        self._generation += 1
+        limit = max(
+            self._limit * self._multiplicative_decrease, float(self._min_concurrency)
+        )
+        logger.info(
+            "Reducing concurrency limit from %d to %d after %s",
+            self.limit,
+            int(limit),
+            reason,
+        )
+        self._set_limit(limit)
+
+    def _set_limit(self, limit: float) -> None:
+        """Set the limit and export it when its integer value changes. Requires `_lock`."""
+        previous = self.limit
+        self._limit = limit
+        if self.limit != previous:
+            for metrics_store in self._metrics_stores:
+                metrics_store.set_metrics(metrics={"concurrency_limit": self.limit})
+
+    def _is_rate_limit_error(self, error: BaseException) -> bool:
+        return (
+            error.__class__.__name__ in self._rate_limit_exceptions
+            or getattr(error, "status_code", None) == 429
+        )
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
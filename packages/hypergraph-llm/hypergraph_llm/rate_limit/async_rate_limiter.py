@@ -0,0 +1,31 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Async Rate Limiter."""
+
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+
+class AsyncRateLimiter(ABC):
+    """Abstract base class for rate limiters that can be awaited from an event loop.
+
+    Implementations must never block the event loop while waiting for capacity.
+    """
+
+    @abstractmethod
+    def acquire_async(self, token_count: int) -> AbstractAsyncContextManager[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Args
+        ----
+            token_count: int
+                The estimated number of prompt and response tokens for the current request.
+
+        Returns
+        -------
+            AbstractAsyncContextManager[None]:
+                A context manager held for the duration of the request.
+        """
+        raise NotImplementedError
@@ -49,6 +49,8 @@ def register_rate_limiter(
 
 def create_rate_limiter(
     rate_limit_config: "RateLimitConfig",
+    *,
+    endpoint: str | None = None,
 ) -> RateLimiter:
     """Create a RateLimiter instance.
 
@@ -56,6 +58,10 @@ def create_rate_limiter(
     ----
         rate_limit_config: RateLimitConfig
             The configuration for the rate limit strategy.
+        endpoint: str | None (default: None)
+            The endpoint the requests are sent to. Rate limiters registered
+            as singletons are shared by every model calling the same endpoint
+            with the same configuration.
 
     Returns
     -------
@@ -63,7 +69,7 @@ def create_rate_limiter(
             An instance of a RateLimiter subclass.
     """
     strategy = rate_limit_config.type
-    init_args = rate_limit_config.model_dump()
+    init_args = {**rate_limit_config.model_dump(), "endpoint": endpoint}
 
     if strategy not in rate_limit_factory:
         match strategy:
@@ -77,6 +83,17 @@ def create_rate_limiter(
                     rate_limiter_initializer=SlidingWindowRateLimiter,
                 )
 
+            case RateLimitType.Adaptive:
+                from hypergraph_llm.rate_limit.adaptive_rate_limiter import (
+                    AdaptiveRateLimiter,
+                )
+
+                register_rate_limiter(
+                    rate_limit_type=RateLimitType.Adaptive,
+                    rate_limiter_initializer=AdaptiveRateLimiter,
+                    scope="singleton",
+                )
+
             case _:
                 msg = f"RateLimitConfig.type '{strategy}' is not registered in the RateLimitFactory. Registered strategies: {', '.join(rate_limit_factory.keys())}"
                 raise ValueError(msg)
@@ -3,27 +3,38 @@
 
 """LiteLLM Static Rate Limiter."""
 
+import asyncio
 import threading
 import time
+import weakref
 from collections import deque
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
+from hypergraph_llm.rate_limit.async_rate_limiter import AsyncRateLimiter
 from hypergraph_llm.rate_limit.rate_limiter import RateLimiter
 
 
-class SlidingWindowRateLimiter(RateLimiter):
-    """Sliding Window Rate Limiter implementation."""
+class SlidingWindowRateLimiter(RateLimiter, AsyncRateLimiter):
+    """Sliding Window Rate Limiter implementation.
+
+    Instead of polling, every attempt to acquire either admits the request or
+    computes the exact time until enough capacity frees up, and the caller
+    sleeps for that long. Async callers wait in FIFO order without blocking
+    the event loop.
+    """
 
     _rpp: int | None = None
     _tpp: int | None = None
     _lock: threading.Lock
     _rate_queue: deque[float]
     _token_queue: deque[int]
+    _token_sum: int = 0
     _period_in_seconds: int
     _last_time: float | None = None
     _stagger: float = 0.0
+    _waiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]"
 
     def __init__(
         self,
@@ -55,8 +66,10 @@ class SlidingWindowRateLimiter(RateLimiter):
         self._lock = threading.Lock()
         self._rate_queue: deque[float] = deque()
         self._token_queue: deque[int] = deque()
+        self._token_sum = 0
         self._period_in_seconds = period_in_seconds
         self._last_time: float | None = None
+        self._waiters = weakref.WeakKeyDictionary()
 
         if self._rpp is not None and self._rpp > 0:
             self._stagger = self._period_in_seconds / self._rpp
@@ -76,68 +89,97 @@ class SlidingWindowRateLimiter(RateLimiter):
         """
         while True:
             with self._lock:
-                current_time = time.time()
-
-                # Use two sliding windows to keep track of requests and tokens per period
-                # Drop old requests and tokens out of the sliding windows
-                while (
-                    len(self._rate_queue) > 0
-                    and self._rate_queue[0] < current_time - self._period_in_seconds
-                ):
-                    self._rate_queue.popleft()
-                    self._token_queue.popleft()
-
-                # If sliding window still exceed request limit, wait again
-                # Waiting requires reacquiring the lock, allowing other threads
-                # to see if their request fits within the rate limiting windows
-                # Makes more sense for token limit than request limit
-                if (
-                    self._rpp is not None
-                    and self._rpp > 0
-                    and len(self._rate_queue) >= self._rpp
-                ):
-                    continue
-
-                # Check if current token window exceeds token limit
-                # If it does, wait again
-                # This does not account for the tokens from the current request
-                # This is intentional, as we want to allow the current request
-                # to be processed if it is larger than the tpm but smaller than context window.
-                # tpm is a rate/soft limit and not the hard limit of context window limits.
-                if (
-                    self._tpp is not None
-                    and self._tpp > 0
-                    and sum(self._token_queue) >= self._tpp
-                ):
-                    continue
-
-                # This check accounts for the current request token usage
-                # is within the token limits bound.
-                # If the current requests tokens exceeds the token limit,
-                # Then let it be processed.
-                if (
-                    self._tpp is not None
-                    and self._tpp > 0
-                    and token_count <= self._tpp
-                    and sum(self._token_queue) + token_count > self._tpp
-                ):
-                    continue
-
-                # If there was a previous call, check if we need to stagger
-                if (
-                    self._stagger > 0
-                    and (
-                        self._last_time  # is None if this is the first hit to the rate limiter
-                        and current_time - self._last_time
-                        < self._stagger  # If more time has passed than the stagger time, we can proceed
-                    )
-                ):
-                    time.sleep(self._stagger - (current_time - self._last_time))
-                    current_time = time.time()
-
-                # Add the current request to the sliding window
-                self._rate_queue.append(current_time)
-                self._token_queue.append(token_count)
-                self._last_time = current_time
+                wait = self._try_acquire(token_count, time.time())
+            if wait is None:
                 break
+            time.sleep(wait)
+        yield
+
+    @asynccontextmanager
+    async def acquire_async(self, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Waiters on the same event loop are admitted in the order they arrived;
+        only the head of the queue sleeps until capacity frees up.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        async with self._waiter_lock():
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(token_count, time.time())
+                if wait is None:
+                    break
+                await asyncio.sleep(wait)
         yield
+
+    def _waiter_lock(self) -> asyncio.Lock:
+        """Return the FIFO queue of async waiters on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._waiters.get(loop)
+            if lock is None:
+                lock = self._waiters[loop] = asyncio.Lock()
+        return lock
+
+    def _try_acquire(self, token_count: int, current_time: float) -> float | None:
+        """Admit the request and return None, or return the seconds to wait before trying again.
+
+        Must be called while holding `_lock`.
+        """
+        # Use two sliding windows to keep track of requests and tokens per period
+        # Drop old requests and tokens out of the sliding windows
+        window_start = current_time - self._period_in_seconds
+        while len(self._rate_queue) > 0 and self._rate_queue[0] < window_start:
+            self._rate_queue.popleft()
+            self._token_sum -= self._token_queue.popleft()
+
+        # If the sliding window still exceeds the request limit, wait until the
+        # oldest request leaves it
+        if (
+            self._rpp is not None
+            and self._rpp > 0
+            and len(self._rate_queue) >= self._rpp
+        ):
+            return self._rate_queue[-self._rpp] - window_start
+
+        # Wait until enough tokens leave the window. The current request only
+        # counts if it fits within the token limit on its own: tpm is a
+        # rate/soft limit and not the hard limit of context window limits, so
+        # a larger request is processed once the window is below the limit.
+        if self._tpp is not None and self._tpp > 0:
+            if token_count > self._tpp:
+                allowed = self._tpp - 1
+            else:
+                allowed = self._tpp - max(token_count, 1)
+            if self._token_sum > allowed:
+                return self._token_wait(allowed, window_start)
+
+        # If there was a previous call, check if we need to stagger
+        if self._stagger > 0 and self._last_time is not None:
+            elapsed = current_time - self._last_time
+            if elapsed < self._stagger:
+                return self._stagger - elapsed
+
+        # Add the current request to the sliding window
+        self._rate_queue.append(current_time)
+        self._token_queue.append(token_count)
+        self._token_sum += token_count
+        self._last_time = current_time
+        return None
+
+    def _token_wait(self, allowed: int, window_start: float) -> float:
+        """Return the seconds until the tokens in the window drop to `allowed` or below."""
+        remaining = self._token_sum
+        for timestamp, tokens in zip(self._rate_queue, self._token_queue, strict=True):
+            remaining -= tokens
+            if remaining <= allowed:
+                return timestamp - window_start
+        return self._rate_queue[-1] - window_start
@@ -0,0 +1,245 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Retry implementation that honors Retry-After with a shared cool-down gate."""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+from hypergraph_llm.retry.exceptions_to_skip import _default_exceptions_to_skip
+from hypergraph_llm.retry.retry import Retry
+
+if TYPE_CHECKING:
+    from hypergraph_llm.types import Metrics
+
+logger = logging.getLogger(__name__)
+
+_default_release_interval = 0.1
+_rate_limit_exceptions = ["RateLimitError"]
+_reset_headers = ["x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"]
+_duration_pattern = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_duration_units = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+_epoch_threshold = 1e9
+
+
+class CooldownRetry(Retry):
+    """Retry with a cool-down gate shared by every request to the same endpoint.
+
+    A rate limit error closes the gate until the reset time the provider sent
+    (`retry-after-ms`, `retry-after` or `x-ratelimit-reset-*`), or for an
+    exponentially growing delay when it sent none. Every request, new or
+    retried, waits for the gate before it is sent; once the gate opens, the
+    waiting requests are released one `release_interval` apart instead of all
+    at once. Other errors back off exponentially on their own. The time a
+    request spends at the gate or backing off is reported as its
+    `retry_delay_seconds` metric.
+
+    Instances are shared per endpoint by the retry factory.
+    """
+
+    _base_delay: float
+    _max_retries: int
+    _max_delay: float
+    _release_interval: float
+    _exceptions_to_skip: list[str]
+    _lock: threading.Lock
+    _open_at: float
+    _next_release: float
+    _closures: int
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 7,
+        base_delay: float = 2.0,
+        max_delay: float | None = None,
+        release_interval: float | None = None,
+        exceptions_to_skip: list[str] | None = None,
+        **kwargs: dict,
+    ) -> None:
+        """Initialize CooldownRetry.
+
+        Args
+        ----
+            max_retries: int (default=7)
+                The maximum number of retries to attempt.
+            base_delay: float (default=2.0)
+                The base delay multiplier for exponential backoff, used when
+                the provider does not say when to retry.
+            max_delay: float | None
+                The maximum delay before a retry, including delays requested
+                by the provider. If None, there is no limit.
+            release_interval: float | None (default=0.1)
+                The seconds between two requests released by an opening gate.
+        """
+        self._base_delay = base_delay
+        self._max_retries = max_retries
+        self._max_delay = max_delay or float("inf")
+        self._release_interval = (
+            _default_release_interval if release_interval is None else release_interval
+        )
+        self._exceptions_to_skip = exceptions_to_skip or _default_exceptions_to_skip
+        self._lock = threading.Lock()
+        self._open_at = 0.0
+        self._next_release = 0.0
+        self._closures = 0
+
+    def retry(self, *, func: Callable[..., Any], input_args: dict[str, Any]) -> Any:
+        """Retry a synchronous function."""
+        retries: int = 0
+        delay = 1.0
+        retry_delay = 0.0
+        metrics: Metrics | None = input_args.get("metrics")
+        while True:
+            reservation = None
+            while True:
+                wait, reservation = self._reserve(reservation)
+                if wait <= 0:
+                    break
+                retry_delay += wait
+                time.sleep(wait)
+            try:
+                return func(**input_args)
+            except Exception as e:
+                if e.__class__.__name__ in self._exceptions_to_skip:
+                    raise
+                if retries >= self._max_retries:
+                    raise
+                retries += 1
+                delay *= self._base_delay
+                backoff = self._backoff(e, delay)
+                if backoff > 0:
+                    retry_delay += backoff
+                    time.sleep(backoff)
+            finally:
+                if metrics is not None:
+                    metrics["retries"] = retries
+                    metrics["requests_with_retries"] = 1 if retries > 0 else 0
+                    if retry_delay > 0:
+                        metrics["retry_delay_seconds"] = retry_delay
+
+    async def retry_async(
+        self,
+        *,
+        func: Callable[..., Awaitable[Any]],
+        input_args: dict[str, Any],
+    ) -> Any:
+        """Retry an asynchronous function."""
+        retries: int = 0
+        delay = 1.0
+        retry_delay = 0.0
+        metrics: Metrics | None = input_args.get("metrics")
+        while True:
+            reservation = None
+            while True:
+                wait, reservation = self._reserve(reservation)
+                if wait <= 0:
+                    break
+                retry_delay += wait
+                await asyncio.sleep(wait)
+            try:
+                return await func(**input_args)
+            except Exception as e:
+                if e.__class__.__name__ in self._exceptions_to_skip:
+                    raise
+                if retries >= self._max_retries:
+                    raise
+                retries += 1
+                delay *= self._base_delay
+                backoff = self._backoff(e, delay)
+                if backoff > 0:
+                    retry_delay += backoff
+                    await asyncio.sleep(backoff)
+            finally:
+                if metrics is not None:
+                    metrics["retries"] = retries
+                    metrics["requests_with_retries"] = 1 if retries > 0 else 0
+                    if retry_delay > 0:
+                        metrics["retry_delay_seconds"] = retry_delay
+
+    def _backoff(self, error: Exception, delay: float) -> float:
+        """Close the gate on rate limit errors, or return the delay of this request alone."""
+        retry_after = _retry_after(error)
+        delay = min(self._max_delay, delay if retry_after is None else retry_after)
+        if not _is_rate_limit_error(error):
+            return delay
+
+        with self._lock:
+            open_at = time.monotonic() + delay
+            if open_at > self._open_at:
+                logger.info("Rate limited, pausing requests for %.2f seconds", delay)
+                self._open_at = open_at
+                self._closures += 1
+        return 0.0
+
+    def _reserve(self, reservation: int | None) -> tuple[float, int]:
+        """Return the seconds to wait for the gate, and the reservation it was made under.
+
+        A request that slept for its reservation passes, unless the gate was
+        closed again in the meantime.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if reservation == self._closures or (
+                now >= self._open_at and now >= self._next_release
+            ):
+                return 0.0, self._closures
+            release = max(now, self._open_at, self._next_release)
+            self._next_release = release + self._release_interval
+            return release - now, self._closures
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    return (
+        error.__class__.__name__ in _rate_limit_exceptions
+        or getattr(error, "status_code", None) == 429
+    )
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Return the seconds the provider asked to wait before retrying, if any."""
+    headers: dict[str, str] = {}
+    for source in (
+        getattr(getattr(error, "response", None), "headers", None),
+        getattr(error, "litellm_response_headers", None),
+        getattr(error, "headers", None),
+    ):
+        if source:
+            headers.update({str(k).lower(): str(v) for k, v in source.items()})
+
+    if "retry-after-ms" in headers:
+        return _parse_seconds(headers["retry-after-ms"], scale=0.001)
+    if "retry-after" in headers:
+        return _parse_seconds(headers["retry-after"])
+    resets = [
+        seconds
+        for name in _reset_headers
+        if name in headers and (seconds := _parse_seconds(headers[name])) is not None
+    ]
+    return max(resets) if resets else None
+
+
+def _parse_seconds(value: str, scale: float = 1.0) -> float | None:
+    """Parse a delay given as a number, a duration such as `6m0s` or an HTTP date."""
+    value = value.strip()
+    try:
+        seconds = float(value) * scale
+    except ValueError:
+        if durations := _duration_pattern.findall(value):
+            return sum(
+                float(amount) * _duration_units[unit] for amount, unit in durations
+            )
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+    # Some providers send the reset time as a unix timestamp
+    if seconds > _epoch_threshold:
+        return max(seconds - time.time(), 0.0)
+    return max(seconds, 0.0)
@@ -64,6 +64,7 @@ class ExponentialRetry(Retry):
         """Retry a synchronous function."""
         retries: int = 0
         delay = 1.0
+        retry_delay = 0.0
         metrics: Metrics | None = input_args.get("metrics")
         while True:
             try:
@@ -81,11 +82,14 @@ class ExponentialRetry(Retry):
                     delay + (self._jitter * random.uniform(0, 1)),  # noqa: S311
                 )
 
+                retry_delay += sleep_delay
                 time.sleep(sleep_delay)
             finally:
                 if metrics is not None:
                     metrics["retries"] = retries
                     metrics["requests_with_retries"] = 1 if retries > 0 else 0
+                    if retry_delay > 0:
+                        metrics["retry_delay_seconds"] = retry_delay
 
     async def retry_async(
         self,
@@ -96,6 +100,7 @@ class ExponentialRetry(Retry):
         """Retry an asynchronous function."""
         retries: int = 0
         delay = 1.0
+        retry_delay = 0.0
         metrics: Metrics | None = input_args.get("metrics")
         while True:
             try:
@@ -112,8 +117,11 @@ class ExponentialRetry(Retry):
                     delay + (self._jitter * random.uniform(0, 1)),  # noqa: S311
                 )
 
+                retry_delay += sleep_delay
                 await asyncio.sleep(sleep_delay)
             finally:
                 if metrics is not None:
                     metrics["retries"] = retries
                     metrics["requests_with_retries"] = 1 if retries > 0 else 0
+                    if retry_delay > 0:
+                        metrics["retry_delay_seconds"] = retry_delay
@@ -47,6 +47,8 @@ def register_retry(
 
 def create_retry(
     retry_config: "RetryConfig",
+    *,
+    endpoint: str | None = None,
 ) -> Retry:
     """Create a Retry instance.
 
@@ -54,6 +56,10 @@ def create_retry(
     ----
         retry_config: RetryConfig
             The configuration for the retry strategy.
+        endpoint: str | None (default: None)
+            The endpoint the requests are sent to. Retry strategies registered
+            as singletons are shared by every model calling the same endpoint
+            with the same configuration.
 
     Returns
     -------
@@ -61,7 +67,7 @@ def create_retry(
             An instance of a Retry subclass.
     """
     strategy = retry_config.type
-    init_args = retry_config.model_dump()
+    init_args = {**retry_config.model_dump(), "endpoint": endpoint}
 
     if strategy not in retry_factory:
         match strategy:
@@ -79,6 +85,14 @@ def create_retry(
                     strategy=RetryType.Immediate,
                     initializer=ImmediateRetry,
                 )
+            case RetryType.Cooldown:
+                from hypergraph_llm.retry.cooldown_retry import CooldownRetry
+
+                retry_factory.register(
+                    strategy=RetryType.Cooldown,
+                    initializer=CooldownRetry,
+                    scope="singleton",
+                )
             case _:
                 msg = f"RetryConfig.type '{strategy}' is not registered in the RetryFactory. Registered strategies: {', '.join(retry_factory.keys())}"
                 raise ValueError(msg)
@@ -7,6 +7,7 @@ from typing import Any
 
 from litellm import decode, encode  # type: ignore
 
+from hypergraph_llm.tokenizer.token_count_cache import TokenCountCache
 from hypergraph_llm.tokenizer.tokenizer import Tokenizer
 
 
@@ -15,15 +16,25 @@ class LiteLLMTokenizer(Tokenizer):
 
     _model_id: str
 
-    def __init__(self, *, model_id: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        model_id: str,
+        token_count_cache_size: int | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the LiteLLM Tokenizer.
 
         Args
         ----
             model_id: str
                 The LiteLLM model ID, e.g., "openai/gpt-4o".
+            token_count_cache_size: int | None (default: None)
+                The number of token counts to memoize. If None or 0, counts are not cached.
         """
         self._model_id = model_id
+        if token_count_cache_size:
+            self._token_count_cache = TokenCountCache(token_count_cache_size)
 
     def encode(self, text: str) -> list[int]:
         """Encode the given text into a list of tokens.
@@ -3,28 +3,45 @@
 
 """LiteLLM Tokenizer."""
 
+import os
+from collections.abc import Sequence
 from typing import Any
 
 import tiktoken
 
+from hypergraph_llm.tokenizer.token_count_cache import TokenCountCache
 from hypergraph_llm.tokenizer.tokenizer import Tokenizer
 
+_max_threads = 8
+_min_batch_size = 8
+
 
 class TiktokenTokenizer(Tokenizer):
     """LiteLLM Tokenizer."""
 
     _encoding_name: str
 
-    def __init__(self, *, encoding_name: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        encoding_name: str,
+        token_count_cache_size: int | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the Tiktoken Tokenizer.
 
         Args
         ----
             encoding_name: str
                 The encoding name, e.g., "gpt-4o".
+            token_count_cache_size: int | None (default: None)
+                The number of token counts to memoize. If None or 0, counts are not cached.
         """
         self._encoding_name = encoding_name
         self._encoding = tiktoken.get_encoding(encoding_name)
+        self._num_threads = min(os.cpu_count() or 1, _max_threads)
+        if token_count_cache_size:
+            self._token_count_cache = TokenCountCache(token_count_cache_size)
 
     def encode(self, text: str) -> list[int]:
         """Encode the given text into a list of tokens.
@@ -53,3 +70,18 @@ class TiktokenTokenizer(Tokenizer):
             str: The decoded string from the list of tokens.
         """
         return self._encoding.decode(tokens)
+
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens without building a list of Python ints."""
+        return len(self._encoding.encode_to_numpy(text))
+
+    def _count_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens of larger batches on tiktoken's thread pool."""
+        if self._num_threads == 1 or len(texts) < _min_batch_size:
+            return [self._count_tokens(text) for text in texts]
+        return [
+            len(tokens)
+            for tokens in self._encoding.encode_batch(
+                list(texts), num_threads=self._num_threads
+            )
+        ]
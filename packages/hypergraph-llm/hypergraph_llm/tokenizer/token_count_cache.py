@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Bounded LRU cache of token counts."""
+
+import threading
+from collections import OrderedDict
+
+
+class TokenCountCache:
+    """Remember the token counts of recently counted texts.
+
+    Entries are keyed by the hash and length of the text rather than the text
+    itself, so cached texts are not kept alive by the cache.
+    """
+
+    _max_size: int
+    _counts: OrderedDict[tuple[int, int], int]
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache.
+
+        Args
+        ----
+            max_size: int
+                The maximum number of token counts to keep.
+        """
+        self._max_size = max_size
+        self._counts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> int | None:
+        """Return the cached token count of the text, or None."""
+        key = (hash(text), len(text))
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def set(self, text: str, count: int) -> None:
+        """Cache the token count of the text, evicting the least recently used."""
+        key = (hash(text), len(text))
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            if len(self._counts) > self._max_size:
+                self._counts.popitem(last=False)
+
+    def __getstate__(self) -> dict:
+        """Pickle an empty cache: string hashes differ between processes."""
+        return {"max_size": self._max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        """Unpickle an empty cache."""
+        self.__init__(state["max_size"])
@@ -4,14 +4,23 @@
 """Tokenizer Abstract Base Class."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from hypergraph_llm.tokenizer.token_count_cache import TokenCountCache
     from hypergraph_llm.types import LLMCompletionMessagesParam
 
 
 class Tokenizer(ABC):
-    """Tokenizer Abstract Base Class."""
+    """Tokenizer Abstract Base Class.
+
+    Implementations only need to provide `encode` and `decode`. Override
+    `_count_tokens` and `_count_tokens_batch` to count tokens faster than
+    encoding, and set `_token_count_cache` to memoize counts.
+    """
+
+    _token_count_cache: "TokenCountCache | None" = None
 
     @abstractmethod
     def __init__(self, **kwargs: Any) -> None:
@@ -78,6 +87,8 @@ class Tokenizer(ABC):
                 + tokens_per_name
             )
 
+        # Collect the texts first so they are counted in a single batch
+        texts: list[str] = []
         for message in messages:
             total_tokens += tokens_per_message
             if not isinstance(message, dict):
@@ -85,16 +96,19 @@ class Tokenizer(ABC):
             for key, value in message.items():
                 if key == "content":
                     if isinstance(value, str):
-                        total_tokens += self.num_tokens(value)
+                        texts.append(value)
                     elif isinstance(value, list):
-                        for part in value:
-                            if isinstance(part, dict) and "text" in part:
-                                total_tokens += self.num_tokens(part["text"])
+                        texts.extend(
+                            part["text"]
+                            for part in value
+                            if isinstance(part, dict) and "text" in part
+                        )
                 elif key == "role":
-                    total_tokens += self.num_tokens(str(value))
+                    texts.append(str(value))
                 elif key == "name":
-                    total_tokens += self.num_tokens(str(value)) + tokens_per_name
-        return total_tokens
+                    texts.append(str(value))
+                    total_tokens += tokens_per_name
+        return total_tokens + sum(self.num_tokens_batch(texts))
 
     def num_tokens(self, text: str) -> int:
         """Return the number of tokens in the given text.
@@ -108,4 +122,41 @@ class Tokenizer(ABC):
         -------
             int: The number of tokens in the input text.
         """
+        if self._token_count_cache is None:
+            return self._count_tokens(text)
+        count = self._token_count_cache.get(text)
+        if count is None:
+            count = self._count_tokens(text)
+            self._token_count_cache.set(text, count)
+        return count
+
+    def num_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Return the number of tokens in each of the given texts.
+
+        Args
+        ----
+            texts: Sequence[str]
+                The input texts to analyze.
+
+        Returns
+        -------
+            list[int]: The number of tokens in each input text, in order.
+        """
+        if self._token_count_cache is None:
+            return self._count_tokens_batch(texts)
+        counts = [self._token_count_cache.get(text) for text in texts]
+        missing = [index for index, count in enumerate(counts) if count is None]
+        if missing:
+            missing_counts = self._count_tokens_batch([texts[i] for i in missing])
+            for index, count in zip(missing, missing_counts, strict=True):
+                counts[index] = count
+                self._token_count_cache.set(texts[index], count)
+        return counts  # type: ignore[return-value]
+
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens in the given text, without caching."""
         return len(self.encode(text))
+
+    def _count_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens in each of the given texts, without caching."""
+        return [self._count_tokens(text) for text in texts]
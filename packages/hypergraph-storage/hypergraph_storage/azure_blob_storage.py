@@ -3,14 +3,20 @@
 
 """Azure Blob Storage implementation of Storage."""
 
+import asyncio
+import copy
 import logging
 import re
+import threading
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
 
 from hypergraph_storage.storage import (
     Storage,
@@ -19,16 +25,110 @@ from hypergraph_storage.storage import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 4
+"""Number of parallel connections used to transfer the chunks of one blob."""
+
+
+class _AsyncClients(NamedTuple):
+    service_client: AsyncBlobServiceClient
+    container_client: AsyncContainerClient
+    credential: AsyncDefaultAzureCredential | None
+
+
+class _AsyncContainerClient:
+    """An async container client, shared by a storage and its children.
+
+    Each client keeps one aiohttp connection pool for every request. The pool
+    is bound to the event loop it was opened on, so a client is opened per
+    event loop. Clients of event loops that are no longer running are closed
+    when the storage is used from another event loop.
+    """
+
+    def __init__(
+        self,
+        container_name: str,
+        connection_string: str | None,
+        account_url: str | None,
+    ) -> None:
+        self._container_name = container_name
+        self._connection_string = connection_string
+        self._account_url = account_url
+        self._lock = threading.Lock()
+        self._clients: dict[asyncio.AbstractEventLoop, _AsyncClients] = {}
+
+    async def get(self) -> AsyncContainerClient:
+        """Return the client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        stale: list[_AsyncClients] = []
+        with self._lock:
+            clients = self._clients.get(loop)
+            if clients is None:
+                stale = [
+                    self._clients.pop(other_loop)
+                    for other_loop in list(self._clients)
+                    if not other_loop.is_running()
+                ]
+                clients = self._clients[loop] = self._open()
+        await _close_clients(stale)
+        return clients.container_client
+
+    async def close(self) -> None:
+        """Close the clients of every event loop."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        await _close_clients(clients)
+
+    def _open(self) -> _AsyncClients:
+        credential = None
+        if self._connection_string:
+            service_client = AsyncBlobServiceClient.from_connection_string(
+                self._connection_string
+            )
+        else:
+            credential = AsyncDefaultAzureCredential()
+            service_client = AsyncBlobServiceClient(
+                account_url=self._account_url,  # type: ignore[arg-type]
+                credential=credential,
+            )
+        return _AsyncClients(
+            service_client,
+            service_client.get_container_client(self._container_name),
+            credential,
+        )
+
+
+async def _close_clients(clients: list[_AsyncClients]) -> None:
+    """Close clients, which may have been opened on another event loop."""
+    for client in clients:
+        try:
+            await client.service_client.close()
+            if client.credential is not None:
+                await client.credential.close()
+        except Exception:  # noqa: BLE001
+            logger.warning("Error closing blob storage client")
+
 
 class AzureBlobStorage(Storage):
-    """The Blob-Storage implementation."""
+    """The Blob-Storage implementation.
+
+    Reads and writes use the async Azure Blob client, so transfers do not
+    block the event loop; blobs larger than a single request are transferred
+    in chunks over `max_concurrency` parallel connections. Children share
+    the clients, and connection pools, of the storage they were created
+    from. Listing blobs and the synchronous accessors use the blocking
+    client.
+    """
 
     _connection_string: str | None
     _container_name: str
     _base_dir: str | None
     _encoding: str
     _account_url: str | None
+    _max_concurrency: int
     _blob_service_client: BlobServiceClient
+    _container_client: ContainerClient
+    _async_container_client: _AsyncContainerClient
     _storage_account_name: str | None
 
     def __init__(
@@ -38,6 +138,7 @@ class AzureBlobStorage(Storage):
         connection_string: str | None = None,
         base_dir: str | None = None,
         encoding: str = "utf-8",
+        max_concurrency: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Create a new BlobStorage instance."""
@@ -72,35 +173,32 @@ class AzureBlobStorage(Storage):
         self._connection_string = connection_string
         self._base_dir = base_dir
         self._account_url = account_url
+        self._max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
         self._storage_account_name = (
             account_url.split("//")[1].split(".")[0] if account_url else None
         )
+        self._container_client = self._blob_service_client.get_container_client(
+            container_name
+        )
+        self._async_container_client = _AsyncContainerClient(
+            container_name, connection_string, account_url
+        )
         self._create_container()
 
     def _create_container(self) -> None:
         """Create the container if it does not exist."""
         if not self._container_exists():
-            container_name = self._container_name
-            container_names = [
-                container.name
-                for container in self._blob_service_client.list_containers()
-            ]
-            if container_name not in container_names:
-                logger.debug("Creating new container [%s]", container_name)
-                self._blob_service_client.create_container(container_name)
+            logger.debug("Creating new container [%s]", self._container_name)
+            self._container_client.create_container()
 
     def _delete_container(self) -> None:
         """Delete the container."""
         if self._container_exists():
-            self._blob_service_client.delete_container(self._container_name)
+            self._container_client.delete_container()
 
     def _container_exists(self) -> bool:
         """Check if the container exists."""
-        container_name = self._container_name
-        container_names = [
-            container.name for container in self._blob_service_client.list_containers()
-        ]
-        return container_name in container_names
+        return self._container_client.exists()
 
     def find(
         self,
@@ -130,10 +228,7 @@ class AzureBlobStorage(Storage):
             return blob_name
 
         try:
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
-            )
-            all_blobs = list(container_client.list_blobs(self._base_dir))
+            all_blobs = list(self._container_client.list_blobs(self._base_dir))
             logger.debug("All blobs: %s", [blob.name for blob in all_blobs])
             num_loaded = 0
             num_total = len(list(all_blobs))
@@ -164,69 +259,98 @@ class AzureBlobStorage(Storage):
         """Get a value from the blob."""
         try:
             key = self._keyname(key)
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
-            )
+            container_client = await self._async_container_client.get()
             blob_client = container_client.get_blob_client(key)
-            blob_data = blob_client.download_blob().readall()
-            if not as_bytes:
-                coding = encoding or self._encoding
-                blob_data = blob_data.decode(coding)
+            downloader = await blob_client.download_blob(
+                max_concurrency=self._max_concurrency
+            )
+            blob_data = await downloader.readall()
         except Exception:  # noqa: BLE001
             logger.warning("Error getting key %s", key)
             return None
         else:
-            return blob_data
+            return self._decode(blob_data, as_bytes, encoding)
 
     async def set(self, key: str, value: Any, encoding: str | None = None) -> None:
         """Set a value in the blob."""
         try:
             key = self._keyname(key)
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
-            )
+            container_client = await self._async_container_client.get()
             blob_client = container_client.get_blob_client(key)
-            if isinstance(value, bytes):
-                blob_client.upload_blob(value, overwrite=True)
-            else:
-                coding = encoding or self._encoding
-                blob_client.upload_blob(value.encode(coding), overwrite=True)
+            await blob_client.upload_blob(
+                self._encode(value, encoding),
+                overwrite=True,
+                max_concurrency=self._max_concurrency,
+            )
         except Exception:
             logger.exception("Error setting key %s: %s", key)
 
     async def has(self, key: str) -> bool:
         """Check if a key exists in the blob."""
         key = self._keyname(key)
-        container_client = self._blob_service_client.get_container_client(
-            self._container_name
-        )
+        container_client = await self._async_container_client.get()
         blob_client = container_client.get_blob_client(key)
-        return blob_client.exists()
+        return await blob_client.exists()
 
     async def delete(self, key: str) -> None:
         """Delete a key from the blob."""
         key = self._keyname(key)
-        container_client = self._blob_service_client.get_container_client(
-            self._container_name
-        )
+        container_client = await self._async_container_client.get()
         blob_client = container_client.get_blob_client(key)
-        blob_client.delete_blob()
+        await blob_client.delete_blob()
+
+    def get_sync(
+        self, key: str, as_bytes: bool | None = None, encoding: str | None = None
+    ) -> Any:
+        """Get a value from the blob with the blocking client."""
+        try:
+            key = self._keyname(key)
+            blob_client = self._container_client.get_blob_client(key)
+            blob_data = blob_client.download_blob(
+                max_concurrency=self._max_concurrency
+            ).readall()
+        except Exception:  # noqa: BLE001
+            logger.warning("Error getting key %s", key)
+            return None
+        else:
+            return self._decode(blob_data, as_bytes, encoding)
+
+    def set_sync(self, key: str, value: Any, encoding: str | None = None) -> None:
+        """Set a value in the blob with the blocking client."""
+        try:
+            key = self._keyname(key)
+            blob_client = self._container_client.get_blob_client(key)
+            blob_client.upload_blob(
+                self._encode(value, encoding),
+                overwrite=True,
+                max_concurrency=self._max_concurrency,
+            )
+        except Exception:
+            logger.exception("Error setting key %s: %s", key)
+
+    def delete_sync(self, key: str) -> None:
+        """Delete a key from the blob with the blocking client."""
+        key = self._keyname(key)
+        self._container_client.get_blob_client(key).delete_blob()
 
     async def clear(self) -> None:
         """Clear the cache."""
 
+    async def close(self) -> None:
+        """Close the async clients, shared with the children of this storage.
+
+        The clients are opened again if the storage is used after closing.
+        """
+        await self._async_container_client.close()
+
     def child(self, name: str | None) -> "Storage":
-        """Create a child storage instance."""
+        """Create a child storage instance, sharing this storage's clients."""
         if name is None:
             return self
-        path = str(Path(self._base_dir) / name) if self._base_dir else name
-        return AzureBlobStorage(
-            connection_string=self._connection_string,
-            container_name=self._container_name,
-            encoding=self._encoding,
-            base_dir=path,
-            account_url=self._account_url,
-        )
+        base_dir = str(Path(self._base_dir) / name) if self._base_dir else name
+        child = copy.copy(self)
+        child._base_dir = base_dir  # noqa: SLF001
+        return child
 
     def keys(self) -> list[str]:
         """Return the keys in the storage."""
@@ -237,16 +361,28 @@ class AzureBlobStorage(Storage):
         """Get the key name."""
         return str(Path(self._base_dir) / key) if self._base_dir else key
 
+    def _encode(self, value: Any, encoding: str | None) -> bytes:
+        """Encode a value to upload."""
+        if isinstance(value, bytes):
+            return value
+        return value.encode(encoding or self._encoding)
+
+    def _decode(
+        self, blob_data: bytes, as_bytes: bool | None, encoding: str | None
+    ) -> Any:
+        """Decode downloaded blob data, unless bytes were requested."""
+        if as_bytes:
+            return blob_data
+        return blob_data.decode(encoding or self._encoding)
+
     async def get_creation_date(self, key: str) -> str:
-        """Get creation date for the blob."""
+        """Get creation date for the blob, from its properties."""
         try:
             key = self._keyname(key)
-            container_client = self._blob_service_client.get_container_client(
-                self._container_name
-            )
+            container_client = await self._async_container_client.get()
             blob_client = container_client.get_blob_client(key)
-            timestamp = blob_client.download_blob().properties.creation_time
-            return get_timestamp_formatted_with_local_tz(timestamp)
+            properties = await blob_client.get_blob_properties()
+            return get_timestamp_formatted_with_local_tz(properties.creation_time)
         except Exception:  # noqa: BLE001
             logger.warning("Error getting key %s", key)
             return ""
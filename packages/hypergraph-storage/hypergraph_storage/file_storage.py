@@ -107,6 +107,29 @@ class FileStorage(Storage):
         ) as f:
             await f.write(value)
 
+    def get_sync(
+        self, key: str, as_bytes: bool | None = False, encoding: str | None = None
+    ) -> Any:
+        """Get method definition, without an event loop."""
+        file_path = _join_path(self._base_dir, key)
+        if not file_path.is_file():
+            return None
+        if as_bytes:
+            return file_path.read_bytes()
+        return file_path.read_text(encoding=encoding or self._encoding)
+
+    def set_sync(self, key: str, value: Any, encoding: str | None = None) -> None:
+        """Set method definition, without an event loop."""
+        file_path = _join_path(self._base_dir, key)
+        if isinstance(value, bytes):
+            file_path.write_bytes(value)
+        else:
+            file_path.write_text(value, encoding=encoding or self._encoding)
+
+    def delete_sync(self, key: str) -> None:
+        """Delete method definition, without an event loop."""
+        _join_path(self._base_dir, key).unlink(missing_ok=True)
+
     async def has(self, key: str) -> bool:
         """Has method definition."""
         return await exists(_join_path(self._base_dir, key))
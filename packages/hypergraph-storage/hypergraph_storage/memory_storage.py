@@ -52,6 +52,20 @@ class MemoryStorage(FileStorage):
         """
         self._storage[key] = value
 
+    def get_sync(
+        self, key: str, as_bytes: bool | None = None, encoding: str | None = None
+    ) -> Any:
+        """Get the value for the given key without an event loop."""
+        return self._storage.get(key)
+
+    def set_sync(self, key: str, value: Any, encoding: str | None = None) -> None:
+        """Set the value for the given key without an event loop."""
+        self._storage[key] = value
+
+    def delete_sync(self, key: str) -> None:
+        """Delete the given key without an event loop."""
+        self._storage.pop(key, None)
+
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
 
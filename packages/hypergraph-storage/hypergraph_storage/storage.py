@@ -9,6 +9,8 @@ from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
+from hypergraph_common.sync import run_sync
+
 
 class Storage(ABC):
     """Provide a storage interface."""
@@ -94,10 +96,63 @@ class Storage(ABC):
                 The key to delete.
         """
 
+    def get_sync(
+        self, key: str, as_bytes: bool | None = None, encoding: str | None = None
+    ) -> Any:
+        """Get the value for the given key from synchronous code.
+
+        Storages with a blocking client should override this; the default runs
+        `get` on an event loop reused by the calling thread.
+
+        Args
+        ----
+            - key: str
+                The key to get the value for.
+            - as_bytes: bool | None, optional (default=None)
+                Whether or not to return the value as bytes.
+            - encoding: str | None, optional (default=None)
+                The encoding to use when decoding the value.
+
+        Returns
+        -------
+            Any:
+                The value for the given key, or None if it does not exist.
+        """
+        return run_sync(self.get(key, as_bytes=as_bytes, encoding=encoding))
+
+    def set_sync(self, key: str, value: Any, encoding: str | None = None) -> None:
+        """Set the value for the given key from synchronous code.
+
+        Args
+        ----
+            - key: str
+                The key to set the value for.
+            - value: Any
+                The value to set.
+        """
+        run_sync(self.set(key, value, encoding=encoding))
+
+    def delete_sync(self, key: str) -> None:
+        """Delete the given key from synchronous code.
+
+        Args
+        ----
+            - key: str
+                The key to delete.
+        """
+        run_sync(self.delete(key))
+
     @abstractmethod
     async def clear(self) -> None:
         """Clear the storage."""
 
+    async def close(self) -> None:
+        """Close the connections held by the storage.
+
+        Storages without connections to close do not need to override this.
+        """
+        return
+
     @abstractmethod
     def child(self, name: str | None) -> "Storage":
         """Create a child storage instance.
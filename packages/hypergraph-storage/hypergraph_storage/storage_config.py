@@ -46,3 +46,8 @@ class StorageConfig(BaseModel):
         description="The database name to use.",
         default=None,
     )
+    max_concurrency: int | None = Field(
+        description="The number of parallel connections used to transfer one blob when using AzureBlob storage.",
+        default=None,
+        gt=0,
+    )
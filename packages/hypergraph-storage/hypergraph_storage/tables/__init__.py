@@ -4,6 +4,6 @@
 """Table provider module for Hypergraph storage."""
 
 from .table import Table
-from .table_provider import TableProvider
+from .table_provider import Filter, Filters, TableProvider
 
-__all__ = ["Table", "TableProvider"]
+__all__ = ["Filter", "Filters", "Table", "TableProvider"]
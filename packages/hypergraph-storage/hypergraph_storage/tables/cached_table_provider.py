@@ -0,0 +1,229 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An in-memory cache of the tables read from a table provider."""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from hypergraph_storage.tables.table import RowTransformer, Table
+from hypergraph_storage.tables.table_provider import (
+    Filters,
+    TableProvider,
+    filter_dataframe,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TableCacheStats:
+    """Counts of the reads served by a table cache."""
+
+    hits: int = field(default=0)
+    """Reads served from memory."""
+
+    misses: int = field(default=0)
+    """Reads of tables not in memory, served by the table provider."""
+
+    evictions: int = field(default=0)
+    """Tables dropped from memory to stay within the byte budget."""
+
+    bytes_served: int = field(default=0)
+    """In-memory size of the tables served from memory."""
+
+    saved_io_seconds: float = field(default=0)
+    """Estimated seconds of storage reads avoided by serving tables from memory."""
+
+
+@dataclass
+class _CachedTable:
+    df: pd.DataFrame
+    size: int
+    io_seconds: float
+
+
+class CachedTableProvider(TableProvider):
+    """Keep recently read tables in memory.
+
+    A table is kept in memory as the wrapped table provider reads it whole,
+    so reads served from memory return what a storage read would; for
+    example, list columns hold arrays, as read back from Parquet. Writes go
+    to the wrapped table provider and drop the table from memory, and the
+    next read of the table loads it again. Tables are dropped least recently
+    used first once their in-memory size exceeds the byte budget.
+
+    Reads are served with a copy of the cached DataFrame, so callers can
+    modify it. Like the Parquet table provider, reads of some columns return
+    a new index.
+
+    Tables opened for streaming are read and written by the wrapped provider,
+    and dropped from memory.
+    """
+
+    def __init__(
+        self,
+        table_provider: TableProvider,
+        max_bytes: int,
+        stats: TableCacheStats | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the table cache.
+
+        Args
+        ----
+            table_provider: TableProvider
+                The table provider to write tables to, and read tables not in
+                memory from.
+            max_bytes: int
+                The in-memory size of the tables to keep, in bytes.
+            stats: TableCacheStats | None
+                The stats to count the reads in. If None, new stats are used.
+            **kwargs: Any
+                Additional keyword arguments (currently unused).
+        """
+        self._table_provider = table_provider
+        self._max_bytes = max_bytes
+        self._tables: OrderedDict[str, _CachedTable] = OrderedDict()
+        self._size = 0
+        self.stats = stats or TableCacheStats()
+
+    async def read_dataframe(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        """Read a table from memory, or from the table provider.
+
+        Tables read whole from the table provider are kept in memory.
+
+        Args
+        ----
+            table_name: str
+                The name of the table to read.
+            columns: list[str] | None
+                The columns to read, in order. If None, all columns are read.
+            filters: Filters | None
+                Predicates the rows read must match. If None, all rows are read.
+
+        Returns
+        -------
+            pd.DataFrame:
+                The table data as a DataFrame.
+        """
+        cached = self._tables.get(table_name)
+        if cached is None:
+            self.stats.misses += 1
+            start = time.perf_counter()
+            df = await self._table_provider.read_dataframe(
+                table_name, columns=columns, filters=filters
+            )
+            if columns is None and not filters:
+                self._put(table_name, df, time.perf_counter() - start)
+            return df
+
+        self._tables.move_to_end(table_name)
+        self.stats.hits += 1
+        self.stats.bytes_served += cached.size
+        self.stats.saved_io_seconds += cached.io_seconds
+        df = cached.df
+        if filters:
+            df = filter_dataframe(df, filters)
+        if columns is not None:
+            df = df.loc[:, columns].reset_index(drop=True)
+        return df.copy()
+
+    async def write_dataframe(self, table_name: str, df: pd.DataFrame) -> None:
+        """Write a table to the table provider, and drop it from memory.
+
+        Args
+        ----
+            table_name: str
+                The name of the table to write.
+            df: pd.DataFrame
+                The DataFrame to write as a table.
+        """
+        self._drop(table_name)
+        await self._table_provider.write_dataframe(table_name, df)
+
+    async def has(self, table_name: str) -> bool:
+        """Check if a table exists in memory or in the table provider.
+
+        Args
+        ----
+            table_name: str
+                The name of the table to check.
+
+        Returns
+        -------
+            bool:
+                True if the table exists, False otherwise.
+        """
+        return table_name in self._tables or await self._table_provider.has(table_name)
+
+    def list(self) -> list[str]:
+        """List all table names in the table provider.
+
+        Returns
+        -------
+            list[str]:
+                List of table names.
+        """
+        return self._table_provider.list()
+
+    def open(
+        self,
+        table_name: str,
+        transformer: RowTransformer | None = None,
+        truncate: bool = True,
+    ) -> Table:
+        """Open a table of the table provider for streaming row operations.
+
+        The table is dropped from memory, as the rows written to it would not
+        be in the cached DataFrame.
+
+        Args
+        ----
+            table_name: str
+                The name of the table to open.
+            transformer: RowTransformer | None
+                Optional transformer function to apply to each row.
+            truncate: bool
+                If True (default), truncate existing table on first write.
+                If False, append rows to the existing table.
+
+        Returns
+        -------
+            Table:
+                A Table instance for streaming row operations.
+        """
+        self._drop(table_name)
+        return self._table_provider.open(table_name, transformer, truncate=truncate)
+
+    def _put(self, table_name: str, df: pd.DataFrame, io_seconds: float) -> None:
+        """Keep a table in memory, dropping the least recently used tables to fit."""
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self._max_bytes:
+            logger.debug(
+                "Not caching table %s: %d bytes exceed the budget", table_name, size
+            )
+            return
+        self._tables[table_name] = _CachedTable(df, size, io_seconds)
+        self._size += size
+        while self._size > self._max_bytes:
+            evicted_name, _ = next(iter(self._tables.items()))
+            self._drop(evicted_name)
+            self.stats.evictions += 1
+            logger.debug("Evicted table %s from the table cache", evicted_name)
+
+    def _drop(self, table_name: str) -> None:
+        """Drop a table from memory, if it is there."""
+        cached = self._tables.pop(table_name, None)
+        if cached is not None:
+            self._size -= cached.size
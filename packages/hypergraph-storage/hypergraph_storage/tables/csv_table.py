@@ -153,6 +153,11 @@ class CSVTable(Table):
         if self._writer is not None:
             self._writer.writerow(row)
 
+    async def flush(self) -> None:
+        """Flush the rows written so far to the CSV file."""
+        if self._write_file is not None:
+            self._write_file.flush()
+
     async def close(self) -> None:
         """Flush buffered writes and release resources.
 
@@ -13,7 +13,12 @@ from hypergraph_storage.file_storage import FileStorage
 from hypergraph_storage.storage import Storage
 from hypergraph_storage.tables.csv_table import CSVTable
 from hypergraph_storage.tables.table import RowTransformer
-from hypergraph_storage.tables.table_provider import TableProvider
+from hypergraph_storage.tables.table_provider import (
+    Filters,
+    TableProvider,
+    filter_columns,
+    filter_dataframe,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +45,26 @@ class CSVTableProvider(TableProvider):
             raise TypeError(msg)
         self._storage = storage
 
-    async def read_dataframe(self, table_name: str) -> pd.DataFrame:
+    async def read_dataframe(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
         """Read a table from storage as a pandas DataFrame.
 
+        Only the requested columns, and the columns the filters need, are
+        parsed. CSV files have no statistics to skip rows with, so the
+        filters are applied once the columns are parsed.
+
         Args
         ----
             table_name: str
                 The name of the table to read. The file will be accessed as '{table_name}.csv'.
+            columns: list[str] | None
+                The columns to read, in order. If None, all columns are read.
+            filters: Filters | None
+                Predicates the rows read must match. If None, all rows are read.
 
         Returns
         -------
@@ -70,7 +88,19 @@ class CSVTableProvider(TableProvider):
             # Handle empty CSV (pandas can't parse files with no columns)
             if not csv_data or csv_data.strip() == "":
                 return pd.DataFrame()
-            return pd.read_csv(StringIO(csv_data), keep_default_na=False)
+            if columns is None:
+                df = pd.read_csv(StringIO(csv_data), keep_default_na=False)
+            else:
+                df = pd.read_csv(
+                    StringIO(csv_data),
+                    keep_default_na=False,
+                    usecols=pd.Index(
+                        list(dict.fromkeys([*columns, *filter_columns(filters)]))
+                    ),
+                )
+            if filters:
+                df = filter_dataframe(df, filters)
+            return df if columns is None else df.loc[:, columns]
         except Exception:
             logger.exception("error loading table from storage: %s", filename)
             raise
@@ -1,22 +1,31 @@
 # Copyright (C) 2025 Microsoft
 # Licensed under the MIT License
 
-"""A Parquet-based implementation of the Table abstraction with simulated streaming."""
+"""A Parquet-based implementation of the Table abstraction, streamed by row group."""
 
 from __future__ import annotations
 
 import inspect
-from io import BytesIO
-from typing import TYPE_CHECKING, Any, cast
+import re
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from hypergraph_storage.file_storage import FileStorage
+from hypergraph_storage.memory_storage import MemoryStorage
 from hypergraph_storage.tables.table import RowTransformer, Table
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
+    from pathlib import Path
 
     from hypergraph_storage.storage import Storage
+    from hypergraph_storage.tables.table_provider import Filters
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+"""Number of rows buffered before a row group is written, and read per batch."""
 
 
 def _identity(row: dict[str, Any]) -> Any:
@@ -35,16 +44,142 @@ def _apply_transformer(transformer: RowTransformer, row: dict[str, Any]) -> Any:
     return transformer(row)
 
 
+def _file_path(storage: Storage, key: str) -> Path | None:
+    """Return the path of a key on disk, or None if the storage is not on disk."""
+    if isinstance(storage, FileStorage) and not isinstance(storage, MemoryStorage):
+        return storage.get_path(key)
+    return None
+
+
+def _temp_path(path: Path) -> Path:
+    """Return the path a file is written to before it replaces `path`."""
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _fragment_key(table_name: str, number: int) -> str:
+    """Return the key of the fragment appended to a table."""
+    return f"{table_name}.part-{number:05d}.parquet"
+
+
+def _fragment_numbers(storage: Storage, table_name: str) -> dict[str, int]:
+    """Return the fragment keys of a table with their number."""
+    name = re.escape(table_name)
+    key_pattern = re.compile(rf"{name}\.part-(\d+)\.parquet")
+    fragments = {}
+    for key in storage.find(re.compile(rf"(?:^|[\\/]){name}\.part-\d+\.parquet$")):
+        match = key_pattern.fullmatch(key)
+        if match:
+            fragments[key] = int(match.group(1))
+    return fragments
+
+
+def parquet_fragment_keys(storage: Storage, table_name: str) -> list[str]:
+    """Return the keys of the fragments appended to a table, in append order."""
+    fragments = _fragment_numbers(storage, table_name)
+    return sorted(fragments, key=fragments.__getitem__)
+
+
+def is_parquet_fragment(key: str) -> bool:
+    """Check whether a key is a fragment appended to a table."""
+    return re.search(r"\.part-\d+\.parquet$", key) is not None
+
+
+async def parquet_table_keys(storage: Storage, table_name: str) -> list[str]:
+    """Return the keys holding the rows of a table, in order.
+
+    A table is stored in `{table_name}.parquet`, followed by the fragments
+    appended to it. Returns an empty list if the table does not exist.
+    """
+    file_key = f"{table_name}.parquet"
+    if not await storage.has(file_key):
+        return []
+    return [file_key, *parquet_fragment_keys(storage, table_name)]
+
+
+async def _parquet_source(storage: Storage, key: str) -> Path | pa.BufferReader:
+    """Return a source pyarrow can read a Parquet file in storage from."""
+    path = _file_path(storage, key)
+    if path is not None:
+        return path
+    return pa.BufferReader(await storage.get(key, as_bytes=True))
+
+
+def _arrow_string_dtype(data_type: pa.DataType) -> pd.ArrowDtype | None:
+    """Map string columns to Arrow-backed dtypes, leaving other types to pandas."""
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return pd.ArrowDtype(data_type)
+    return None
+
+
+async def open_parquet_file(storage: Storage, key: str) -> pq.ParquetFile:
+    """Open a Parquet file in storage for reading by row group.
+
+    Files in a FileStorage are memory-mapped, and their row groups paged in
+    as they are read; other storages are read into memory first.
+    """
+    return pq.ParquetFile(await _parquet_source(storage, key), memory_map=True)
+
+
+async def read_parquet(
+    storage: Storage,
+    key: str,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    arrow_strings: bool = False,
+) -> pd.DataFrame:
+    """Read the columns and rows of a Parquet file in storage as a DataFrame.
+
+    Only the requested columns are decoded, and row groups whose statistics
+    rule out the filters are skipped. Files in a FileStorage are
+    memory-mapped rather than read into a buffer, and other storages' bytes
+    are read without a copy. The Arrow table is released column by column
+    as it is converted, so the file is not held twice.
+
+    Args
+    ----
+        storage: Storage
+            The storage holding the file.
+        key: str
+            The key of the file.
+        columns: list[str] | None
+            The columns to read, in order. If None, all columns are read.
+        filters: Filters | None
+            Predicates the rows read must match. If None, all rows are read.
+        arrow_strings: bool (default=False)
+            If True, string columns are loaded as `pd.ArrowDtype` columns,
+            which share the Arrow buffers instead of holding a Python object
+            per value. Other columns keep their NumPy dtypes.
+    """
+    table = pq.read_table(
+        await _parquet_source(storage, key),
+        columns=columns,
+        filters=filters,
+        memory_map=True,
+    )
+    return table.to_pandas(
+        types_mapper=_arrow_string_dtype if arrow_strings else None,
+        split_blocks=True,
+        self_destruct=True,
+    )
+
+
 class ParquetTable(Table):
-    """Simulated streaming interface for Parquet tables.
+    """Streaming interface for Parquet tables.
 
-    Parquet format doesn't support true row-by-row streaming, so this
-    implementation simulates streaming via:
-    - Read: Loads DataFrame, yields rows via iterrows()
-    - Write: Accumulates rows in memory, writes all at once on close()
+    Rows are streamed a row group at a time in both directions:
+    - Read: Iterates the row groups of the file with `ParquetFile.iter_batches`
+    - Write: Buffers up to `row_group_size` rows, then writes them as one row
+      group with a `ParquetWriter`
 
-    This provides API compatibility with CSVTable while maintaining
-    Parquet's performance characteristics for bulk operations.
+    Appending to a table (truncate=False) writes the new rows to a fragment,
+    `{table_name}.part-NNNNN.parquet`, instead of rewriting the table; the
+    fragments are read after the table file, in the order they were written.
+    Truncating a table removes its fragments. `flush` finishes the file being
+    written, so its rows can be read; later rows go to a new fragment.
+
+    Peak memory is bounded by one row group on a FileStorage. Other storages
+    only read and write whole objects, so a file is held in memory while it
+    is read or written.
     """
 
     def __init__(
@@ -53,6 +188,7 @@ class ParquetTable(Table):
         table_name: str,
         transformer: RowTransformer | None = None,
         truncate: bool = True,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
     ):
         """Initialize with storage backend and table name.
 
@@ -64,20 +200,28 @@ class ParquetTable(Table):
                 Defaults to identity (no transformation).
             truncate: If True (default), overwrite file on close.
                 If False, append to existing file.
+            row_group_size: Number of rows per row group written, and
+                per batch read. Defaults to 10,000.
         """
         self._storage = storage
         self._table_name = table_name
         self._file_key = f"{table_name}.parquet"
         self._transformer = transformer or _identity
         self._truncate = truncate
-        self._df: pd.DataFrame | None = None
+        self._row_group_size = row_group_size
         self._write_rows: list[dict[str, Any]] = []
+        self._writer: pq.ParquetWriter | None = None
+        self._write_key: str | None = None
+        self._write_path: Path | None = None
+        self._write_sink: pa.BufferOutputStream | None = None
+        self._written_keys: list[str] = []
+        self._next_fragment: int | None = None
 
     def __aiter__(self) -> AsyncIterator[Any]:
         """Iterate through rows one at a time.
 
-        Loads the entire DataFrame on first iteration, then yields rows
-        one at a time with the transformer applied.
+        Reads one batch of rows at a time from the table file and its
+        fragments, and yields them with the transformer applied.
 
         Yields
         ------
@@ -88,26 +232,23 @@ class ParquetTable(Table):
 
     async def _aiter_impl(self) -> AsyncIterator[Any]:
         """Implement async iteration over rows."""
-        if self._df is None:
-            if await self._storage.has(self._file_key):
-                data = await self._storage.get(self._file_key, as_bytes=True)
-                self._df = pd.read_parquet(BytesIO(data))
-            else:
-                self._df = pd.DataFrame()
-
-        for _, row in self._df.iterrows():
-            row_dict = cast("dict[str, Any]", row.to_dict())
-            yield _apply_transformer(self._transformer, row_dict)
+        for key in await parquet_table_keys(self._storage, self._table_name):
+            parquet_file = await open_parquet_file(self._storage, key)
+            try:
+                for batch in parquet_file.iter_batches(batch_size=self._row_group_size):
+                    for row in batch.to_pylist():
+                        yield _apply_transformer(self._transformer, row)
+            finally:
+                parquet_file.close()
 
     async def length(self) -> int:
-        """Return the number of rows in the table."""
-        if self._df is None:
-            if await self._storage.has(self._file_key):
-                data = await self._storage.get(self._file_key, as_bytes=True)
-                self._df = pd.read_parquet(BytesIO(data))
-            else:
-                return 0
-        return len(self._df)
+        """Return the number of rows in the table, read from the file metadata."""
+        rows = 0
+        for key in await parquet_table_keys(self._storage, self._table_name):
+            parquet_file = await open_parquet_file(self._storage, key)
+            rows += parquet_file.metadata.num_rows
+            parquet_file.close()
+        return rows
 
     async def has(self, row_id: str) -> bool:
         """Check if row with given ID exists."""
@@ -120,31 +261,95 @@ class ParquetTable(Table):
         return False
 
     async def write(self, row: dict[str, Any]) -> None:
-        """Accumulate a single row for later batch write.
-
-        Rows are stored in memory and written to Parquet format
-        when close() is called.
+        """Buffer a single row, writing a row group when the buffer is full.
 
         Args
         ----
             row: Dictionary representing a single row to write.
         """
         self._write_rows.append(row)
+        if len(self._write_rows) >= self._row_group_size:
+            await self._write_row_group()
+
+    async def flush(self) -> None:
+        """Write the buffered rows and finish the file, so they can be read.
+
+        Rows written after a flush are stored in a new fragment.
+        """
+        await self._write_row_group()
+        await self._finish_file()
 
     async def close(self) -> None:
-        """Flush accumulated rows to Parquet file and release resources.
+        """Flush buffered rows to the Parquet file and release resources.
 
-        Converts all accumulated rows to a DataFrame and writes
-        to storage as a Parquet file. If truncate=False and file exists,
-        appends to existing data.
+        Writes the remaining rows as a last row group and finishes the
+        file. If truncate=True, fragments left by earlier appends are
+        removed; a table with no rows written is left unchanged.
         """
-        if self._write_rows:
-            new_df = pd.DataFrame(self._write_rows)
-            if not self._truncate and await self._storage.has(self._file_key):
-                existing_data = await self._storage.get(self._file_key, as_bytes=True)
-                existing_df = pd.read_parquet(BytesIO(existing_data))
-                new_df = pd.concat([existing_df, new_df], ignore_index=True)
-            await self._storage.set(self._file_key, new_df.to_parquet())
-            self._write_rows = []
-
-        self._df = None
+        await self.flush()
+        self._written_keys = []
+        self._next_fragment = None
+
+    async def _write_row_group(self) -> None:
+        """Write the buffered rows as one row group."""
+        if not self._write_rows:
+            return
+        table = pa.Table.from_pandas(
+            pd.DataFrame(self._write_rows), preserve_index=False
+        )
+        self._write_rows = []
+        if self._writer is not None and not table.schema.equals(
+            self._writer.schema, check_metadata=False
+        ):
+            try:
+                table = table.cast(self._writer.schema)
+            except (pa.ArrowException, ValueError):
+                # The columns changed; start a new fragment with the new schema
+                await self._finish_file()
+        writer = self._writer or await self._start_file(table.schema)
+        writer.write_table(table, row_group_size=self._row_group_size)
+
+    async def _start_file(self, schema: pa.Schema) -> pq.ParquetWriter:
+        """Open a writer on the table file, or on a new fragment when appending."""
+        if not self._written_keys and (
+            self._truncate or not await self._storage.has(self._file_key)
+        ):
+            self._write_key = self._file_key
+        else:
+            if self._next_fragment is None:
+                numbers = _fragment_numbers(self._storage, self._table_name).values()
+                self._next_fragment = max(numbers, default=0) + 1
+            self._write_key = _fragment_key(self._table_name, self._next_fragment)
+            self._next_fragment += 1
+
+        self._write_path = _file_path(self._storage, self._write_key)
+        if self._write_path is not None:
+            self._write_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write next to the file, so readers never see a partial file
+            self._writer = pq.ParquetWriter(_temp_path(self._write_path), schema)
+        else:
+            self._write_sink = pa.BufferOutputStream()
+            self._writer = pq.ParquetWriter(self._write_sink, schema)
+        return self._writer
+
+    async def _finish_file(self) -> None:
+        """Close the writer and store the file it wrote."""
+        if self._writer is None or self._write_key is None:
+            return
+        self._writer.close()
+        if self._write_path is not None:
+            _temp_path(self._write_path).replace(self._write_path)
+        elif self._write_sink is not None:
+            await self._storage.set(
+                self._write_key, self._write_sink.getvalue().to_pybytes()
+            )
+        self._written_keys.append(self._write_key)
+        if self._truncate and len(self._written_keys) == 1:
+            # The table file was replaced, so earlier fragments no longer belong to it
+            for key in parquet_fragment_keys(self._storage, self._table_name):
+                if key != self._write_key:
+                    await self._storage.delete(key)
+        self._writer = None
+        self._write_key = None
+        self._write_path = None
+        self._write_sink = None
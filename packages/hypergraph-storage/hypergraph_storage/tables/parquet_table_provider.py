@@ -5,14 +5,20 @@
 
 import logging
 import re
-from io import BytesIO
 
 import pandas as pd
 
 from hypergraph_storage.storage import Storage
-from hypergraph_storage.tables.parquet_table import ParquetTable
+from hypergraph_storage.tables.parquet_table import (
+    DEFAULT_ROW_GROUP_SIZE,
+    ParquetTable,
+    is_parquet_fragment,
+    parquet_fragment_keys,
+    parquet_table_keys,
+    read_parquet,
+)
 from hypergraph_storage.tables.table import RowTransformer, Table
-from hypergraph_storage.tables.table_provider import TableProvider
+from hypergraph_storage.tables.table_provider import Filters, TableProvider
 
 logger = logging.getLogger(__name__)
 
@@ -24,30 +30,56 @@ class ParquetTableProvider(TableProvider):
     storing the data through a Storage backend (file, blob, cosmos, etc.).
     """
 
-    def __init__(self, storage: Storage, **kwargs) -> None:
+    def __init__(
+        self,
+        storage: Storage,
+        row_group_size: int | None = None,
+        arrow_strings: bool = False,
+        **kwargs,
+    ) -> None:
         """Initialize the Parquet table provider with an underlying storage instance.
 
         Args
         ----
             storage: Storage
                 The storage instance to use for reading and writing Parquet files.
+            row_group_size: int | None (default=10,000)
+                The number of rows per row group of tables opened for streaming.
+            arrow_strings: bool (default=False)
+                Load the string columns of DataFrames with Arrow-backed dtypes
+                instead of Python objects.
             **kwargs: Any
                 Additional keyword arguments (currently unused).
         """
         self._storage = storage
+        self._row_group_size = row_group_size or DEFAULT_ROW_GROUP_SIZE
+        self._arrow_strings = arrow_strings
 
-    async def read_dataframe(self, table_name: str) -> pd.DataFrame:
+    async def read_dataframe(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
         """Read a table from storage as a pandas DataFrame.
 
+        Only the requested columns are read from the file, and row groups
+        that cannot match the filters are skipped.
+
         Args
         ----
             table_name: str
                 The name of the table to read. The file will be accessed as '{table_name}.parquet'.
+            columns: list[str] | None
+                The columns to read, in order. If None, all columns are read.
+            filters: Filters | None
+                Predicates the rows read must match. If None, all rows are read.
 
         Returns
         -------
             pd.DataFrame:
-                The table data loaded from the Parquet file.
+                The table data loaded from the Parquet file, followed by the
+                fragments appended to it.
 
         Raises
         ------
@@ -57,14 +89,25 @@ class ParquetTableProvider(TableProvider):
                 If there is an error reading or parsing the Parquet file.
         """
         filename = f"{table_name}.parquet"
-        if not await self._storage.has(filename):
+        keys = await parquet_table_keys(self._storage, table_name)
+        if not keys:
             msg = f"Could not find {filename} in storage!"
             raise ValueError(msg)
         try:
             logger.info("reading table from storage: %s", filename)
-            return pd.read_parquet(
-                BytesIO(await self._storage.get(filename, as_bytes=True))
-            )
+            parts = [
+                await read_parquet(
+                    self._storage,
+                    key,
+                    columns=columns,
+                    filters=filters,
+                    arrow_strings=self._arrow_strings,
+                )
+                for key in keys
+            ]
+            if len(parts) == 1:
+                return parts[0]
+            return pd.concat(parts, ignore_index=True)
         except Exception:
             logger.exception("error loading table from storage: %s", filename)
             raise
@@ -77,9 +120,12 @@ class ParquetTableProvider(TableProvider):
             table_name: str
                 The name of the table to write. The file will be saved as '{table_name}.parquet'.
             df: pd.DataFrame
-                The DataFrame to write to storage.
+                The DataFrame to write to storage. Replaces the fragments
+                appended to the table, if any.
         """
         await self._storage.set(f"{table_name}.parquet", df.to_parquet())
+        for key in parquet_fragment_keys(self._storage, table_name):
+            await self._storage.delete(key)
 
     async def has(self, table_name: str) -> bool:
         """Check if a table exists in storage.
@@ -107,6 +153,7 @@ class ParquetTableProvider(TableProvider):
         return [
             file.replace(".parquet", "")
             for file in self._storage.find(re.compile(r"\.parquet$"))
+            if not is_parquet_fragment(file)
         ]
 
     def open(
@@ -117,8 +164,8 @@ class ParquetTableProvider(TableProvider):
     ) -> Table:
         """Open a table for streaming row operations.
 
-        Returns a ParquetTable that simulates streaming by loading the
-        DataFrame and iterating rows, or accumulating writes for batch output.
+        Returns a ParquetTable that reads and writes the table one row
+        group at a time.
 
         Args
         ----
@@ -128,11 +175,17 @@ class ParquetTableProvider(TableProvider):
                 Optional callable to transform each row on read.
             truncate: bool
                 If True (default), overwrite existing file on close.
-                If False, append new rows to existing file.
+                If False, append new rows to the table as a new fragment.
 
         Returns
         -------
             Table:
                 A ParquetTable instance for row-by-row access.
         """
-        return ParquetTable(self._storage, table_name, transformer, truncate=truncate)
+        return ParquetTable(
+            self._storage,
+            table_name,
+            transformer,
+            truncate=truncate,
+            row_group_size=self._row_group_size,
+        )
@@ -90,6 +90,15 @@ class Table(ABC):
             row: Dictionary representing a single row to write.
         """
 
+    async def flush(self) -> None:
+        """Store the rows written so far, keeping the table open for writes.
+
+        Rows flushed are kept if the table is never closed, for example when
+        the process is interrupted. Tables that store each row as it is
+        written have nothing to flush.
+        """
+        return
+
     @abstractmethod
     async def close(self) -> None:
         """Flush buffered writes and release resources.
@@ -4,12 +4,26 @@
 """Abstract base class for table providers."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from typing import Any, cast
 
 import pandas as pd
 
 from hypergraph_storage.tables.table import RowTransformer, Table
 
+Filter = tuple[str, str, Any]
+"""A predicate on a column, as `(column, operator, value)`.
+
+Operators are `=`, `==`, `!=`, `<`, `<=`, `>`, `>=`, `in` and `not in`.
+"""
+
+Filters = list[Filter] | list[list[Filter]]
+"""Predicates on the rows of a table, in the format of `pyarrow.parquet.read_table`.
+
+A list of predicates keeps the rows matching all of them; a list of lists of
+predicates keeps the rows matching all the predicates of any of the lists.
+"""
+
 
 class TableProvider(ABC):
     """Provide a table-based storage interface with support for DataFrames and row dictionaries."""
@@ -25,13 +39,22 @@ class TableProvider(ABC):
         """
 
     @abstractmethod
-    async def read_dataframe(self, table_name: str) -> pd.DataFrame:
-        """Read entire table as a pandas DataFrame.
+    async def read_dataframe(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        """Read a table as a pandas DataFrame.
 
         Args
         ----
             table_name: str
                 The name of the table to read.
+            columns: list[str] | None
+                The columns to read, in order. If None, all columns are read.
+            filters: Filters | None
+                Predicates the rows read must match. If None, all rows are read.
 
         Returns
         -------
@@ -100,3 +123,67 @@ class TableProvider(ABC):
             Table:
                 A Table instance for streaming row operations.
         """
+
+
+_filter_operators: dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "=": lambda series, value: series == value,
+    "==": lambda series, value: series == value,
+    "!=": lambda series, value: series != value,
+    "<": lambda series, value: series < value,
+    "<=": lambda series, value: series <= value,
+    ">": lambda series, value: series > value,
+    ">=": lambda series, value: series >= value,
+    "in": lambda series, value: series.isin(value),
+    "not in": lambda series, value: ~series.isin(value),
+}
+
+
+def filter_dataframe(df: pd.DataFrame, filters: Filters) -> pd.DataFrame:
+    """Keep the rows of a DataFrame matching the filters.
+
+    Used by table providers whose format cannot filter rows while reading.
+
+    Args
+    ----
+        df: pd.DataFrame
+            The DataFrame to filter.
+        filters: Filters
+            The predicates the rows must match.
+
+    Returns
+    -------
+        pd.DataFrame:
+            The matching rows, with a new index.
+
+    Raises
+    ------
+        ValueError:
+            If a filter uses an unknown operator.
+    """
+    if not filters:
+        return df
+    conjunctions = filters if isinstance(filters[0], list) else [filters]
+    mask = pd.Series(False, index=df.index)
+    for conjunction in conjunctions:
+        matches = pd.Series(True, index=df.index)
+        for column, operator, value in cast("list[Filter]", conjunction):
+            if operator not in _filter_operators:
+                msg = f"Unsupported filter operator: {operator}"
+                raise ValueError(msg)
+            matches &= _filter_operators[operator](df.loc[:, column], value)
+        mask |= matches
+    return df.loc[mask].reset_index(drop=True)
+
+
+def filter_columns(filters: Filters | None) -> list[str]:
+    """Return the columns the filters read."""
+    if not filters:
+        return []
+    conjunctions = filters if isinstance(filters[0], list) else [filters]
+    return list(
+        dict.fromkeys(
+            column
+            for conjunction in conjunctions
+            for column, _, _ in cast("list[Filter]", conjunction)
+        )
+    )
@@ -18,3 +18,13 @@ class TableProviderConfig(BaseModel):
         description="The table type to use.",
         default=TableType.Parquet,
     )
+
+    row_group_size: int | None = Field(
+        description="The number of rows per row group of Parquet tables opened for streaming.",
+        default=None,
+    )
+
+    arrow_strings: bool = Field(
+        description="Load the string columns of Parquet tables with Arrow-backed dtypes.",
+        default=False,
+    )
@@ -5,4 +5,5 @@
 
 from hypergraph.cli.main import app
 
-app(prog_name="hypergraph")
+if __name__ == "__main__":
+    app(prog_name="hypergraph")
@@ -12,8 +12,12 @@ import logging
 from typing import Any
 
 import pandas as pd
+from hypergraph_llm.config.types import MetricsWriterType
 
 from hypergraph.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from hypergraph.callbacks.openmetrics_workflow_callbacks import (
+    OpenMetricsWorkflowCallbacks,
+)
 from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
 from hypergraph.config.enums import IndexingMethod
 from hypergraph.config.models.hyper_graph_config import HyperGraphConfig
@@ -59,6 +63,10 @@ async def build_index(
     """
     init_loggers(config=config, verbose=verbose)
 
+    # Export pipeline progress along with the metrics of the models
+    if _exports_openmetrics(config):
+        callbacks = [*(callbacks or []), OpenMetricsWorkflowCallbacks()]
+
     # Create callbacks for pipeline lifecycle events if provided
     workflow_callbacks = (
         create_callback_chain(callbacks) if callbacks else NoopWorkflowCallbacks()
@@ -93,6 +101,15 @@ async def build_index(
     return outputs
 
 
+def _exports_openmetrics(config: HyperGraphConfig) -> bool:
+    models = [*config.completion_models.values(), *config.embedding_models.values()]
+    return any(
+        model.metrics is not None
+        and model.metrics.writer == MetricsWriterType.OpenMetrics
+        for model in models
+    )
+
+
 def _get_method(method: IndexingMethod | str, is_update_run: bool) -> str:
     m = method.value if isinstance(method, IndexingMethod) else method
     return f"{m}-update" if is_update_run else m
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A workflow callback that exports pipeline progress as OpenMetrics."""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from hypergraph_llm.metrics import MetricFamily, openmetrics_exporter
+
+from hypergraph.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from hypergraph.index.typing.pipeline_run_result import PipelineRunResult
+from hypergraph.logger.progress import Progress
+
+_COLLECTOR_NAME = "hypergraph_workflows"
+
+
+@dataclass
+class _WorkflowState:
+    start_time: float
+    end_time: float | None = None
+    completed_items: int = 0
+    total_items: int = 0
+
+
+class OpenMetricsWorkflowCallbacks(NoopWorkflowCallbacks):
+    """Export the progress of the running pipeline with the LLM metrics.
+
+    Registers a collector with `hypergraph_llm.metrics.openmetrics_exporter`,
+    so the progress is served by the `openmetrics` metrics writer along with
+    the request counts, tokens and cost of each model. Progress is labelled
+    by workflow; a new instance replaces the progress of the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._workflows: dict[str, _WorkflowState] = {}
+        self._current: str | None = None
+        self._errors = 0
+        openmetrics_exporter.register(_COLLECTOR_NAME, self.collect)
+
+    def pipeline_start(self, names: list[str]) -> None:
+        """Execute this callback to signal when the entire pipeline starts."""
+        with self._lock:
+            self._workflows.clear()
+            self._current = None
+
+    def pipeline_end(self, results: list[PipelineRunResult]) -> None:
+        """Execute this callback to signal when the entire pipeline ends."""
+        with self._lock:
+            self._current = None
+
+    def workflow_start(self, name: str, instance: object) -> None:
+        """Execute this callback when a workflow starts."""
+        with self._lock:
+            self._workflows[name] = _WorkflowState(start_time=time.time())
+            self._current = name
+
+    def workflow_end(self, name: str, instance: object) -> None:
+        """Execute this callback when a workflow ends."""
+        with self._lock:
+            if name in self._workflows:
+                self._workflows[name].end_time = time.time()
+            if self._current == name:
+                self._current = None
+
+    def progress(self, progress: Progress) -> None:
+        """Record the progress of the running workflow."""
+        with self._lock:
+            if self._current is None:
+                return
+            state = self._workflows[self._current]
+            state.completed_items = progress.completed_items or 0
+            state.total_items = progress.total_items or 0
+
+    def pipeline_error(self, error: BaseException) -> None:
+        """Execute this callback when an error occurs in the pipeline."""
+        with self._lock:
+            self._errors += 1
+
+    def collect(self) -> list[MetricFamily]:
+        """Return the progress of each workflow of the pipeline."""
+        running = MetricFamily(
+            "hypergraph_workflow_running", "gauge", "1 while the workflow runs."
+        )
+        completed = MetricFamily(
+            "hypergraph_workflow_completed_items",
+            "gauge",
+            "Items completed by the running step of the workflow.",
+        )
+        total = MetricFamily(
+            "hypergraph_workflow_total_items",
+            "gauge",
+            "Items to complete in the running step of the workflow.",
+        )
+        duration = MetricFamily(
+            "hypergraph_workflow_duration_seconds",
+            "gauge",
+            "Seconds the workflow has run for.",
+        )
+        errors = MetricFamily(
+            "hypergraph_pipeline_errors_total", "counter", "Workflows that failed."
+        )
+        now = time.time()
+        with self._lock:
+            for name, state in self._workflows.items():
+                labels = {"workflow": name}
+                running.add(labels, 1 if name == self._current else 0)
+                completed.add(labels, state.completed_items)
+                total.add(labels, state.total_items)
+                duration.add(labels, (state.end_time or now) - state.start_time)
+            errors.add({}, self._errors)
+        return [running, completed, total, duration, errors]
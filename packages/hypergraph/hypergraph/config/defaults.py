@@ -81,6 +81,7 @@ class CommunityReportDefaults:
     text_prompt: None = None
     max_length: int = 2000
     max_input_length: int = 8000
+    context_workers: int = 1
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "community_reporting"
 
@@ -151,6 +152,8 @@ class ExtractGraphDefaults:
     strict_entity_types: bool = False
     strict_relationship_types: bool = False
     max_gleanings: int = 1
+    checkpoint: bool = False
+    resume: bool = False
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "extract_graph"
 
@@ -305,6 +308,14 @@ class ReportingDefaults:
     storage_account_blob_url: None = None
 
 
+@dataclass
+class TableCacheDefaults:
+    """Default values for the table cache."""
+
+    enabled: bool = False
+    max_bytes: int = 2 * 1024**3
+
+
 @dataclass
 class SnapshotsDefaults:
     """Default values for snapshots."""
@@ -322,6 +333,8 @@ class EntityResolutionDefaults:
     prompt: None = None
     completion_model_id: str = DEFAULT_COMPLETION_MODEL_ID
     model_instance_name: str = "entity_resolution"
+    max_block_size: int = 50
+    similarity_threshold: float = 0.4
 
 
 @dataclass
@@ -371,6 +384,7 @@ class HyperGraphConfigDefaults:
     embed_text: EmbedTextDefaults = field(default_factory=EmbedTextDefaults)
     chunking: ChunkingDefaults = field(default_factory=ChunkingDefaults)
     snapshots: SnapshotsDefaults = field(default_factory=SnapshotsDefaults)
+    table_cache: TableCacheDefaults = field(default_factory=TableCacheDefaults)
     extract_graph: ExtractGraphDefaults = field(default_factory=ExtractGraphDefaults)
     entity_resolution: EntityResolutionDefaults = field(
         default_factory=EntityResolutionDefaults
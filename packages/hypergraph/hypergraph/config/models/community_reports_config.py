@@ -50,6 +50,11 @@ class CommunityReportsConfig(BaseModel):
         description="The maximum input length in tokens to use when generating reports.",
         default=hypergraph_config_defaults.community_reports.max_input_length,
     )
+    context_workers: int = Field(
+        description="The number of worker processes used to build community contexts. 1 builds them in the indexing process, 0 uses one worker per CPU.",
+        default=hypergraph_config_defaults.community_reports.context_workers,
+        ge=0,
+    )
 
     def resolved_prompts(self) -> CommunityReportPrompts:
         """Get the resolved community report extraction prompts."""
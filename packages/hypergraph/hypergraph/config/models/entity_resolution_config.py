@@ -38,6 +38,17 @@ class EntityResolutionConfig(BaseModel):
         description="The entity resolution prompt to use.",
         default=hypergraph_config_defaults.entity_resolution.prompt,
     )
+    max_block_size: int = Field(
+        description="The maximum number of candidate entity names sent to the LLM in a single prompt.",
+        default=hypergraph_config_defaults.entity_resolution.max_block_size,
+        ge=2,
+    )
+    similarity_threshold: float = Field(
+        description="The minimum character n-gram Jaccard similarity for two entity names to be compared by the LLM.",
+        default=hypergraph_config_defaults.entity_resolution.similarity_threshold,
+        gt=0.0,
+        le=1.0,
+    )
 
     def resolved_prompts(self) -> EntityResolutionPrompts:
         """Get the resolved entity resolution prompts."""
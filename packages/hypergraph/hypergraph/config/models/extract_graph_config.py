@@ -60,6 +60,20 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=hypergraph_config_defaults.extract_graph.max_gleanings,
     )
+    checkpoint: bool = Field(
+        description=(
+            "If true, append the extraction results of each text unit to the "
+            "extract_graph_checkpoint output table as they complete."
+        ),
+        default=hypergraph_config_defaults.extract_graph.checkpoint,
+    )
+    resume: bool = Field(
+        description=(
+            "If true, only extract the text units missing from the "
+            "extract_graph_checkpoint output table. Implies checkpoint."
+        ),
+        default=hypergraph_config_defaults.extract_graph.resume,
+    )
 
     @model_validator(mode="after")
     def _validate_strict_type_settings(self) -> "ExtractGraphConfig":
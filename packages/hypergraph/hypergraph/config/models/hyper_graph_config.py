@@ -36,6 +36,7 @@ from hypergraph.config.models.snapshots_config import SnapshotsConfig
 from hypergraph.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
+from hypergraph.config.models.table_cache_config import TableCacheConfig
 
 
 class HyperGraphConfig(BaseModel):
@@ -145,6 +146,12 @@ class HyperGraphConfig(BaseModel):
     )
     """The table provider configuration. By default we read/write parquet to disk. You can register custom output table storage."""
 
+    table_cache: TableCacheConfig = Field(
+        description="The in-memory table cache configuration.",
+        default=TableCacheConfig(),
+    )
+    """The in-memory table cache configuration."""
+
     cache: CacheConfig = Field(
         description="The cache configuration.",
         default=CacheConfig(**asdict(hypergraph_config_defaults.cache)),
@@ -0,0 +1,22 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+from hypergraph.config.defaults import hypergraph_config_defaults
+
+
+class TableCacheConfig(BaseModel):
+    """Configuration section for the in-memory table cache."""
+
+    enabled: bool = Field(
+        description="A flag indicating whether to keep the output tables read by workflows in memory, to serve later reads without reading storage.",
+        default=hypergraph_config_defaults.table_cache.enabled,
+    )
+    max_bytes: int = Field(
+        description="The in-memory size of the tables to keep, in bytes. The least recently used tables are dropped first.",
+        default=hypergraph_config_defaults.table_cache.max_bytes,
+        gt=0,
+    )
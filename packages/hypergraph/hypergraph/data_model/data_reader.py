@@ -23,6 +23,10 @@ class DataReader:
     When loading from weakly-typed formats like CSV, list columns are stored as
     plain strings. This class wraps a TableProvider, loading each table and
     converting columns to their expected types before returning.
+
+    Each method reads only the given columns, or all columns if None; ask
+    for the columns a step uses to avoid reading large text and embedding
+    columns it would discard.
     """
 
     def __init__(self, table_provider: TableProvider) -> None:
@@ -35,37 +39,39 @@ class DataReader:
         """
         self._table_provider = table_provider
 
-    async def entities(self) -> pd.DataFrame:
+    async def entities(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the entities dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("entities")
+        df = await self._table_provider.read_dataframe("entities", columns=columns)
         return entities_typed(df)
 
-    async def relationships(self) -> pd.DataFrame:
+    async def relationships(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the relationships dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("relationships")
+        df = await self._table_provider.read_dataframe("relationships", columns=columns)
         return relationships_typed(df)
 
-    async def communities(self) -> pd.DataFrame:
+    async def communities(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the communities dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("communities")
+        df = await self._table_provider.read_dataframe("communities", columns=columns)
         return communities_typed(df)
 
-    async def community_reports(self) -> pd.DataFrame:
+    async def community_reports(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the community reports dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("community_reports")
+        df = await self._table_provider.read_dataframe(
+            "community_reports", columns=columns
+        )
         return community_reports_typed(df)
 
-    async def covariates(self) -> pd.DataFrame:
+    async def covariates(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the covariates dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("covariates")
+        df = await self._table_provider.read_dataframe("covariates", columns=columns)
         return covariates_typed(df)
 
-    async def text_units(self) -> pd.DataFrame:
+    async def text_units(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the text units dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("text_units")
+        df = await self._table_provider.read_dataframe("text_units", columns=columns)
         return text_units_typed(df)
 
-    async def documents(self) -> pd.DataFrame:
+    async def documents(self, columns: list[str] | None = None) -> pd.DataFrame:
         """Load and return the documents dataframe with correct types."""
-        df = await self._table_provider.read_dataframe("documents")
+        df = await self._table_provider.read_dataframe("documents", columns=columns)
         return documents_typed(df)
@@ -72,17 +72,22 @@ def communities_typed(df: pd.DataFrame) -> pd.DataFrame:
     """Return the communities dataframe with correct types, in case it was stored in a weakly-typed format."""
     if SHORT_ID in df.columns:
         df[SHORT_ID] = df[SHORT_ID].astype(int)
-    df[COMMUNITY_ID] = df[COMMUNITY_ID].astype(int)
-    df[COMMUNITY_LEVEL] = df[COMMUNITY_LEVEL].astype(int)
-    df[COMMUNITY_CHILDREN] = df[COMMUNITY_CHILDREN].apply(_split_list_column)
+    if COMMUNITY_ID in df.columns:
+        df[COMMUNITY_ID] = df[COMMUNITY_ID].astype(int)
+    if COMMUNITY_LEVEL in df.columns:
+        df[COMMUNITY_LEVEL] = df[COMMUNITY_LEVEL].astype(int)
+    if COMMUNITY_CHILDREN in df.columns:
+        df[COMMUNITY_CHILDREN] = df[COMMUNITY_CHILDREN].apply(_split_list_column)
     if ENTITY_IDS in df.columns:
         df[ENTITY_IDS] = df[ENTITY_IDS].apply(_split_list_column)
     if RELATIONSHIP_IDS in df.columns:
         df[RELATIONSHIP_IDS] = df[RELATIONSHIP_IDS].apply(_split_list_column)
     if TEXT_UNIT_IDS in df.columns:
         df[TEXT_UNIT_IDS] = df[TEXT_UNIT_IDS].apply(_split_list_column)
-    df[PERIOD] = df[PERIOD].astype(str)
-    df[SIZE] = df[SIZE].astype(int)
+    if PERIOD in df.columns:
+        df[PERIOD] = df[PERIOD].astype(str)
+    if SIZE in df.columns:
+        df[SIZE] = df[SIZE].astype(int)
 
     return df
 
@@ -91,12 +96,18 @@ def community_reports_typed(df: pd.DataFrame) -> pd.DataFrame:
     """Return the community reports dataframe with correct types, in case it was stored in a weakly-typed format."""
     if SHORT_ID in df.columns:
         df[SHORT_ID] = df[SHORT_ID].astype(int)
-    df[COMMUNITY_ID] = df[COMMUNITY_ID].astype(int)
-    df[COMMUNITY_LEVEL] = df[COMMUNITY_LEVEL].astype(int)
-    df[COMMUNITY_CHILDREN] = df[COMMUNITY_CHILDREN].apply(_split_list_column)
-    df[RATING] = df[RATING].astype(float)
-    df[FINDINGS] = df[FINDINGS].apply(_split_list_column)
-    df[SIZE] = df[SIZE].astype(int)
+    if COMMUNITY_ID in df.columns:
+        df[COMMUNITY_ID] = df[COMMUNITY_ID].astype(int)
+    if COMMUNITY_LEVEL in df.columns:
+        df[COMMUNITY_LEVEL] = df[COMMUNITY_LEVEL].astype(int)
+    if COMMUNITY_CHILDREN in df.columns:
+        df[COMMUNITY_CHILDREN] = df[COMMUNITY_CHILDREN].apply(_split_list_column)
+    if RATING in df.columns:
+        df[RATING] = df[RATING].astype(float)
+    if FINDINGS in df.columns:
+        df[FINDINGS] = df[FINDINGS].apply(_split_list_column)
+    if SIZE in df.columns:
+        df[SIZE] = df[SIZE].astype(int)
 
     return df
 
@@ -113,7 +124,8 @@ def text_units_typed(df: pd.DataFrame) -> pd.DataFrame:
     """Return the text units dataframe with correct types, in case it was stored in a weakly-typed format."""
     if SHORT_ID in df.columns:
         df[SHORT_ID] = df[SHORT_ID].astype(int)
-    df[N_TOKENS] = df[N_TOKENS].astype(int)
+    if N_TOKENS in df.columns:
+        df[N_TOKENS] = df[N_TOKENS].astype(int)
     if ENTITY_IDS in df.columns:
         df[ENTITY_IDS] = df[ENTITY_IDS].apply(_split_list_column)
     if RELATIONSHIP_IDS in df.columns:
@@ -3,9 +3,106 @@
 
 """Find connected components and the largest connected component from an edge list DataFrame."""
 
+import numpy as np
 import pandas as pd
 
 
+def factorize_nodes(
+    relationships: pd.DataFrame,
+    source_column: str = "source",
+    target_column: str = "target",
+) -> tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Encode the node titles of an edge list as int32 codes.
+
+    Parameters
+    ----------
+    relationships : pd.DataFrame
+        Edge list with at least source and target columns.
+    source_column : str
+        Name of the source node column.
+    target_column : str
+        Name of the target node column.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, pd.Index]
+        The source codes, the target codes and the node titles they index,
+        in order of first appearance (all sources, then all targets).
+    """
+    num_edges = len(relationships)
+    codes, titles = pd.factorize(
+        pd.concat(
+            [relationships[source_column], relationships[target_column]],
+            ignore_index=True,
+        ),
+        use_na_sentinel=False,
+    )
+    codes = codes.astype(np.int32)
+    return codes[:num_edges], codes[num_edges:], pd.Index(titles)
+
+
+def component_labels(
+    source_codes: np.ndarray, target_codes: np.ndarray, num_nodes: int
+) -> np.ndarray:
+    """Label every node code with the rank of its connected component.
+
+    Components are ranked by descending size, ties broken by the first appearance
+    of their nodes, so label 0 is always the largest connected component.
+
+    Parameters
+    ----------
+    source_codes : np.ndarray
+        Node codes of the edge sources.
+    target_codes : np.ndarray
+        Node codes of the edge targets.
+    num_nodes : int
+        The number of distinct node codes.
+
+    Returns
+    -------
+    np.ndarray
+        The component rank of every node code.
+    """
+    if num_nodes == 0:
+        return np.empty(0, dtype=np.int32)
+
+    component_ids = _union_find(source_codes, target_codes, num_nodes)
+
+    # Order components by first appearance, then stable-sort by descending size
+    components, first_node = np.unique(component_ids, return_index=True)
+    components = components[np.argsort(first_node)]
+    sizes = np.bincount(component_ids)[components]
+    ranked = components[np.argsort(-sizes, kind="stable")]
+    rank_of_component = np.empty(component_ids.max() + 1, dtype=np.int32)
+    rank_of_component[ranked] = np.arange(len(ranked), dtype=np.int32)
+    return rank_of_component[component_ids]
+
+
+def _union_find(
+    source_codes: np.ndarray, target_codes: np.ndarray, num_nodes: int
+) -> np.ndarray:
+    """Return the root of every node using array-based hooking and pointer jumping.
+
+    Each round hooks the larger root of every crossing edge onto the smaller one,
+    then compresses every path, until no edge connects two different roots.
+    """
+    parent = np.arange(num_nodes, dtype=np.int32)
+    while True:
+        source_roots = parent[source_codes]
+        target_roots = parent[target_codes]
+        crossing = source_roots != target_roots
+        if not crossing.any():
+            return parent
+        low = np.minimum(source_roots[crossing], target_roots[crossing])
+        high = np.maximum(source_roots[crossing], target_roots[crossing])
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
 def connected_components(
     relationships: pd.DataFrame,
     source_column: str = "source",
@@ -13,7 +110,7 @@ def connected_components(
 ) -> list[set[str]]:
     """Return all connected components as a list of node-title sets.
 
-    Uses union-find on the deduplicated edge list.
+    Uses union-find over factorized node codes.
 
     Parameters
     ----------
@@ -30,36 +127,13 @@ def connected_components(
         Each element is a set of node titles belonging to one component,
         sorted by descending component size.
     """
-    edges = relationships.drop_duplicates(subset=[source_column, target_column])
-
-    # Initialize every node as its own parent
-    all_nodes = pd.concat(
-        [edges[source_column], edges[target_column]], ignore_index=True
-    ).unique()
-    parent: dict[str, str] = {node: node for node in all_nodes}
-
-    def find(x: str) -> str:
-        while parent[x] != x:
-            parent[x] = parent[parent[x]]  # path compression
-            x = parent[x]
-        return x
-
-    def union(a: str, b: str) -> None:
-        ra, rb = find(a), find(b)
-        if ra != rb:
-            parent[ra] = rb
-
-    # Union each edge
-    for src, tgt in zip(edges[source_column], edges[target_column], strict=True):
-        union(src, tgt)
-
-    # Group by root
-    groups: dict[str, set[str]] = {}
-    for node in parent:
-        root = find(node)
-        groups.setdefault(root, set()).add(node)
-
-    return sorted(groups.values(), key=len, reverse=True)
+    source_codes, target_codes, titles = factorize_nodes(
+        relationships, source_column, target_column
+    )
+    labels = component_labels(source_codes, target_codes, len(titles))
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    return [set(titles[nodes]) for nodes in np.split(order, boundaries) if len(nodes)]
 
 
 def largest_connected_component(
@@ -83,11 +157,8 @@ def largest_connected_component(
     set[str]
         The set of node titles in the largest connected component.
     """
-    components = connected_components(
-        relationships,
-        source_column=source_column,
-        target_column=target_column,
+    source_codes, target_codes, titles = factorize_nodes(
+        relationships, source_column, target_column
     )
-    if not components:
-        return set()
-    return components[0]
+    labels = component_labels(source_codes, target_codes, len(titles))
+    return set(titles[labels == 0])
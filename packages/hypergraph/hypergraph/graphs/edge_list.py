@@ -0,0 +1,88 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Columnar helpers to turn a relationships DataFrame into an undirected edge list."""
+
+import numpy as np
+import pandas as pd
+
+
+def normalize_edges(
+    edges: pd.DataFrame,
+    source_column: str = "source",
+    target_column: str = "target",
+) -> pd.DataFrame:
+    """Normalize edge direction and deduplicate so each undirected edge appears once.
+
+    The lesser node becomes the source. Reversed pairs are deduplicated keeping the
+    last row, matching how NX keeps the last row's attributes.
+
+    Parameters
+    ----------
+    edges : pd.DataFrame
+        Edge list with at least source and target columns.
+    source_column : str
+        Name of the source node column.
+    target_column : str
+        Name of the target node column.
+
+    Returns
+    -------
+    pd.DataFrame
+        A copy of the input with normalized direction and no duplicate pairs.
+    """
+    source = edges[source_column].to_numpy()
+    target = edges[target_column].to_numpy()
+    swapped = source > target
+    normalized = edges.assign(**{
+        source_column: np.where(swapped, target, source),
+        target_column: np.where(swapped, source, target),
+    })
+    return normalized.drop_duplicates(
+        subset=[source_column, target_column], keep="last"
+    )
+
+
+def sorted_edge_list(
+    edges: pd.DataFrame,
+    source_column: str = "source",
+    target_column: str = "target",
+    weight_column: str = "weight",
+) -> list[tuple[str, str, float]]:
+    """Return `(source, target, weight)` tuples in sorted order, as Leiden expects.
+
+    Node names are converted to strings and weights to floats; a missing weight
+    column gives every edge a weight of 1.0.
+
+    Parameters
+    ----------
+    edges : pd.DataFrame
+        Edge list with at least source and target columns.
+    source_column : str
+        Name of the source node column.
+    target_column : str
+        Name of the target node column.
+    weight_column : str
+        Name of the edge weight column.
+
+    Returns
+    -------
+    list[tuple[str, str, float]]
+        The edge list sorted by source, target and weight.
+    """
+    columns = pd.DataFrame({
+        "source": edges[source_column].astype(str),
+        "target": edges[target_column].astype(str),
+        "weight": edges[weight_column].astype(float)
+        if weight_column in edges.columns
+        else 1.0,
+    })
+    columns = columns.sort_values(["source", "target", "weight"], kind="stable")
+    return list(
+        zip(
+            columns["source"].tolist(),
+            columns["target"].tolist(),
+            columns["weight"].tolist(),
+            strict=True,
+        )
+    )
@@ -5,15 +5,13 @@
 
 import logging
 import math
-from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
 from hypergraph.config.enums import ModularityMetric
-from hypergraph.graphs.connected_components import (
-    connected_components,
-    largest_connected_component,
-)
+from hypergraph.graphs.connected_components import component_labels, factorize_nodes
+from hypergraph.graphs.edge_list import normalize_edges, sorted_edge_list
 from hypergraph.graphs.hierarchical_leiden import (
     final_level_hierarchical_clustering,
     first_level_hierarchical_clustering,
@@ -34,15 +32,12 @@ def _df_to_edge_list(
     Normalizes direction and deduplicates so each undirected edge appears
     once, keeping the last occurrence's weight (matching NX behavior).
     """
-    df = edges[[source_column, target_column, weight_column]].copy()
-    lo = df[[source_column, target_column]].min(axis=1)
-    hi = df[[source_column, target_column]].max(axis=1)
-    df = df.assign(**{source_column: lo, target_column: hi})
-    df = df.drop_duplicates(subset=[source_column, target_column], keep="last")
-    return sorted(
-        (str(row[source_column]), str(row[target_column]), float(row[weight_column]))
-        for _, row in df.iterrows()
+    df = normalize_edges(
+        edges.loc[:, [source_column, target_column, weight_column]],
+        source_column,
+        target_column,
     )
+    return sorted_edge_list(df, source_column, target_column, weight_column)
 
 
 def modularity(
@@ -110,46 +105,52 @@ def _modularity_components(
     are removed (keeping the last occurrence's weight, matching NX behavior).
     """
     # Normalize direction and deduplicate so each undirected edge is counted once
-    df = edges[[source_column, target_column, weight_column]].copy()
-    lo = df[[source_column, target_column]].min(axis=1)
-    hi = df[[source_column, target_column]].max(axis=1)
-    df = df.assign(**{source_column: lo, target_column: hi})
-    df = df.drop_duplicates(subset=[source_column, target_column], keep="last")
-
-    total_edge_weight = 0.0
+    df = normalize_edges(
+        edges.loc[:, [source_column, target_column, weight_column]],
+        source_column,
+        target_column,
+    )
     communities = set(partitions.values())
 
-    degree_sums_within: dict[int, float] = defaultdict(float)
-    degree_sums_for: dict[int, float] = defaultdict(float)
-
-    for _, row in df.iterrows():
-        src = str(row[source_column])
-        tgt = str(row[target_column])
-        weight = float(row[weight_column])
-
-        src_comm = partitions[src]
-        tgt_comm = partitions[tgt]
-
-        if src_comm == tgt_comm:
-            if src == tgt:
-                degree_sums_within[src_comm] += weight
-            else:
-                degree_sums_within[src_comm] += weight * 2.0
-
-        degree_sums_for[src_comm] += weight
-        degree_sums_for[tgt_comm] += weight
-        total_edge_weight += weight
-
+    source_codes, target_codes, titles = factorize_nodes(
+        df, source_column, target_column
+    )
+    node_communities = pd.Series(partitions).reindex(titles.astype(str))
+    missing = node_communities.isna()
+    if missing.any():
+        raise KeyError(node_communities.loc[missing].index[0])
+    community_codes, community_ids = pd.factorize(node_communities)
+    src_comm = community_codes[source_codes]
+    tgt_comm = community_codes[target_codes]
+    weights = df[weight_column].to_numpy(dtype=float)
+
+    total_edge_weight = float(weights.sum())
     if total_edge_weight == 0.0:
         return dict.fromkeys(communities, 0.0)
 
+    # Self-loops count once towards the intra-community degree, other edges twice
+    intra = src_comm == tgt_comm
+    self_loops = source_codes == target_codes
+    num_communities = len(community_ids)
+    degree_sums_within = np.bincount(
+        src_comm[intra],
+        weights=np.where(self_loops[intra], 1.0, 2.0) * weights[intra],
+        minlength=num_communities,
+    )
+    degree_sums_for = np.bincount(
+        src_comm, weights=weights, minlength=num_communities
+    ) + np.bincount(tgt_comm, weights=weights, minlength=num_communities)
+
+    code_of_community = {comm: code for code, comm in enumerate(community_ids)}
     return {
         comm: _modularity_component(
-            degree_sums_within[comm],
-            degree_sums_for[comm],
+            float(degree_sums_within[code_of_community[comm]]),
+            float(degree_sums_for[code_of_community[comm]]),
             total_edge_weight,
             resolution,
         )
+        if comm in code_of_community
+        else 0.0
         for comm in communities
     }
 
@@ -209,8 +210,9 @@ def calculate_lcc_modularity(
     use_root_modularity: bool = True,
 ) -> float:
     """Calculate modularity of the largest connected component of the graph."""
-    lcc_nodes = largest_connected_component(edges)
-    lcc_edges = edges[edges["source"].isin(lcc_nodes) & edges["target"].isin(lcc_nodes)]
+    source_codes, target_codes, titles = factorize_nodes(edges)
+    labels = component_labels(source_codes, target_codes, len(titles))
+    lcc_edges = edges.loc[labels[source_codes] == 0]
     if use_root_modularity:
         return calculate_root_modularity(
             lcc_edges, max_cluster_size=max_cluster_size, random_seed=random_seed
@@ -231,32 +233,37 @@ def calculate_weighted_modularity(
 
     Modularity = sum(component_modularity * component_size) / total_nodes.
     """
-    components = connected_components(edges)
-    filtered = [c for c in components if len(c) > min_connected_component_size]
+    source_codes, target_codes, titles = factorize_nodes(edges)
+    labels = component_labels(source_codes, target_codes, len(titles))
+    sizes = np.bincount(labels)
+    filtered = np.flatnonzero(sizes > min_connected_component_size)
     if len(filtered) == 0:
         # Fall back to the whole graph
-        filtered = [set(edges["source"].unique()).union(set(edges["target"].unique()))]
+        if len(titles) <= min_connected_component_size:
+            return 0.0
+        return calculate_graph_modularity(
+            edges,
+            max_cluster_size=max_cluster_size,
+            random_seed=random_seed,
+            use_root_modularity=use_root_modularity,
+        )
+
+    # Group edge rows by component once, keeping their original order in each group
+    edge_labels = labels[source_codes]
+    order = np.argsort(edge_labels, kind="stable")
+    bounds = np.searchsorted(edge_labels[order], np.arange(len(sizes) + 1))
 
-    total_nodes = sum(len(c) for c in filtered)
+    total_nodes = int(sizes[filtered].sum())
     total_modularity = 0.0
     for component in filtered:
-        if len(component) > min_connected_component_size:
-            sub_edges = edges[
-                edges["source"].isin(component) & edges["target"].isin(component)
-            ]
-            if use_root_modularity:
-                mod = calculate_root_modularity(
-                    sub_edges,
-                    max_cluster_size=max_cluster_size,
-                    random_seed=random_seed,
-                )
-            else:
-                mod = calculate_leaf_modularity(
-                    sub_edges,
-                    max_cluster_size=max_cluster_size,
-                    random_seed=random_seed,
-                )
-            total_modularity += mod * len(component) / total_nodes
+        sub_edges = edges.iloc[order[bounds[component] : bounds[component + 1]]]
+        mod = calculate_graph_modularity(
+            sub_edges,
+            max_cluster_size=max_cluster_size,
+            random_seed=random_seed,
+            use_root_modularity=use_root_modularity,
+        )
+        total_modularity += mod * int(sizes[component]) / total_nodes
     return total_modularity
 
 
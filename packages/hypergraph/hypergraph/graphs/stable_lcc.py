@@ -13,10 +13,12 @@ regardless of the original row order.  This is achieved by:
 """
 
 import html
+from typing import cast
 
+import numpy as np
 import pandas as pd
 
-from hypergraph.graphs.connected_components import largest_connected_component
+from hypergraph.graphs.connected_components import component_labels, factorize_nodes
 
 
 def stable_lcc(
@@ -46,30 +48,53 @@ def stable_lcc(
 
     # 1. Normalize node names
     edges = relationships.copy()
-    edges[source_column] = edges[source_column].apply(_normalize_name)
-    edges[target_column] = edges[target_column].apply(_normalize_name)
+    num_edges = len(edges)
+    names = normalize_names(
+        cast(
+            "pd.Series",
+            pd.concat([edges[source_column], edges[target_column]], ignore_index=True),
+        )
+    )
+    edges[source_column] = names[:num_edges]
+    edges[target_column] = names[num_edges:]
 
     # 2. Filter to the largest connected component
-    lcc_nodes = largest_connected_component(
+    source_codes, target_codes, titles = factorize_nodes(
         edges, source_column=source_column, target_column=target_column
     )
-    edges = edges[
-        edges[source_column].isin(lcc_nodes) & edges[target_column].isin(lcc_nodes)
-    ]
-
-    # 3. Stabilize edge direction: lesser node always first
-    swapped = edges[source_column] > edges[target_column]
+    labels = component_labels(source_codes, target_codes, len(titles))
+    rows = np.flatnonzero(labels[source_codes] == 0)
+
+    # 3. Stabilize edge direction: lesser node always first. Node ranks follow
+    # the sorted order of their names, so edges can be compared as integers.
+    rank = np.empty(len(titles), dtype=np.int64)
+    rank[np.argsort(titles.to_numpy(), kind="stable")] = np.arange(len(titles))
+    source_rank = rank[source_codes[rows]]
+    target_rank = rank[target_codes[rows]]
+    swapped = source_rank > target_rank
+
+    # 4. Deduplicate edges that were reversed pairs in the original data, keeping
+    # the first row, and 5. sort for deterministic order
+    pair_keys = np.minimum(source_rank, target_rank) * len(titles) + np.maximum(
+        source_rank, target_rank
+    )
+    _, first_rows = np.unique(pair_keys, return_index=True)
+    edges = edges.iloc[rows[first_rows]]
+    swapped = swapped[first_rows]
     edges.loc[swapped, [source_column, target_column]] = edges.loc[
         swapped, [target_column, source_column]
     ].to_numpy()
+    return edges.reset_index(drop=True)
 
-    # 4. Deduplicate edges that were reversed pairs in the original data
-    edges = edges.drop_duplicates(subset=[source_column, target_column])
 
-    # 5. Sort for deterministic order
-    return edges.sort_values([source_column, target_column]).reset_index(drop=True)
+def normalize_names(names: pd.Series) -> np.ndarray:
+    """Normalize node names: HTML unescape, uppercase, strip whitespace.
 
-
-def _normalize_name(name: str) -> str:
-    """Normalize a node name: HTML unescape, uppercase, strip whitespace."""
-    return html.unescape(name).upper().strip()
+    Each distinct name is normalized once, and only names containing an
+    entity reference go through `html.unescape`.
+    """
+    codes, uniques = pd.factorize(names)
+    normalized = pd.Series(uniques, dtype=object)
+    escaped = normalized.str.contains("&", regex=False)
+    normalized.loc[escaped] = normalized.loc[escaped].map(html.unescape)
+    return normalized.str.upper().str.strip().to_numpy()[codes]
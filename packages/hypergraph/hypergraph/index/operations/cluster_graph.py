@@ -7,6 +7,7 @@ import logging
 
 import pandas as pd
 
+from hypergraph.graphs.edge_list import normalize_edges, sorted_edge_list
 from hypergraph.graphs.hierarchical_leiden import hierarchical_leiden
 from hypergraph.graphs.stable_lcc import stable_lcc
 
@@ -23,30 +24,33 @@ def cluster_graph(
     seed: int | None = None,
 ) -> Communities:
     """Apply a hierarchical clustering algorithm to a relationships DataFrame."""
-    node_id_to_community_map, parent_mapping = _compute_leiden_communities(
+    partitions = _compute_leiden_communities(
         edges=edges,
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
     )
-
-    levels = sorted(node_id_to_community_map.keys())
-
-    clusters: dict[int, dict[int, list[str]]] = {}
-    for level in levels:
-        result = {}
-        clusters[level] = result
-        for node_id, raw_community_id in node_id_to_community_map[level].items():
-            community_id = raw_community_id
-            if community_id not in result:
-                result[community_id] = []
-            result[community_id].append(node_id)
-
-    results: Communities = []
-    for level in clusters:
-        for cluster_id, nodes in clusters[level].items():
-            results.append((level, cluster_id, parent_mapping[cluster_id], nodes))
-    return results
+    if partitions.empty:
+        return []
+
+    # Levels ascending; clusters and their nodes in the order Leiden reported them
+    partitions = partitions.sort_values("level", kind="stable")
+    parents = partitions.drop_duplicates("cluster", keep="last").set_index("cluster")[
+        "parent"
+    ]
+    clusters = partitions.groupby(["level", "cluster"], sort=False)["node"].agg(list)
+
+    levels = clusters.index.get_level_values("level").tolist()
+    cluster_ids = clusters.index.get_level_values("cluster")
+    return list(
+        zip(
+            levels,
+            cluster_ids.tolist(),
+            parents.loc[cluster_ids].tolist(),
+            clusters.tolist(),
+            strict=True,
+        )
+    )
 
 
 # Taken from graph_intelligence & adapted
@@ -55,37 +59,31 @@ def _compute_leiden_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
-) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
-    """Return Leiden root communities and their hierarchy mapping."""
-    edge_df = edges.copy()
+) -> pd.DataFrame:
+    """Return the Leiden partitions as `level`, `node`, `cluster` and `parent` columns.
 
+    Clusters without a parent have a parent of -1.
+    """
     # Normalize edge direction and deduplicate (undirected graph).
     # NX deduplicates reversed pairs keeping the last row's attributes,
     # so we replicate that by normalizing direction then keeping last.
-    lo = edge_df[["source", "target"]].min(axis=1)
-    hi = edge_df[["source", "target"]].max(axis=1)
-    edge_df = edge_df.assign(source=lo, target=hi)
-    edge_df = edge_df.drop_duplicates(subset=["source", "target"], keep="last")
+    edge_df = normalize_edges(edges)
 
     if use_lcc:
         edge_df = stable_lcc(edge_df)
 
-    edge_list: list[tuple[str, str, float]] = sorted(
-        (str(row["source"]), str(row["target"]), float(row.get("weight", 1.0)))
-        for _, row in edge_df.iterrows()
-    )
-
     community_mapping = hierarchical_leiden(
-        edge_list, max_cluster_size=max_cluster_size, random_seed=seed
+        sorted_edge_list(edge_df), max_cluster_size=max_cluster_size, random_seed=seed
+    )
+    return pd.DataFrame(
+        {
+            "level": [partition.level for partition in community_mapping],
+            "node": [partition.node for partition in community_mapping],
+            "cluster": [partition.cluster for partition in community_mapping],
+            "parent": [
+                partition.parent_cluster if partition.parent_cluster is not None else -1
+                for partition in community_mapping
+            ],
+        },
+        columns=pd.Index(["level", "node", "cluster", "parent"]),
     )
-    results: dict[int, dict[str, int]] = {}
-    hierarchy: dict[int, int] = {}
-    for partition in community_mapping:
-        results[partition.level] = results.get(partition.level, {})
-        results[partition.level][partition.node] = partition.cluster
-
-        hierarchy[partition.cluster] = (
-            partition.parent_cluster if partition.parent_cluster is not None else -1
-        )
-
-    return results, hierarchy
@@ -105,8 +105,7 @@ def _create_text_batches(
     current_batch = []
     current_batch_tokens = 0
 
-    for text in texts:
-        token_count = tokenizer.num_tokens(text)
+    for text, token_count in zip(texts, tokenizer.num_tokens_batch(texts), strict=True):
         if (
             len(current_batch) >= max_batch_size
             or current_batch_tokens + token_count > max_batch_tokens
@@ -17,7 +17,7 @@ from hypergraph.index.operations.extract_covariates.typing import (
     Covariate,
     CovariateExtractionResult,
 )
-from hypergraph.index.utils.derive_from_rows import derive_from_rows
+from hypergraph.index.utils.derive_from_rows import derive_from_rows_stream
 
 if TYPE_CHECKING:
     from hypergraph_llm.completion import LLMCompletion
@@ -57,15 +57,20 @@ async def extract_covariates(
             for item in result.covariate_data
         ]
 
-    results = await derive_from_rows(
-        input,
-        run_strategy,
-        callbacks,
-        num_threads=num_threads,
-        async_type=async_type,
-        progress_msg="extract covariates progress: ",
-    )
-    return pd.DataFrame([item for row in results for item in row or []])
+    # Collect claim rows as they complete, keeping them in input row order
+    results: dict[int, list[dict[str, Any]]] = {
+        position: result
+        async for position, result in derive_from_rows_stream(
+            input,
+            run_strategy,
+            callbacks,
+            num_threads=num_threads,
+            async_type=async_type,
+            progress_msg="extract covariates progress: ",
+        )
+        if result
+    }
+    return pd.DataFrame([item for p in sorted(results) for item in results[p]])
 
 
 def create_row_from_claim_data(row, covariate_data: Covariate, covariate_type: str):
@@ -0,0 +1,172 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Checkpoint graph extraction results in output storage, one row per text unit."""
+
+import json
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from hypergraph_storage.tables.table import Table
+    from hypergraph_storage.tables.table_provider import TableProvider
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = "extract_graph_checkpoint"
+"""Name of the checkpoint table in output storage."""
+
+FLUSH_INTERVAL = 1_000
+"""Number of text units written before the checkpoint is flushed to storage."""
+
+FLUSH_SECONDS = 60.0
+"""Seconds after which the text units written are flushed, however few they are."""
+
+
+class ExtractGraphCheckpoint:
+    """Persist the entities and relationships extracted from each text unit.
+
+    Results are appended to one table opened for the whole run, and flushed
+    to storage every `flush_interval` text units or `flush_seconds`, whichever
+    comes first, so an interrupted run loses at most one interval of work and
+    a resumed run only extracts the missing text units. Each flush may store
+    its rows in a separate fragment; closing the checkpoint compacts them into
+    a single table, so a later resume reads one file.
+    """
+
+    def __init__(
+        self,
+        table_provider: "TableProvider",
+        table_name: str = CHECKPOINT_TABLE,
+        flush_interval: int = FLUSH_INTERVAL,
+        flush_seconds: float = FLUSH_SECONDS,
+    ) -> None:
+        self._table_provider = table_provider
+        self._table_name = table_name
+        self._flush_interval = flush_interval
+        self._flush_seconds = flush_seconds
+        self._table: Table | None = None
+        self._truncate = True
+        self._pending = 0
+        self._flushes = 0
+        self._appending = False
+        self._last_flush = time.monotonic()
+
+    async def start(self, resume: bool) -> set[str]:
+        """Prepare the checkpoint for a run and return the ids already extracted.
+
+        A fresh run replaces the checkpoint; a resumed run appends to it.
+        """
+        self._truncate = not resume
+        self._flushes = 0
+        self._appending = False
+        if not resume or not await self._table_provider.has(self._table_name):
+            return set()
+        self._appending = True
+        checkpoint = await self._table_provider.read_dataframe(
+            self._table_name, columns=["id"]
+        )
+        return set(checkpoint["id"])
+
+    async def write(
+        self,
+        text_unit_id: str,
+        entities: pd.DataFrame,
+        relationships: pd.DataFrame,
+    ) -> None:
+        """Append the extraction results of a single text unit."""
+        if self._table is None:
+            self._table = self._table_provider.open(
+                self._table_name, truncate=self._truncate
+            )
+            self._last_flush = time.monotonic()
+        await self._table.write({
+            "id": text_unit_id,
+            "entities": _dumps(entities),
+            "relationships": _dumps(relationships),
+        })
+        self._pending += 1
+        if (
+            self._pending >= self._flush_interval
+            or time.monotonic() - self._last_flush >= self._flush_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the results appended since the last flush to storage."""
+        if self._table is None or self._pending == 0:
+            return
+        await self._table.flush()
+        self._pending = 0
+        self._flushes += 1
+        self._last_flush = time.monotonic()
+
+    async def close(self) -> None:
+        """Flush the remaining results and close the checkpoint table.
+
+        A table flushed more than once, or appended to by a resumed run, is
+        rewritten as a single table.
+        """
+        if self._table is None:
+            return
+        await self.flush()
+        await self._table.close()
+        self._table = None
+        if self._flushes > 1 or self._appending:
+            checkpoint = await self._table_provider.read_dataframe(self._table_name)
+            await self._table_provider.write_dataframe(
+                self._table_name,
+                checkpoint.drop_duplicates(subset=["id"], keep="last"),
+            )
+        # Later writes append to the table written by this run
+        self._truncate = False
+        self._flushes = 0
+        self._appending = True
+
+    async def read(
+        self, text_unit_ids: list[str]
+    ) -> tuple[list[pd.DataFrame], list[pd.DataFrame]]:
+        """Read the checkpointed results of the given text units, in their order.
+
+        Text units missing from the checkpoint are skipped, and rows left over
+        from other runs are ignored.
+        """
+        if not await self._table_provider.has(self._table_name):
+            return [], []
+        checkpoint = await self._table_provider.read_dataframe(
+            self._table_name, filters=[("id", "in", text_unit_ids)]
+        )
+        position = pd.Series(range(len(text_unit_ids)), index=text_unit_ids)
+        checkpoint = checkpoint.assign(
+            position=position.reindex(checkpoint["id"]).to_numpy()
+        )
+        checkpoint = (
+            checkpoint
+            .dropna(subset=["position"])
+            .drop_duplicates(subset=["id"], keep="last")
+            .sort_values("position", kind="stable")
+        )
+        logger.info(
+            "Read %d of %d text units from %s",
+            len(checkpoint),
+            len(text_unit_ids),
+            self._table_name,
+        )
+        return (
+            [_loads(value) for value in checkpoint["entities"]],
+            [_loads(value) for value in checkpoint["relationships"]],
+        )
+
+
+def _dumps(df: pd.DataFrame) -> str:
+    """Serialize a DataFrame to JSON without losing its columns or float precision."""
+    return json.dumps(df.to_dict(orient="split", index=False), ensure_ascii=False)
+
+
+def _loads(value: str) -> pd.DataFrame:
+    """Deserialize a DataFrame written by `_dumps`."""
+    split = json.loads(value)
+    return pd.DataFrame(split["data"], columns=split["columns"])
@@ -10,8 +10,11 @@ import pandas as pd
 
 from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
 from hypergraph.config.enums import AsyncType
+from hypergraph.index.operations.extract_graph.checkpoint import (
+    ExtractGraphCheckpoint,
+)
 from hypergraph.index.operations.extract_graph.graph_extractor import GraphExtractor
-from hypergraph.index.utils.derive_from_rows import derive_from_rows
+from hypergraph.index.utils.derive_from_rows import derive_from_rows_stream
 
 if TYPE_CHECKING:
     from hypergraph_llm.completion import LLMCompletion
@@ -33,8 +36,15 @@ async def extract_graph(
     async_type: AsyncType,
     strict_entity_types: bool = False,
     strict_relationship_types: bool = False,
+    checkpoint: ExtractGraphCheckpoint | None = None,
+    resume: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Extract a graph from a piece of text using a language model."""
+    """Extract a graph from a piece of text using a language model.
+
+    With a checkpoint, the results of each text unit are appended to it as they
+    complete and the graph is merged from the checkpoint. With `resume`, only
+    the text units missing from the checkpoint are extracted.
+    """
     num_started = 0
 
     async def run_strategy(row):
@@ -55,24 +65,55 @@ async def extract_graph(
         num_started += 1
         return result
 
-    results = await derive_from_rows(
-        text_units,
-        run_strategy,
-        callbacks,
-        num_threads=num_threads,
-        async_type=async_type,
-        progress_msg="extract graph progress: ",
-    )
-
-    entity_dfs = []
-    relationship_dfs = []
-    for result in results:
-        if result:
-            entity_dfs.append(result[0])
-            relationship_dfs.append(result[1])
+    pending = text_units
+    if checkpoint is not None:
+        completed = await checkpoint.start(resume)
+        if completed:
+            pending = text_units.loc[
+                ~text_units.loc[:, id_column].isin(list(completed))
+            ]
+            logger.info(
+                "Resuming graph extraction: %d of %d text units already extracted",
+                len(text_units) - len(pending),
+                len(text_units),
+            )
+    pending_ids = pending.loc[:, id_column].to_numpy()
+
+    # Collect results as they complete, then merge in text unit order so the
+    # description lists do not depend on completion order
+    entity_dfs: dict[int, pd.DataFrame] = {}
+    relationship_dfs: dict[int, pd.DataFrame] = {}
+    try:
+        async for position, result in derive_from_rows_stream(
+            pending,
+            run_strategy,
+            callbacks,
+            num_threads=num_threads,
+            async_type=async_type,
+            progress_msg="extract graph progress: ",
+        ):
+            if not result:
+                continue
+            if checkpoint is not None:
+                await checkpoint.write(pending_ids[position], *result)
+            else:
+                entity_dfs[position] = result[0]
+                relationship_dfs[position] = result[1]
+    finally:
+        # Keep the completed text units even if extraction failed
+        if checkpoint is not None:
+            await checkpoint.close()
+
+    if checkpoint is not None:
+        entity_list, relationship_list = await checkpoint.read(
+            text_units[id_column].tolist()
+        )
+    else:
+        entity_list = [entity_dfs[p] for p in sorted(entity_dfs)]
+        relationship_list = [relationship_dfs[p] for p in sorted(relationship_dfs)]
 
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+    entities = _merge_entities(entity_list)
+    relationships = _merge_relationships(relationship_list)
 
     return (entities, relationships)
 
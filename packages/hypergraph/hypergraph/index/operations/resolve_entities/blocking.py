@@ -0,0 +1,217 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Candidate blocking for entity resolution.
+
+Only titles that share a blocking key end up in the same block, so the LLM sees
+small groups of plausible duplicates instead of every title in the graph.
+Blocks are built in three steps:
+
+1. Exact keys: the normalized title, its significant tokens and its acronym.
+2. MinHash LSH over character n-grams, verified by their Jaccard similarity.
+3. The transitive closure of 1 and 2, split into blocks of bounded size.
+
+Every step is deterministic, so the prompt of a block (and therefore its cache
+key) is stable across runs.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+
+import numpy as np
+
+from hypergraph.graphs.connected_components import component_labels
+
+MIN_TOKEN_LENGTH = 3
+"""Shorter tokens (articles, initials, ...) are not used as blocking keys."""
+
+NGRAM_SIZE = 3
+"""Size of the character n-grams compared by MinHash."""
+
+NUM_PERMUTATIONS = 32
+"""Number of MinHash permutations, split into LSH bands."""
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_SEED = 0xDEADBEEF
+
+
+def build_blocks(
+    titles: list[str],
+    max_block_size: int,
+    similarity_threshold: float,
+) -> list[list[str]]:
+    """Group entity titles into blocks of plausible duplicates.
+
+    Parameters
+    ----------
+    titles : list[str]
+        The unique entity titles.
+    max_block_size : int
+        The maximum number of titles in a block. Blocking keys shared by more
+        titles than this are considered too common to be informative.
+    similarity_threshold : float
+        The minimum Jaccard similarity of the character n-grams of two titles
+        for them to be candidates.
+
+    Returns
+    -------
+    list[list[str]]
+        Blocks of at least two titles, each sorted by normalized title.
+    """
+    if len(titles) < 2:
+        return []
+
+    normalized = [" ".join(_tokenize(title)) for title in titles]
+    pairs = _key_pairs(normalized, max_block_size)
+    pairs.extend(_similar_pairs(normalized, max_block_size, similarity_threshold))
+    if not pairs:
+        return []
+
+    sources, targets = np.array(pairs, dtype=np.int32).T
+    labels = component_labels(sources, targets, len(titles))
+    members: dict[int, list[int]] = defaultdict(list)
+    for index, label in enumerate(labels.tolist()):
+        members[label].append(index)
+
+    blocks = []
+    for indices in members.values():
+        if len(indices) < 2:
+            continue
+        indices.sort(key=lambda index: (normalized[index], titles[index]))
+        for start in range(0, len(indices), max_block_size):
+            block = [titles[index] for index in indices[start : start + max_block_size]]
+            if len(block) >= 2:
+                blocks.append(block)
+    return sorted(blocks)
+
+
+def _tokenize(title: str) -> list[str]:
+    """Split a title into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(title.casefold())
+
+
+def _blocking_keys(normalized: str) -> set[str]:
+    """Return the exact-match blocking keys of a normalized title."""
+    tokens = normalized.split()
+    if not tokens:
+        return set()
+    significant = [token for token in tokens if len(token) >= MIN_TOKEN_LENGTH]
+    keys = {f"title:{''.join(tokens)}"}
+    keys.update(f"token:{token}" for token in significant)
+    if len(significant) > 1:
+        keys.add(f"acronym:{''.join(token[0] for token in significant)}")
+    elif len(tokens) == 1:
+        keys.add(f"acronym:{tokens[0]}")
+    return keys
+
+
+def _key_pairs(normalized: list[str], max_block_size: int) -> list[tuple[int, int]]:
+    """Link the titles sharing an exact blocking key.
+
+    Identical normalized titles are always linked; token and acronym keys
+    shared by more than `max_block_size` titles are skipped.
+    """
+    groups: dict[str, list[int]] = defaultdict(list)
+    for index, title in enumerate(normalized):
+        for key in _blocking_keys(title):
+            groups[key].append(index)
+
+    pairs = []
+    for key, indices in groups.items():
+        if len(indices) < 2:
+            continue
+        if len(indices) > max_block_size and not key.startswith("title:"):
+            continue
+        pairs.extend((indices[0], other) for other in indices[1:])
+    return pairs
+
+
+def _similar_pairs(
+    normalized: list[str], max_block_size: int, similarity_threshold: float
+) -> list[tuple[int, int]]:
+    """Find pairs of titles with similar character n-grams using MinHash LSH."""
+    ngrams = [_ngrams(title) for title in normalized]
+    owners = np.repeat(
+        np.arange(len(ngrams)), [len(title_ngrams) for title_ngrams in ngrams]
+    )
+    if len(owners) == 0:
+        return []
+    hashes = np.fromiter(
+        (
+            zlib.crc32(ngram.encode())
+            for title_ngrams in ngrams
+            for ngram in title_ngrams
+        ),
+        dtype=np.uint64,
+        count=len(owners),
+    )
+    starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+    has_ngrams = owners[starts]
+
+    rng = np.random.default_rng(_SEED)
+    multipliers = rng.integers(1, 1 << 31, NUM_PERMUTATIONS, dtype=np.uint64)
+    offsets = rng.integers(0, _MERSENNE_PRIME, NUM_PERMUTATIONS, dtype=np.uint64)
+    signatures = np.stack(
+        [
+            np.minimum.reduceat(
+                (multiplier * hashes + offset) % np.uint64(_MERSENNE_PRIME), starts
+            )
+            for multiplier, offset in zip(multipliers, offsets, strict=True)
+        ],
+        axis=1,
+    )
+
+    rows = _rows_per_band(similarity_threshold)
+    candidates: set[tuple[int, int]] = set()
+    for band in range(NUM_PERMUTATIONS // rows):
+        _, buckets = np.unique(
+            signatures[:, band * rows : (band + 1) * rows],
+            axis=0,
+            return_inverse=True,
+        )
+        buckets = buckets.reshape(-1)
+        sizes = np.bincount(buckets)[buckets]
+        colliding = np.flatnonzero((sizes >= 2) & (sizes <= max_block_size))
+        colliding = colliding[np.argsort(buckets[colliding], kind="stable")]
+        bounds = np.flatnonzero(np.diff(buckets[colliding])) + 1
+        for bucket in np.split(colliding, bounds):
+            candidates.update(combinations(has_ngrams[bucket].tolist(), 2))
+
+    sets = [set(title_ngrams) for title_ngrams in ngrams]
+    return [
+        (first, second)
+        for first, second in sorted(candidates)
+        if _jaccard(sets[first], sets[second]) >= similarity_threshold
+    ]
+
+
+def _ngrams(normalized: str) -> list[str]:
+    """Return the distinct character n-grams of a normalized title."""
+    if len(normalized) <= NGRAM_SIZE:
+        return [normalized] if normalized else []
+    return sorted({
+        normalized[start : start + NGRAM_SIZE]
+        for start in range(len(normalized) - NGRAM_SIZE + 1)
+    })
+
+
+def _rows_per_band(similarity_threshold: float) -> int:
+    """Pick the LSH band size whose detection threshold is closest to the target.
+
+    With `b` bands of `r` rows, pairs are likely to collide in at least one band
+    once their similarity exceeds roughly `(1 / b) ** (1 / r)`.
+    """
+    return min(
+        range(1, NUM_PERMUTATIONS + 1),
+        key=lambda rows: abs(
+            (1 / (NUM_PERMUTATIONS // rows)) ** (1 / rows) - similarity_threshold
+        ),
+    )
+
+
+def _jaccard(first: set[str], second: set[str]) -> float:
+    """Return the Jaccard similarity of two sets."""
+    return len(first & second) / len(first | second)
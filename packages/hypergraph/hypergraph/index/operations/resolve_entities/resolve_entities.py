@@ -7,12 +7,16 @@ Identifies entities with different surface forms that refer to the same
 real-world entity (e.g. "Ahab" and "Captain Ahab") and unifies their titles.
 """
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
+from hypergraph.config.defaults import hypergraph_config_defaults
+from hypergraph.index.operations.resolve_entities.blocking import build_blocks
+from hypergraph.logger.progress import ProgressTicker, progress_ticker
 
 if TYPE_CHECKING:
     from hypergraph_llm.completion import LLMCompletion
@@ -27,13 +31,17 @@ async def resolve_entities(
     model: "LLMCompletion",
     prompt: str,
     num_threads: int,
+    max_block_size: int = hypergraph_config_defaults.entity_resolution.max_block_size,
+    similarity_threshold: float = hypergraph_config_defaults.entity_resolution.similarity_threshold,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Identify and merge duplicate entities with different surface forms.
 
-    Sends all unique entity titles to the LLM in a single call, parses the
-    response to build a rename mapping, then applies it to entity titles and
-    relationship source/target columns.  Each canonical entity receives an
-    ``alternative_names`` column listing all of its aliases.
+    Unique entity titles are first grouped into blocks of plausible duplicates
+    (see `build_blocks`), so titles without any candidate never reach the LLM.
+    Each block is sent in its own bounded prompt, concurrently, and the parsed
+    responses are combined into a rename mapping that is applied to entity
+    titles and relationship source/target columns.  Each canonical entity
+    receives an ``alternative_names`` column listing all of its aliases.
 
     Parameters
     ----------
@@ -48,7 +56,11 @@ async def resolve_entities(
     prompt : str
         The entity resolution prompt template (must contain ``{entity_list}``).
     num_threads : int
-        Concurrency limit for LLM calls (reserved for future use).
+        Concurrency limit for LLM calls.
+    max_block_size : int
+        The maximum number of entity titles sent in a single prompt.
+    similarity_threshold : float
+        The minimum character n-gram similarity for two titles to be candidates.
 
     Returns
     -------
@@ -63,47 +75,37 @@ async def resolve_entities(
     if len(titles) < 2:
         return entities, relationships
 
+    blocks = build_blocks(titles, max_block_size, similarity_threshold)
+    if not blocks:
+        logger.info("Entity resolution: no duplicate candidates found")
+        return entities, relationships
+
     logger.info(
-        "Running LLM entity resolution on %d unique entity names...", len(titles)
+        "Running LLM entity resolution on %d candidate blocks covering %d of %d unique entity names...",
+        len(blocks),
+        sum(len(block) for block in blocks),
+        len(titles),
     )
 
-    # Build numbered entity list for the prompt
-    entity_list = "\n".join(f"{i+1}. {name}" for i, name in enumerate(titles))
-    formatted_prompt = prompt.format(entity_list=entity_list)
-
-    try:
-        response = await model.completion_async(messages=formatted_prompt)
-        raw = (response.content or "").strip()
-    except Exception as e:
-        logger.warning("Entity resolution LLM call failed, skipping resolution: %s", e, exc_info=True)
-        return entities, relationships
-
-    if "NO_DUPLICATES" in raw:
-        logger.info("Entity resolution: no duplicates found")
-        return entities, relationships
+    semaphore = asyncio.Semaphore(num_threads)
+    ticker = progress_ticker(
+        callbacks.progress,
+        len(blocks),
+        description="Entity resolution progress: ",
+    )
+    block_groups = await asyncio.gather(*[
+        _resolve_block(block, model, prompt, ticker, semaphore) for block in blocks
+    ])
 
-    # Parse response and build rename mapping
+    # Build rename mapping
     rename_map: dict[str, str] = {}  # alias → canonical
     alternatives: dict[str, set[str]] = {}  # canonical → {aliases}
 
-    for line in raw.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or line.startswith("Where"):
-            continue
-        parts = [p.strip() for p in line.split(",")]
-        indices: list[int] = []
-        for p in parts:
-            digits = "".join(c for c in p if c.isdigit())
-            if digits:
-                idx = int(digits) - 1  # 1-indexed → 0-indexed
-                if 0 <= idx < len(titles):
-                    indices.append(idx)
-        if len(indices) >= 2:
-            canonical = titles[indices[0]]
+    for groups in block_groups:
+        for canonical, *aliases in groups:
             if canonical not in alternatives:
                 alternatives[canonical] = set()
-            for alias_idx in indices[1:]:
-                alias = titles[alias_idx]
+            for alias in aliases:
                 rename_map[alias] = canonical
                 alternatives[canonical].add(alias)
                 logger.info("  Entity resolution: '%s' → '%s'", alias, canonical)
@@ -136,3 +138,57 @@ async def resolve_entities(
             )
 
     return entities, relationships
+
+
+async def _resolve_block(
+    titles: list[str],
+    model: "LLMCompletion",
+    prompt: str,
+    ticker: ProgressTicker,
+    semaphore: asyncio.Semaphore,
+) -> list[list[str]]:
+    """Ask the LLM which titles of a block are duplicates.
+
+    Returns the duplicate groups, canonical title first.  A failed call
+    resolves nothing in its block instead of failing the whole resolution.
+    """
+    # Build numbered entity list for the prompt
+    entity_list = "\n".join(f"{i + 1}. {name}" for i, name in enumerate(titles))
+    formatted_prompt = prompt.format(entity_list=entity_list)
+
+    async with semaphore:
+        try:
+            response = await model.completion_async(messages=formatted_prompt)
+            raw = (response.content or "").strip()
+        except Exception as e:
+            logger.warning(
+                "Entity resolution LLM call failed, skipping block: %s",
+                e,
+                exc_info=True,
+            )
+            raw = "NO_DUPLICATES"
+        ticker(1)
+
+    if "NO_DUPLICATES" in raw:
+        return []
+    return _parse_groups(raw, titles)
+
+
+def _parse_groups(raw: str, titles: list[str]) -> list[list[str]]:
+    """Parse lines of 1-indexed entity numbers into groups of titles."""
+    groups: list[list[str]] = []
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", "Where")):
+            continue
+        parts = [p.strip() for p in line.split(",")]
+        indices: list[int] = []
+        for p in parts:
+            digits = "".join(c for c in p if c.isdigit())
+            if digits:
+                idx = int(digits) - 1  # 1-indexed → 0-indexed
+                if 0 <= idx < len(titles):
+                    indices.append(idx)
+        if len(indices) >= 2:
+            groups.append([titles[idx] for idx in indices])
+    return groups
@@ -42,8 +42,28 @@ def build_local_context(
     tokenizer: Tokenizer,
     callbacks: WorkflowCallbacks,
     max_context_tokens: int = 16_000,
+    num_workers: int = 1,
 ):
-    """Prep communities for report generation."""
+    """Prep communities for report generation.
+
+    With `num_workers` other than 1 the communities of every level are sharded across
+    a process pool, 0 using one worker per CPU.
+    """
+    if num_workers != 1:
+        from hypergraph.index.operations.summarize_communities.graph_context.process_pool import (
+            build_local_context_in_processes,
+        )
+
+        return build_local_context_in_processes(
+            nodes,
+            edges,
+            claims,
+            tokenizer,
+            callbacks,
+            max_context_tokens,
+            num_workers=num_workers,
+        )
+
     levels = get_levels(nodes, schemas.COMMUNITY_LEVEL)
 
     dfs = []
@@ -69,16 +89,47 @@ def _prepare_reports_at_level(
     max_context_tokens: int = 16_000,
 ) -> pd.DataFrame:
     """Prepare reports at a given level."""
-    # Filter and prepare node details
-    level_node_df = node_df[node_df[schemas.COMMUNITY_LEVEL] == level]
+    level_node_df, level_edge_df, level_claim_df = filter_level(
+        node_df, edge_df, claim_df, level
+    )
+    return prepare_community_contexts(
+        level_node_df, level_edge_df, level_claim_df, tokenizer, max_context_tokens
+    )
+
+
+def filter_level(
+    node_df: pd.DataFrame,
+    edge_df: pd.DataFrame,
+    claim_df: pd.DataFrame | None,
+    level: int,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame | None]:
+    """Select the nodes at a given level, the edges between them and their claims."""
+    level_node_df = node_df.loc[node_df[schemas.COMMUNITY_LEVEL] == level]
     logger.info("Number of nodes at level=%s => %s", level, len(level_node_df))
     nodes_set = set(level_node_df[schemas.TITLE])
 
-    # Filter and prepare edge details
-    level_edge_df = edge_df[
+    level_edge_df = edge_df.loc[
         edge_df.loc[:, schemas.EDGE_SOURCE].isin(nodes_set)
         & edge_df.loc[:, schemas.EDGE_TARGET].isin(nodes_set)
     ]
+
+    level_claim_df = None
+    if claim_df is not None:
+        level_claim_df = claim_df.loc[
+            claim_df.loc[:, schemas.CLAIM_SUBJECT].isin(nodes_set)
+        ]
+    return level_node_df, level_edge_df, level_claim_df
+
+
+def prepare_community_contexts(
+    level_node_df: pd.DataFrame,
+    level_edge_df: pd.DataFrame,
+    level_claim_df: pd.DataFrame | None,
+    tokenizer: Tokenizer,
+    max_context_tokens: int = 16_000,
+) -> pd.DataFrame:
+    """Build the context string of every community from the output of `filter_level`."""
+    # Prepare edge details
     level_edge_df.loc[:, schemas.EDGE_DETAILS] = level_edge_df.loc[  # type: ignore
         :,
         [
@@ -90,12 +141,6 @@ def _prepare_reports_at_level(
         ],
     ].to_dict(orient="records")
 
-    level_claim_df = pd.DataFrame()
-    if claim_df is not None:
-        level_claim_df = claim_df[
-            claim_df.loc[:, schemas.CLAIM_SUBJECT].isin(nodes_set)
-        ]
-
     # Merge node and edge details
     # Group edge details by node and aggregate into lists
     source_edges = (
@@ -148,7 +193,7 @@ def _prepare_reports_at_level(
     # Add ALL_CONTEXT column
     # Ensure schemas.CLAIM_DETAILS exists with the correct length
     # Merge claim details if available
-    if claim_df is not None:
+    if level_claim_df is not None:
         merged_node_df = merged_node_df.merge(
             level_claim_df.loc[
                 :, [schemas.CLAIM_SUBJECT, schemas.CLAIM_DETAILS]
@@ -171,7 +216,7 @@ def _prepare_reports_at_level(
         ]
         .assign(
             **{schemas.CLAIM_DETAILS: merged_node_df[schemas.CLAIM_DETAILS]}
-            if claim_df is not None
+            if level_claim_df is not None
             else {}
         )
         .to_dict(orient="records")
@@ -230,9 +275,9 @@ def build_level_context(
         invalid_context_df.loc[:, schemas.CONTEXT_STRING] = _sort_and_trim_context(
             invalid_context_df, tokenizer, max_context_tokens
         )
-        invalid_context_df[schemas.CONTEXT_SIZE] = invalid_context_df.loc[
-            :, schemas.CONTEXT_STRING
-        ].map(tokenizer.num_tokens)
+        invalid_context_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+            invalid_context_df[schemas.CONTEXT_STRING].tolist()
+        )
         invalid_context_df[schemas.CONTEXT_EXCEED_FLAG] = False
         return union(valid_context_df, invalid_context_df)
 
@@ -258,8 +303,8 @@ def build_level_context(
     )
 
     result = union(valid_context_df, community_df, remaining_df)
-    result[schemas.CONTEXT_SIZE] = result.loc[:, schemas.CONTEXT_STRING].map(
-        tokenizer.num_tokens
+    result[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        result[schemas.CONTEXT_STRING].tolist()
     )
 
     result[schemas.CONTEXT_EXCEED_FLAG] = False
@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Build local community contexts in a process pool."""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from hypergraph_llm.tokenizer import Tokenizer
+
+import hypergraph.data_model.schemas as schemas
+from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
+from hypergraph.index.operations.summarize_communities.graph_context.context_builder import (
+    filter_level,
+    prepare_community_contexts,
+)
+from hypergraph.index.operations.summarize_communities.utils import get_levels
+from hypergraph.logger.progress import progress_ticker
+
+logger = logging.getLogger(__name__)
+
+SHARDS_PER_WORKER = 4
+"""Shards per worker and level, so uneven community sizes still balance across workers."""
+
+_NODE_COLUMNS = [
+    schemas.TITLE,
+    schemas.COMMUNITY_ID,
+    schemas.COMMUNITY_LEVEL,
+    schemas.NODE_DEGREE,
+]
+_EDGE_COLUMNS = [
+    schemas.SHORT_ID,
+    schemas.EDGE_SOURCE,
+    schemas.EDGE_TARGET,
+    schemas.DESCRIPTION,
+    schemas.EDGE_DEGREE,
+]
+
+_worker_tokenizer: Tokenizer | None = None
+
+
+def build_local_context_in_processes(
+    nodes: pd.DataFrame,
+    edges: pd.DataFrame,
+    claims: pd.DataFrame | None,
+    tokenizer: Tokenizer,
+    callbacks: WorkflowCallbacks,
+    max_context_tokens: int = 16_000,
+    num_workers: int = 0,
+) -> pd.DataFrame:
+    """Build the local context of every community using a pool of worker processes.
+
+    The communities of each level are split into contiguous shards of community ids.
+    Each shard ships only the columns needed to rebuild its contexts, with the node and
+    claim detail dicts flattened into plain columns. Shard results are merged back in
+    level and community order, so the output matches `build_local_context` run in-process.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    node_columns = _flatten_details(nodes, schemas.NODE_DETAILS, _NODE_COLUMNS)
+    claim_columns = (
+        _flatten_details(claims, schemas.CLAIM_DETAILS, [schemas.CLAIM_SUBJECT])
+        if claims is not None
+        else None
+    )
+
+    levels = get_levels(nodes, schemas.COMMUNITY_LEVEL)
+    shards: list[tuple[int, int, pd.DataFrame, pd.DataFrame, pd.DataFrame | None]] = []
+    for level in levels:
+        level_node_df, level_edge_df, level_claim_df = filter_level(
+            node_columns, edges.loc[:, _EDGE_COLUMNS], claim_columns, level
+        )
+        shards.extend(
+            (level, index, *shard)
+            for index, shard in enumerate(
+                _shard_level(
+                    level_node_df,
+                    level_edge_df,
+                    level_claim_df,
+                    num_shards=num_workers * SHARDS_PER_WORKER,
+                )
+            )
+        )
+    logger.info(
+        "Building local contexts for %s levels in %s shards on %s workers",
+        len(levels),
+        len(shards),
+        num_workers,
+    )
+
+    results: dict[tuple[int, int], pd.DataFrame] = {}
+    tick = progress_ticker(callbacks.progress, len(shards))
+    with ProcessPoolExecutor(
+        max_workers=min(num_workers, max(len(shards), 1)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(tokenizer,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _build_shard, node_shard, edge_shard, claim_shard, max_context_tokens
+            ): (level, index)
+            for level, index, node_shard, edge_shard, claim_shard in shards
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            tick(1)
+    tick.done()
+
+    dfs = []
+    for level in levels:
+        level_df = pd.concat(
+            [result for key, result in sorted(results.items()) if key[0] == level],
+            ignore_index=True,
+        )
+        level_df.loc[:, schemas.COMMUNITY_LEVEL] = level
+        dfs.append(level_df)
+    return pd.concat(dfs)
+
+
+def _shard_level(
+    level_node_df: pd.DataFrame,
+    level_edge_df: pd.DataFrame,
+    level_claim_df: pd.DataFrame | None,
+    num_shards: int,
+) -> list[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame | None]]:
+    """Split a level into shards of contiguous community ids.
+
+    An edge goes to the shard of each of its endpoints, so edges between communities
+    in different shards are shipped to both.
+    """
+    community_ids = np.sort(np.asarray(level_node_df[schemas.COMMUNITY_ID].unique()))
+    num_shards = max(min(num_shards, len(community_ids)), 1)
+    shard_of_community = dict(
+        zip(
+            community_ids,
+            np.arange(len(community_ids)) * num_shards // max(len(community_ids), 1),
+            strict=True,
+        )
+    )
+    node_shard = level_node_df.loc[:, schemas.COMMUNITY_ID].map(shard_of_community)
+    shard_of_title = dict(
+        zip(level_node_df[schemas.TITLE], node_shard.to_numpy(), strict=True)
+    )
+    source_shard = (
+        level_edge_df.loc[:, schemas.EDGE_SOURCE].map(shard_of_title).to_numpy()
+    )
+    target_shard = (
+        level_edge_df.loc[:, schemas.EDGE_TARGET].map(shard_of_title).to_numpy()
+    )
+    claim_shard = (
+        level_claim_df.loc[:, schemas.CLAIM_SUBJECT].map(shard_of_title).to_numpy()
+        if level_claim_df is not None
+        else None
+    )
+
+    return [
+        (
+            level_node_df.loc[node_shard.to_numpy() == shard],
+            level_edge_df.loc[(source_shard == shard) | (target_shard == shard)],
+            level_claim_df.loc[claim_shard == shard]
+            if level_claim_df is not None
+            else None,
+        )
+        for shard in range(num_shards)
+    ]
+
+
+def _flatten_details(
+    df: pd.DataFrame, details_column: str, columns: list[str]
+) -> pd.DataFrame:
+    """Keep `columns` and expand the dicts of `details_column` into one column per key."""
+    details = pd.DataFrame(df[details_column].tolist(), index=df.index)
+    details.columns = [f"{details_column}.{key}" for key in details.columns]
+    return pd.concat([df.loc[:, columns], details], axis=1)
+
+
+def _unflatten_details(df: pd.DataFrame, details_column: str) -> pd.DataFrame:
+    """Collapse the columns written by `_flatten_details` back into a column of dicts."""
+    prefix = f"{details_column}."
+    flat_columns = [column for column in df.columns if column.startswith(prefix)]
+    details = df.loc[:, flat_columns]
+    details.columns = [column.removeprefix(prefix) for column in flat_columns]
+    result = df.drop(columns=flat_columns)
+    result[details_column] = pd.Series(
+        details.to_dict(orient="records"), index=result.index
+    )
+    return result
+
+
+def _init_worker(tokenizer: Tokenizer) -> None:
+    """Keep the tokenizer for every shard handled by this worker process."""
+    global _worker_tokenizer
+    _worker_tokenizer = tokenizer
+
+
+def _build_shard(
+    node_shard: pd.DataFrame,
+    edge_shard: pd.DataFrame,
+    claim_shard: pd.DataFrame | None,
+    max_context_tokens: int,
+) -> pd.DataFrame:
+    """Build the community contexts of a single shard inside a worker process."""
+    if _worker_tokenizer is None:
+        msg = "Worker process was not initialized with a tokenizer."
+        raise RuntimeError(msg)
+    return prepare_community_contexts(
+        _unflatten_details(node_shard, schemas.NODE_DETAILS),
+        edge_shard.copy(),
+        _unflatten_details(claim_shard, schemas.CLAIM_DETAILS)
+        if claim_shard is not None
+        else None,
+        _worker_tokenizer,
+        max_context_tokens,
+    )
@@ -2,6 +2,13 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import csv
+import io
+import math
+from collections.abc import Callable, Iterable
+from itertools import accumulate
+from typing import Any
+
 import pandas as pd
 from hypergraph_llm.tokenizer import Tokenizer
 
@@ -22,7 +29,14 @@ def sort_context(
     edge_target_column: str = schemas.EDGE_TARGET,
     claim_details_column: str = schemas.CLAIM_DETAILS,
 ) -> str:
-    """Sort context by degree in descending order, optimizing for performance."""
+    """Sort context by degree in descending order, optimizing for performance.
+
+    Edges are walked once to fix the order in which nodes, claims and edges join the
+    context. Each section's rows are rendered and tokenized once to keep a running
+    token count, which locates the cut-off without re-serializing the context after
+    every edge. The cut-off is confirmed against the exact token count of the rendered
+    context, so the output matches adding one edge at a time.
+    """
 
     def _get_context_string(
         entities: list[dict],
@@ -82,10 +96,10 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
-    # Deduplicate and build context incrementally
+    # Deduplicate, recording how many rows of each section are in use after each edge
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
-    context_string = ""
+    steps: list[tuple[int, int, int]] = [(0, 0, 0)]
 
     for edge in edges:
         source, target = edge[edge_source_column], edge[edge_target_column]
@@ -109,21 +123,146 @@ def sort_context(
             edge_ids.add(edge[schemas.SHORT_ID])
             sorted_edges.append(edge)
 
-        # Generate new context string
-        new_context_string = _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-        )
-        if (
-            max_context_tokens
-            and tokenizer.num_tokens(new_context_string) > max_context_tokens
-        ):
-            break
-        context_string = new_context_string
-
-    # Return the final context string
-    return context_string or _get_context_string(
-        sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+        steps.append((len(sorted_nodes), len(sorted_claims), len(sorted_edges)))
+
+    rendered: dict[int, str] = {}
+
+    def _render(step: int) -> str:
+        if step not in rendered:
+            num_nodes, num_claims, num_edges = steps[step]
+            rendered[step] = _get_context_string(
+                sorted_nodes[:num_nodes],
+                sorted_edges[:num_edges],
+                sorted_claims[:num_claims],
+                sub_community_reports,
+            )
+        return rendered[step]
+
+    num_steps = len(steps) - 1
+    if not max_context_tokens or num_steps == 0:
+        return _render(num_steps)
+
+    assembler = _ContextAssembler(
+        tokenizer,
+        fixed_tokens=tokenizer.num_tokens(_render(0)),
+        sections=[
+            _ContextSection("Entities", sorted_nodes, tokenizer),
+            _ContextSection("Claims", sorted_claims, tokenizer),
+            _ContextSection("Relationships", sorted_edges, tokenizer),
+        ],
+    )
+    first_over_budget = _first_step_over_budget(
+        num_steps,
+        estimate=lambda step: assembler.num_tokens(steps[step]) > max_context_tokens,
+        exceeds=lambda step: tokenizer.num_tokens(_render(step)) > max_context_tokens,
+    )
+
+    # Keep the last context that fit; the first edge is always kept, as before
+    return _render(first_over_budget - 1 or 1)
+
+
+class _ContextSection:
+    """A context section whose rows are rendered and tokenized once, on first use."""
+
+    def __init__(self, label: str, records: list[dict], tokenizer: Tokenizer):
+        self._label = label
+        self._records = records
+        self._tokenizer = tokenizer
+        self._header_tokens = 0
+        self._cumulative_tokens = [0]
+
+    def num_tokens(self, num_rows: int) -> int:
+        """Return the running token count of the section holding the first `num_rows` rows."""
+        if num_rows == 0:
+            return 0
+        if len(self._cumulative_tokens) == 1:
+            self._header_tokens = self._tokenizer.num_tokens(
+                f"-----{self._label}-----\n{_render_row(self._records[0].keys())}"
+            )
+        if len(self._cumulative_tokens) <= num_rows:
+            counts = self._tokenizer.num_tokens_batch([
+                _render_row(row.values())
+                for row in self._records[len(self._cumulative_tokens) - 1 : num_rows]
+            ])
+            self._cumulative_tokens.extend(
+                accumulate(counts, initial=self._cumulative_tokens.pop())
+            )
+        return self._header_tokens + self._cumulative_tokens[num_rows]
+
+
+class _ContextAssembler:
+    """Running token estimate of a context string built from pre-tokenized rows."""
+
+    def __init__(
+        self, tokenizer: Tokenizer, fixed_tokens: int, sections: list[_ContextSection]
+    ):
+        self._fixed_tokens = fixed_tokens
+        self._sections = sections
+        self._separator_tokens = tokenizer.num_tokens("\n\n")
+
+    def num_tokens(self, row_counts: tuple[int, ...]) -> int:
+        """Estimate the token count of the context holding the given rows per section."""
+        num_tokens = self._fixed_tokens
+        num_parts = 1 if self._fixed_tokens else 0
+        for section, num_rows in zip(self._sections, row_counts, strict=True):
+            if num_rows:
+                num_tokens += section.num_tokens(num_rows)
+                num_parts += 1
+        return num_tokens + self._separator_tokens * max(num_parts - 1, 0)
+
+
+def _render_row(values: Iterable[Any]) -> str:
+    """Render a single CSV row the way `DataFrame.to_csv` does."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow([
+        ""
+        if value is None or (isinstance(value, float) and math.isnan(value))
+        else value
+        for value in values
+    ])
+    return buffer.getvalue()
+
+
+def _first_step_over_budget(
+    num_steps: int,
+    estimate: Callable[[int], bool],
+    exceeds: Callable[[int], bool],
+) -> int:
+    """Return the first step whose context exceeds the budget, or `num_steps + 1`.
+
+    Adding rows never shrinks the token count, so `exceeds` is monotonic in the step.
+    The running estimate picks the starting point and a galloping search around it
+    confirms the boundary with a handful of exact checks.
+    """
+    checked: dict[int, bool] = {0: False, num_steps + 1: True}
+
+    def _over(step: int) -> bool:
+        if step not in checked:
+            checked[step] = exceeds(step)
+        return checked[step]
+
+    guess = next(
+        (step for step in range(1, num_steps + 1) if estimate(step)), num_steps + 1
     )
+    width = 1
+    if _over(guess):
+        low, high = guess - 1, guess
+        while _over(low):
+            low, high = max(low - width, 0), low
+            width *= 2
+    else:
+        low, high = guess, guess + 1
+        while not _over(high):
+            low, high = high, min(high + width, num_steps + 1)
+            width *= 2
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _over(middle):
+            high = middle
+        else:
+            low = middle
+    return high
 
 
 def parallel_sort_context_batch(
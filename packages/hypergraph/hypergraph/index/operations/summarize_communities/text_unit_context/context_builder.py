@@ -73,8 +73,8 @@ def build_local_context(
     context_df[schemas.CONTEXT_STRING] = context_df[schemas.ALL_CONTEXT].apply(
         lambda x: sort_context(x, tokenizer)
     )
-    context_df[schemas.CONTEXT_SIZE] = context_df[schemas.CONTEXT_STRING].apply(
-        lambda x: tokenizer.num_tokens(x)
+    context_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        context_df[schemas.CONTEXT_STRING].tolist()
     )
     context_df[schemas.CONTEXT_EXCEED_FLAG] = context_df[schemas.CONTEXT_SIZE].apply(
         lambda x: x > max_context_tokens
@@ -122,9 +122,9 @@ def build_level_context(
         ].apply(
             lambda x: sort_context(x, tokenizer, max_context_tokens=max_context_tokens)
         )
-        invalid_context_df.loc[:, [schemas.CONTEXT_SIZE]] = invalid_context_df[
-            schemas.CONTEXT_STRING
-        ].apply(lambda x: tokenizer.num_tokens(x))
+        invalid_context_df.loc[:, schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+            invalid_context_df[schemas.CONTEXT_STRING].tolist()
+        )
         invalid_context_df.loc[:, [schemas.CONTEXT_EXCEED_FLAG]] = False
 
         return pd.concat([valid_context_df, invalid_context_df])
@@ -207,8 +207,8 @@ def build_level_context(
     community_df[schemas.CONTEXT_STRING] = community_df[schemas.ALL_CONTEXT].apply(
         lambda x: build_mixed_context(x, tokenizer, max_context_tokens)
     )
-    community_df[schemas.CONTEXT_SIZE] = community_df[schemas.CONTEXT_STRING].apply(
-        lambda x: tokenizer.num_tokens(x)
+    community_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        community_df[schemas.CONTEXT_STRING].tolist()
     )
     community_df[schemas.CONTEXT_EXCEED_FLAG] = False
     community_df[schemas.COMMUNITY_LEVEL] = level
@@ -227,9 +227,9 @@ def build_level_context(
     remaining_df[schemas.CONTEXT_STRING] = cast(
         "pd.DataFrame", remaining_df[schemas.ALL_CONTEXT]
     ).apply(lambda x: sort_context(x, tokenizer, max_context_tokens=max_context_tokens))
-    remaining_df[schemas.CONTEXT_SIZE] = cast(
-        "pd.DataFrame", remaining_df[schemas.CONTEXT_STRING]
-    ).apply(lambda x: tokenizer.num_tokens(x))
+    remaining_df[schemas.CONTEXT_SIZE] = tokenizer.num_tokens_batch(
+        remaining_df[schemas.CONTEXT_STRING].tolist()
+    )
     remaining_df[schemas.CONTEXT_EXCEED_FLAG] = False
 
     return cast(
@@ -7,6 +7,9 @@ import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from hypergraph.index.operations.summarize_descriptions.typing import (
+    SummarizationStrategy,
+)
 from hypergraph.index.typing.error_handler import ErrorHandlerFn
 
 if TYPE_CHECKING:
@@ -52,20 +55,45 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length
         self._max_input_tokens = max_input_tokens
+        self._prompt_tokens: int | None = None
+
+    def plan(self, descriptions: list[str]) -> SummarizationStrategy:
+        """Decide how a description list is summarized, without calling the LLM.
+
+        A single description is used as-is. Otherwise the descriptions are summarized
+        in one call, unless the iterative reduction would run out of input tokens
+        before reaching the last description.
+        """
+        if len(descriptions) <= 1:
+            return SummarizationStrategy.Passthrough
+        if len(descriptions) == 2:
+            # The reduction never flushes before the last description
+            return SummarizationStrategy.Single
+        if self._prompt_tokens is None:
+            self._prompt_tokens = self._tokenizer.num_tokens(self._summarization_prompt)
+        leading_tokens = sum(
+            self._tokenizer.num_tokens(description)
+            for description in sorted(descriptions)[:-1]
+        )
+        if leading_tokens > self._max_input_tokens - self._prompt_tokens:
+            return SummarizationStrategy.MultiRound
+        return SummarizationStrategy.Single
 
     async def __call__(
         self,
         id: str | tuple[str, str],
         descriptions: list[str],
+        strategy: SummarizationStrategy | None = None,
     ) -> SummarizationResult:
         """Call method definition."""
         result = ""
-        if len(descriptions) == 0:
-            result = ""
-        elif len(descriptions) == 1:
-            result = descriptions[0]
-        else:
-            result = await self._summarize_descriptions(id, descriptions)
+        match strategy or self.plan(descriptions):
+            case SummarizationStrategy.Passthrough:
+                result = descriptions[0] if descriptions else ""
+            case SummarizationStrategy.Single:
+                result = await self._summarize_descriptions_with_llm(id, descriptions)
+            case SummarizationStrategy.MultiRound:
+                result = await self._summarize_descriptions(id, descriptions)
 
         return SummarizationResult(
             id=id,
@@ -5,8 +5,10 @@
 
 import asyncio
 import logging
+from collections import Counter
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
@@ -14,9 +16,10 @@ from hypergraph.index.operations.summarize_descriptions.description_summary_extr
     SummarizeExtractor,
 )
 from hypergraph.index.operations.summarize_descriptions.typing import (
-    SummarizedDescriptionResult,
+    SummarizationStrategy,
 )
-from hypergraph.logger.progress import ProgressTicker, progress_ticker
+from hypergraph.index.typing.stats import SummarizationStats
+from hypergraph.logger.progress import progress_ticker
 
 if TYPE_CHECKING:
     from hypergraph_llm.completion import LLMCompletion
@@ -33,97 +36,19 @@ async def summarize_descriptions(
     max_input_tokens: int,
     prompt: str,
     num_threads: int,
+    stats: SummarizationStats | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Summarize entity and relationship descriptions from an entity graph, using a language model."""
-
-    async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
-    ):
-        ticker_length = len(nodes) + len(edges)
-
-        ticker = progress_ticker(
-            callbacks.progress,
-            ticker_length,
-            description="Summarize entity/relationship description progress: ",
-        )
-
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in nodes.itertuples(index=False)
-        ]
-
-        node_results = await asyncio.gather(*node_futures)
-
-        node_descriptions = [
-            {
-                "title": result.id,
-                "description": result.description,
-            }
-            for result in node_results
-        ]
-
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
-        edge_descriptions = [
-            {
-                "source": result.id[0],
-                "target": result.id[1],
-                "description": result.description,
-            }
-            for result in edge_results
-        ]
-
-        entity_descriptions = pd.DataFrame(node_descriptions)
-        relationship_descriptions = pd.DataFrame(edge_descriptions)
-        return entity_descriptions, relationship_descriptions
-
-    async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
-        async with semaphore:
-            results = await run_summarize_descriptions(
-                id,
-                descriptions,
-                model,
-                max_summary_length,
-                max_input_tokens,
-                prompt,
-            )
-            ticker(1)
-        return results
-
-    semaphore = asyncio.Semaphore(num_threads)
+    """Summarize entity and relationship descriptions from an entity graph, using a language model.
 
-    return await get_summarized(entities_df, relationships_df, semaphore)
+    Each description list is planned before any LLM call is scheduled: single
+    descriptions pass through directly, lists that fit in `max_input_tokens`
+    are summarized in one call and only larger lists go through the iterative
+    reduction. When `stats` is given, the strategy counts are added to it.
 
-
-async def run_summarize_descriptions(
-    id: str | tuple[str, str],
-    descriptions: list[str],
-    model: "LLMCompletion",
-    max_summary_length: int,
-    max_input_tokens: int,
-    prompt: str,
-) -> SummarizedDescriptionResult:
-    """Run the graph intelligence entity extraction strategy."""
+    Nodes and edges share one bounded work queue drained by `num_threads`
+    workers, longest input first, so slow summaries start early instead of
+    forming a tail, and only a handful of work items exist at any time.
+    """
     extractor = SummarizeExtractor(
         model=model,
         summarization_prompt=prompt,
@@ -135,6 +60,90 @@ async def run_summarize_descriptions(
         max_summary_length=max_summary_length,
         max_input_tokens=max_input_tokens,
     )
+    strategy_counts: Counter[SummarizationStrategy] = Counter()
+
+    node_inputs = entities_df["description"].tolist()
+    edge_inputs = relationships_df["description"].tolist()
+    inputs = node_inputs + edge_inputs
+    titles = entities_df["title"].to_numpy()
+    sources = relationships_df["source"].to_numpy()
+    targets = relationships_df["target"].to_numpy()
+    summaries: list[str] = [""] * len(inputs)
+
+    ticker = progress_ticker(
+        callbacks.progress,
+        len(inputs),
+        description="Summarize entity/relationship description progress: ",
+    )
+    num_workers = max(num_threads, 1)
+    queue: asyncio.Queue[tuple[int, list[str], SummarizationStrategy] | None] = (
+        asyncio.Queue(maxsize=num_workers)
+    )
+
+    async def produce() -> None:
+        for index in _longest_first(inputs):
+            descriptions = sorted(set(inputs[index]))
+            strategy = extractor.plan(descriptions)
+            strategy_counts[strategy] += 1
+            if strategy == SummarizationStrategy.Passthrough:
+                # No LLM call, so there is no need to wait for a worker
+                summaries[index] = descriptions[0] if descriptions else ""
+                ticker(1)
+            else:
+                await queue.put((index, descriptions, strategy))
+        for _ in range(num_workers):
+            await queue.put(None)
+
+    def summary_id(index: int) -> str | tuple[str, str]:
+        if index < len(titles):
+            return str(titles[index])
+        index -= len(titles)
+        return (str(sources[index]), str(targets[index]))
+
+    async def work() -> None:
+        while (item := await queue.get()) is not None:
+            index, descriptions, strategy = item
+            result = await extractor(summary_id(index), descriptions, strategy)
+            summaries[index] = result.description
+            ticker(1)
 
-    result = await extractor(id=id, descriptions=descriptions)
-    return SummarizedDescriptionResult(id=result.id, description=result.description)
+    tasks = [asyncio.create_task(produce())]
+    tasks.extend(asyncio.create_task(work()) for _ in range(num_workers))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # A failed summary stops the producer and the remaining workers
+        for task in tasks:
+            task.cancel()
+
+    logger.info(
+        "Summarized descriptions: %d passthrough, %d single call, %d multi-round",
+        strategy_counts[SummarizationStrategy.Passthrough],
+        strategy_counts[SummarizationStrategy.Single],
+        strategy_counts[SummarizationStrategy.MultiRound],
+    )
+    if stats is not None:
+        stats.passthrough += strategy_counts[SummarizationStrategy.Passthrough]
+        stats.single += strategy_counts[SummarizationStrategy.Single]
+        stats.multi_round += strategy_counts[SummarizationStrategy.MultiRound]
+
+    entity_descriptions = pd.DataFrame({
+        "title": [str(title) for title in titles],
+        "description": summaries[: len(node_inputs)],
+    })
+    relationship_descriptions = pd.DataFrame({
+        "source": [str(source) for source in sources],
+        "target": [str(target) for target in targets],
+        "description": summaries[len(node_inputs) :],
+    })
+    return entity_descriptions, relationship_descriptions
+
+
+def _longest_first(inputs: list[list[str]]) -> list[int]:
+    """Return the input indices ordered by descending total description length."""
+    lengths = np.fromiter(
+        (sum(map(len, descriptions)) for descriptions in inputs),
+        dtype=np.int64,
+        count=len(inputs),
+    )
+    return np.argsort(-lengths, kind="stable").tolist()
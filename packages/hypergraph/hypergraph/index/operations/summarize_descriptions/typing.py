@@ -4,6 +4,7 @@
 """A module containing 'SummarizedDescriptionResult' model."""
 
 from dataclasses import dataclass
+from enum import StrEnum
 from typing import Any, NamedTuple
 
 
@@ -19,3 +20,14 @@ class DescriptionSummarizeRow(NamedTuple):
     """DescriptionSummarizeRow class definition."""
 
     graph: Any
+
+
+class SummarizationStrategy(StrEnum):
+    """How a list of descriptions is turned into a single description."""
+
+    Passthrough = "passthrough"
+    """Zero or one description, used as-is without calling the LLM."""
+    Single = "single"
+    """All descriptions fit in the input budget and are summarized in one call."""
+    MultiRound = "multi_round"
+    """Descriptions exceed the input budget and are reduced over several calls."""
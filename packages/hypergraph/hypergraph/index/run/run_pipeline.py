@@ -13,6 +13,7 @@ from typing import Any
 import pandas as pd
 from hypergraph_cache import create_cache
 from hypergraph_storage import create_storage
+from hypergraph_storage.tables.cached_table_provider import CachedTableProvider
 from hypergraph_storage.tables.table_provider import TableProvider
 from hypergraph_storage.tables.table_provider_factory import create_table_provider
 
@@ -39,6 +40,7 @@ async def run_pipeline(
     input_storage = create_storage(config.input_storage)
 
     output_storage = create_storage(config.output_storage)
+    storages = [input_storage, output_storage]
 
     output_table_provider = create_table_provider(config.table_provider, output_storage)
 
@@ -55,6 +57,7 @@ async def run_pipeline(
         logger.info("Running incremental indexing.")
 
         update_storage = create_storage(config.update_output_storage)
+        storages.append(update_storage)
         # we use this to store the new subset index, and will merge its content with the previous index
         update_timestamp = time.strftime("%Y%m%d-%H%M%S")
         timestamped_storage = update_storage.child(update_timestamp)
@@ -105,12 +108,25 @@ async def run_pipeline(
             state=state,
         )
 
-    async for table in _run_pipeline(
-        pipeline=pipeline,
-        config=config,
-        context=context,
-    ):
-        yield table
+    if config.table_cache.enabled:
+        context.output_table_provider = CachedTableProvider(
+            context.output_table_provider,
+            max_bytes=config.table_cache.max_bytes,
+            stats=context.stats.table_cache,
+        )
+
+    try:
+        async for table in _run_pipeline(
+            pipeline=pipeline,
+            config=config,
+            context=context,
+        ):
+            yield table
+    finally:
+        # Children share the connections of these storages
+        await cache.close()
+        for storage in storages:
+            await storage.close()
 
 
 async def _run_pipeline(
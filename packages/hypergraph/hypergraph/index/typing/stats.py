@@ -5,6 +5,8 @@
 
 from dataclasses import dataclass, field
 
+from hypergraph_storage.tables.cached_table_provider import TableCacheStats
+
 
 @dataclass
 class WorkflowMetrics:
@@ -23,6 +25,20 @@ class WorkflowMetrics:
     """Memory used by tracemalloc itself for tracking allocations."""
 
 
+@dataclass
+class SummarizationStats:
+    """Number of entity and relationship descriptions per summarization strategy."""
+
+    passthrough: int = field(default=0)
+    """Descriptions used as-is, without calling the LLM."""
+
+    single: int = field(default=0)
+    """Descriptions summarized in a single LLM call."""
+
+    multi_round: int = field(default=0)
+    """Descriptions reduced over several LLM calls."""
+
+
 @dataclass
 class PipelineRunStats:
     """Pipeline running stats."""
@@ -38,5 +54,11 @@ class PipelineRunStats:
     input_load_time: float = field(default=0)
     """Float representing the input load time."""
 
+    summarization: SummarizationStats = field(default_factory=SummarizationStats)
+    """Counts of description summarization strategies."""
+
     workflows: dict[str, WorkflowMetrics] = field(default_factory=dict)
     """Metrics for each workflow execution."""
+
+    table_cache: TableCacheStats = field(default_factory=TableCacheStats)
+    """Reads of output tables served from memory by the table cache."""
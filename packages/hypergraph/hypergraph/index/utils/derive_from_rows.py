@@ -1,14 +1,14 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing derive_from_rows, derive_from_rows_asyncio_threads, and derive_from_rows_asyncio methods."""
+"""A module containing derive_from_rows, derive_from_rows_stream, derive_from_rows_asyncio_threads, and derive_from_rows_asyncio methods."""
 
 import asyncio
 import inspect
 import logging
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
-from typing import Any, TypeVar, cast
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterator
+from typing import Any, TypeVar
 
 import pandas as pd
 
@@ -19,6 +19,8 @@ from hypergraph.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 ItemType = TypeVar("ItemType")
+Row = dict[Hashable, Any]
+"""The column values of a single row, keyed by column name."""
 
 
 class ParallelizationError(ValueError):
@@ -33,61 +35,41 @@ class ParallelizationError(ValueError):
 
 async def derive_from_rows(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks | None = None,
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
     progress_msg: str = "",
 ) -> list[ItemType | None]:
     """Apply a generic transform function to each row. Any errors will be reported and thrown."""
-    callbacks = callbacks or NoopWorkflowCallbacks()
-    match async_type:
-        case AsyncType.AsyncIO:
-            return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads, progress_msg
-            )
-        case AsyncType.Threaded:
-            return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads, progress_msg
-            )
-        case _:
-            msg = f"Unsupported scheduling type {async_type}"
-            raise ValueError(msg)
+    results: list[ItemType | None] = [None] * len(input)
+    async for position, result in derive_from_rows_stream(
+        input, transform, callbacks, num_threads, async_type, progress_msg
+    ):
+        results[position] = result
+    return results
 
 
 async def derive_from_rows_asyncio_threads(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
     progress_msg: str = "",
 ) -> list[ItemType | None]:
     """
-    Derive from rows asynchronously.
+    Derive from rows, calling the transform in worker threads.
 
-    This is useful for IO bound operations.
+    This is useful for blocking operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
-
-        async def execute_task(task: Coroutine) -> ItemType | None:
-            async with semaphore:
-                # fire off the thread
-                thread = await task
-                return await thread
-
-        return await asyncio.gather(*[execute_task(task) for task in tasks])
-
-    return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+    return await derive_from_rows(
+        input, transform, callbacks, num_threads or 4, AsyncType.Threaded, progress_msg
     )
 
 
 async def derive_from_rows_asyncio(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
     progress_msg: str = "",
@@ -97,62 +79,87 @@ async def derive_from_rows_asyncio(
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        async def execute_row_protected(
-            row: tuple[Hashable, pd.Series],
-        ) -> ItemType | None:
-            async with semaphore:
-                return await execute(row)
-
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
-
-    return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+    return await derive_from_rows(
+        input, transform, callbacks, num_threads, AsyncType.AsyncIO, progress_msg
     )
 
 
-ItemType = TypeVar("ItemType")
-
-ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
-GatherFn = Callable[[ExecuteFn], Awaitable[list[ItemType | None]]]
-
-
-async def _derive_from_rows_base(
+async def derive_from_rows_stream(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
-    callbacks: WorkflowCallbacks,
-    gather: GatherFn[ItemType],
+    transform: Callable[[Row], Awaitable[ItemType]],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
     progress_msg: str = "",
-) -> list[ItemType | None]:
+) -> AsyncIterator[tuple[int, ItemType | None]]:
     """
-    Derive from rows asynchronously.
+    Apply a transform function to each row, yielding `(position, result)` pairs in completion order.
 
-    This is useful for IO bound operations.
+    Rows are read lazily with `itertuples` and handed to the transform as dicts of
+    column values. At most `num_threads` rows are in flight and at most `num_threads`
+    results wait for the consumer, so memory stays bounded regardless of the input size.
+    Rows whose transform fails yield None; the errors are reported and thrown once
+    every row has been processed.
     """
+    callbacks = callbacks or NoopWorkflowCallbacks()
+    match async_type:
+        case AsyncType.AsyncIO:
+            call = _call_asyncio
+        case AsyncType.Threaded:
+            call = _call_asyncio_threads
+        case _:
+            msg = f"Unsupported scheduling type {async_type}"
+            raise ValueError(msg)
+
+    num_workers = num_threads or 4
     tick = progress_ticker(
         callbacks.progress, num_total=len(input), description=progress_msg
     )
     errors: list[tuple[BaseException, str]] = []
+    rows = _iter_rows(input)
+    # Results are bounded by `slots` rather than the queue size, so a worker can
+    # always signal that it stopped: with None when done, or with its exception
+    slots = asyncio.Semaphore(num_workers)
+    completed: asyncio.Queue[tuple[int, ItemType | None] | BaseException | None] = (
+        asyncio.Queue()
+    )
 
-    async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
+    async def work() -> None:
+        stopped_by: BaseException | None = None
         try:
-            result = transform(row[1])
-            if inspect.iscoroutine(result):
-                result = await result
-        except Exception as e:  # noqa: BLE001
-            errors.append((e, traceback.format_exc()))
-            return None
-        else:
-            return cast("ItemType", result)
+            # Workers share the row iterator, so each row is pulled exactly once
+            for position, row in rows:
+                try:
+                    result = await call(transform, row)
+                except Exception as e:  # noqa: BLE001
+                    errors.append((e, traceback.format_exc()))
+                    result = None
+                tick(1)
+                await slots.acquire()
+                completed.put_nowait((position, result))
+        except BaseException as e:
+            stopped_by = e
+            raise
         finally:
-            tick(1)
-
-    result = await gather(execute)
+            completed.put_nowait(stopped_by)
+
+    workers = [asyncio.create_task(work()) for _ in range(num_workers)]
+    try:
+        running = num_workers
+        while running:
+            item = await completed.get()
+            if item is None:
+                running -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                slots.release()
+                yield item
+    finally:
+        # Stop the workers if the consumer stops early or fails
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
     tick.done()
 
@@ -164,4 +171,28 @@ async def _derive_from_rows_base(
     if len(errors) > 0:
         raise ParallelizationError(len(errors), errors[0][1])
 
+
+def _iter_rows(input: pd.DataFrame) -> Iterator[tuple[int, Row]]:
+    """Yield the position and column values of each row, without building a Series per row."""
+    columns = input.columns.tolist()
+    for position, values in enumerate(input.itertuples(index=False, name=None)):
+        yield position, dict(zip(columns, values, strict=True))
+
+
+async def _call_asyncio(transform: Callable[[Row], Any], row: Row) -> Any:
+    """Call the transform on the event loop."""
+    result = transform(row)
+    if inspect.iscoroutine(result):
+        result = await result
+    return result
+
+
+async def _call_asyncio_threads(transform: Callable[[Row], Any], row: Row) -> Any:
+    """Call the transform in a worker thread, awaiting any coroutine it returns on the event loop.
+
+    This is useful for transforms doing blocking work.
+    """
+    result = await asyncio.to_thread(transform, row)
+    if inspect.iscoroutine(result):
+        result = await result
     return result
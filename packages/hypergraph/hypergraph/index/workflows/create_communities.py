@@ -28,8 +28,10 @@ async def run_workflow(
     """All the steps to transform final communities."""
     logger.info("Workflow started: create_communities")
     reader = DataReader(context.output_table_provider)
-    entities = await reader.entities()
-    relationships = await reader.relationships()
+    entities = await reader.entities(columns=["id", "title"])
+    relationships = await reader.relationships(
+        columns=["id", "source", "target", "weight", "text_unit_ids"]
+    )
     max_cluster_size = config.cluster_graph.max_cluster_size
     use_lcc = config.cluster_graph.use_lcc
     seed = config.cluster_graph.seed
@@ -81,6 +81,7 @@ async def run_workflow(
         max_report_length=config.community_reports.max_length,
         num_threads=config.concurrent_requests,
         async_type=config.async_mode,
+        context_workers=config.community_reports.context_workers,
     )
 
     await context.output_table_provider.write_dataframe("community_reports", output)
@@ -102,6 +103,7 @@ async def create_community_reports(
     max_report_length: int,
     num_threads: int,
     async_type: AsyncType,
+    context_workers: int = 1,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -120,6 +122,7 @@ async def create_community_reports(
         tokenizer,
         callbacks,
         max_input_length,
+        num_workers=context_workers,
     )
 
     community_reports = await summarize_communities(
@@ -24,7 +24,7 @@ async def run_workflow(
     logger.info("Workflow started: create_final_documents")
     reader = DataReader(context.output_table_provider)
     documents = await reader.documents()
-    text_units = await reader.text_units()
+    text_units = await reader.text_units(columns=["id", "document_id", "text"])
 
     output = create_final_documents(documents, text_units)
 
@@ -23,15 +23,17 @@ async def run_workflow(
     """All the steps to transform the text units."""
     logger.info("Workflow started: create_final_text_units")
     reader = DataReader(context.output_table_provider)
-    text_units = await reader.text_units()
-    final_entities = await reader.entities()
-    final_relationships = await reader.relationships()
+    text_units = await reader.text_units(
+        columns=["id", "text", "document_id", "n_tokens"]
+    )
+    final_entities = await reader.entities(columns=["id", "text_unit_ids"])
+    final_relationships = await reader.relationships(columns=["id", "text_unit_ids"])
 
     final_covariates = None
     if config.extract_claims.enabled and await context.output_table_provider.has(
         "covariates"
     ):
-        final_covariates = await reader.covariates()
+        final_covariates = await reader.covariates(columns=["id", "text_unit_id"])
 
     output = create_final_text_units(
         text_units,
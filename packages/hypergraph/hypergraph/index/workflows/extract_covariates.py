@@ -38,7 +38,7 @@ async def run_workflow(
     output = None
     if config.extract_claims.enabled:
         reader = DataReader(context.output_table_provider)
-        text_units = await reader.text_units()
+        text_units = await reader.text_units(columns=["id", "text"])
 
         model_config = config.get_completion_model_config(
             config.extract_claims.completion_model_id
@@ -15,9 +15,13 @@ from pydantic import BaseModel, Field
 
 from hypergraph.cache.cache_key_creator import cache_key_creator
 from hypergraph.callbacks.workflow_callbacks import WorkflowCallbacks
+from hypergraph.config.defaults import hypergraph_config_defaults
 from hypergraph.config.enums import AsyncType
 from hypergraph.config.models.hyper_graph_config import HyperGraphConfig
 from hypergraph.data_model.data_reader import DataReader
+from hypergraph.index.operations.extract_graph.checkpoint import (
+    ExtractGraphCheckpoint,
+)
 from hypergraph.index.operations.extract_graph.extract_graph import (
     extract_graph as extractor,
 )
@@ -28,6 +32,7 @@ from hypergraph.index.operations.summarize_descriptions.summarize_descriptions i
     summarize_descriptions,
 )
 from hypergraph.index.typing.context import PipelineRunContext
+from hypergraph.index.typing.stats import SummarizationStats
 from hypergraph.index.typing.workflow import WorkflowFunctionOutput
 from hypergraph.index.utils.string import clean_str
 from hypergraph.prompts.index.extract_graph import TYPE_PROPOSAL_CANONIZATION_PROMPT
@@ -67,7 +72,7 @@ async def run_workflow(
     """All the steps to create the base entity graph."""
     logger.info("Workflow started: extract_graph")
     reader = DataReader(context.output_table_provider)
-    text_units = await reader.text_units()
+    text_units = await reader.text_units(columns=["id", "text"])
 
     extraction_model_config = config.get_completion_model_config(
         config.extract_graph.completion_model_id
@@ -107,6 +112,10 @@ async def run_workflow(
             cache_key_creator=cache_key_creator,
         )
 
+    checkpoint = None
+    if config.extract_graph.checkpoint or config.extract_graph.resume:
+        checkpoint = ExtractGraphCheckpoint(context.output_table_provider)
+
     entities, relationships, raw_entities, raw_relationships = await extract_graph(
         text_units=text_units,
         callbacks=context.callbacks,
@@ -128,6 +137,11 @@ async def run_workflow(
         resolution_model=resolution_model,
         resolution_prompt=resolution_prompt,
         resolution_num_threads=config.concurrent_requests,
+        resolution_max_block_size=config.entity_resolution.max_block_size,
+        resolution_similarity_threshold=config.entity_resolution.similarity_threshold,
+        summarization_stats=context.stats.summarization,
+        checkpoint=checkpoint,
+        resume=config.extract_graph.resume,
     )
 
     await context.output_table_provider.write_dataframe("entities", entities)
@@ -186,6 +200,11 @@ async def extract_graph(
     resolution_model: "LLMCompletion | None" = None,
     resolution_prompt: str = "",
     resolution_num_threads: int = 1,
+    resolution_max_block_size: int = hypergraph_config_defaults.entity_resolution.max_block_size,
+    resolution_similarity_threshold: float = hypergraph_config_defaults.entity_resolution.similarity_threshold,
+    summarization_stats: SummarizationStats | None = None,
+    checkpoint: ExtractGraphCheckpoint | None = None,
+    resume: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     # this returns a graph for each text unit, to be merged later
@@ -203,6 +222,8 @@ async def extract_graph(
         max_gleanings=max_gleanings,
         num_threads=extraction_num_threads,
         async_type=extraction_async_type,
+        checkpoint=checkpoint,
+        resume=resume,
     )
 
     if len(extracted_entities) == 0:
@@ -230,6 +251,8 @@ async def extract_graph(
             model=resolution_model,
             prompt=resolution_prompt,
             num_threads=resolution_num_threads,
+            max_block_size=resolution_max_block_size,
+            similarity_threshold=resolution_similarity_threshold,
         )
 
     entities, relationships = await get_summarized_entities_relationships(
@@ -241,6 +264,7 @@ async def extract_graph(
         max_input_tokens=max_input_tokens,
         summarization_prompt=summarization_prompt,
         num_threads=summarization_num_threads,
+        stats=summarization_stats,
     )
 
     return (entities, relationships, raw_entities, raw_relationships)
@@ -255,6 +279,7 @@ async def get_summarized_entities_relationships(
     max_input_tokens: int,
     summarization_prompt: str,
     num_threads: int,
+    stats: SummarizationStats | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Summarize the entities and relationships."""
     entity_summaries, relationship_summaries = await summarize_descriptions(
@@ -266,6 +291,7 @@ async def get_summarized_entities_relationships(
         max_input_tokens=max_input_tokens,
         prompt=summarization_prompt,
         num_threads=num_threads,
+        stats=stats,
     )
 
     relationships = extracted_relationships.drop(columns=["description"]).merge(
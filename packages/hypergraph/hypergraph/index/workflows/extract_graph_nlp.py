@@ -31,7 +31,7 @@ async def run_workflow(
     """All the steps to create the base entity graph."""
     logger.info("Workflow started: extract_graph_nlp")
     reader = DataReader(context.output_table_provider)
-    text_units = await reader.text_units()
+    text_units = await reader.text_units(columns=["id", "text"])
 
     text_analyzer_config = config.extract_graph_nlp.text_analyzer
     text_analyzer = create_noun_phrase_extractor(text_analyzer_config)
@@ -46,11 +46,13 @@ async def run_workflow(
     entities = None
     community_reports = None
     if text_unit_text_embedding in embedded_fields:
-        text_units = await reader.text_units()
+        text_units = await reader.text_units(columns=["id", "text"])
     if entity_description_embedding in embedded_fields:
-        entities = await reader.entities()
+        entities = await reader.entities(columns=["id", "title", "description"])
     if community_full_content_embedding in embedded_fields:
-        community_reports = await reader.community_reports()
+        community_reports = await reader.community_reports(
+            columns=["id", "full_content"]
+        )
 
     model_config = config.get_embedding_model_config(
         config.embed_text.embedding_model_id
@@ -16,6 +16,7 @@ from hypergraph.config.models.hyper_graph_config import HyperGraphConfig
 from hypergraph.data_model.data_reader import DataReader
 from hypergraph.index.run.utils import get_update_table_providers
 from hypergraph.index.typing.context import PipelineRunContext
+from hypergraph.index.typing.stats import SummarizationStats
 from hypergraph.index.typing.workflow import WorkflowFunctionOutput
 from hypergraph.index.update.entities import _group_and_resolve_entities
 from hypergraph.index.update.relationships import _update_and_merge_relationships
@@ -45,6 +46,7 @@ async def run_workflow(
         config,
         context.cache,
         context.callbacks,
+        context.stats.summarization,
     )
 
     context.state["incremental_update_merged_entities"] = merged_entities_df
@@ -62,6 +64,7 @@ async def _update_entities_and_relationships(
     config: HyperGraphConfig,
     cache: Cache,
     callbacks: WorkflowCallbacks,
+    summarization_stats: SummarizationStats | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
     """Update Final Entities  and Relationships output."""
     old_entities = await DataReader(previous_table_provider).entities()
@@ -101,6 +104,7 @@ async def _update_entities_and_relationships(
         max_input_tokens=config.summarize_descriptions.max_input_tokens,
         summarization_prompt=prompts.summarize_prompt,
         num_threads=config.concurrent_requests,
+        stats=summarization_stats,
     )
 
     # Save the updated entities back to storage
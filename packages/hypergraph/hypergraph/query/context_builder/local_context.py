@@ -57,6 +57,7 @@ def build_entity_context(
     current_tokens = tokenizer.num_tokens(current_context_text)
 
     all_context_records = [header]
+    new_contexts = []
     for entity in selected_entities:
         new_context = [
             entity.short_id if entity.short_id else "",
@@ -72,8 +73,17 @@ def build_entity_context(
                 else ""
             )
             new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = tokenizer.num_tokens(new_context_text)
+        new_contexts.append(new_context)
+
+    new_context_texts = [
+        column_delimiter.join(new_context) + "\n" for new_context in new_contexts
+    ]
+    for new_context, new_context_text, new_tokens in zip(
+        new_contexts,
+        new_context_texts,
+        tokenizer.num_tokens_batch(new_context_texts),
+        strict=True,
+    ):
         if current_tokens + new_tokens > max_context_tokens:
             break
         current_context_text += new_context_text
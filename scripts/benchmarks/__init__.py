@@ -0,0 +1,5 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+
+"""Hypergraph micro-benchmarks."""
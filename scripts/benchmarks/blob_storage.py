@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark AzureBlobStorage transfers against the Azurite emulator.
+
+Start Azurite with scripts/start-azurite.sh, then run:
+
+Usage: python -m scripts.benchmarks.blob_storage [--blob-mb N] [--blobs N]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from hypergraph_storage.azure_blob_storage import AzureBlobStorage
+
+# cspell:disable-next-line well-known-key
+AZURITE_CONNECTION_STRING = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+
+CONCURRENCIES = [1, 4, 8]
+
+
+async def run(storage: AzureBlobStorage, blob: bytes, blobs: int) -> dict[str, float]:
+    """Time large transfers, and many small concurrent requests."""
+    timings = {}
+    start = time.perf_counter()
+    await storage.set("large.bin", blob)
+    timings["upload"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await storage.get("large.bin", as_bytes=True)
+    timings["download"] = time.perf_counter() - start
+
+    keys = [f"small/{i}.txt" for i in range(blobs)]
+    start = time.perf_counter()
+    await asyncio.gather(*(storage.set(key, key) for key in keys))
+    await asyncio.gather(*(storage.get(key) for key in keys))
+    timings["small"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(storage.get_creation_date(key) for key in keys))
+    timings["creation_date"] = time.perf_counter() - start
+    await storage.close()
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark and print one line per max_concurrency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blob-mb", type=int, default=128)
+    parser.add_argument("--blobs", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=CONCURRENCIES)
+    args = parser.parse_args()
+
+    blob = os.urandom(args.blob_mb * 1024 * 1024)
+    header = (
+        f"{'max_concurrency':>15} {'upload s':>9} {'download s':>10} "
+        f"{f'{args.blobs} set+get s':>14} {'creation date s':>15}"
+    )
+    print(header)  # noqa: T201
+    for max_concurrency in args.concurrency:
+        storage = AzureBlobStorage(
+            connection_string=AZURITE_CONNECTION_STRING,
+            container_name="benchmark",
+            max_concurrency=max_concurrency,
+        )
+        try:
+            timings = asyncio.run(run(storage, blob, args.blobs))
+        finally:
+            storage._delete_container()  # noqa: SLF001
+        line = (
+            f"{max_concurrency:>15} {timings['upload']:>9.2f} "
+            f"{timings['download']:>10.2f} {timings['small']:>14.2f} "
+            f"{timings['creation_date']:>15.2f}"
+        )
+        print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark connected components and stable_lcc on a large synthetic edge list.
+
+Usage: python -m scripts.benchmarks.connected_components [--edges N] [--nodes N]
+"""
+
+import argparse
+import time
+
+import hypergraph.graphs.connected_components as components
+import numpy as np
+import pandas as pd
+from hypergraph.graphs.stable_lcc import stable_lcc
+
+
+def build_relationships(num_edges: int, num_nodes: int, seed: int = 0) -> pd.DataFrame:
+    """Build a random relationships DataFrame with string node titles."""
+    rng = np.random.default_rng(seed)
+    titles = np.array([f"Entity &amp; {i}" for i in range(num_nodes)], dtype=object)
+    return pd.DataFrame({
+        "source": titles[rng.integers(0, num_nodes, num_edges)],
+        "target": titles[rng.integers(0, num_nodes, num_edges)],
+        "weight": rng.random(num_edges),
+    })
+
+
+def _timed(label: str, fn, *args) -> None:
+    start = time.perf_counter()
+    fn(*args)
+    print(f"{label:<40} {time.perf_counter() - start:>8.3f}s")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark and print one line per measured call."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--nodes", type=int, default=400_000)
+    args = parser.parse_args()
+
+    relationships = build_relationships(args.edges, args.nodes)
+    source_codes, target_codes, titles = components.factorize_nodes(relationships)
+
+    _timed("factorize_nodes", components.factorize_nodes, relationships)
+    _timed(
+        "component_labels",
+        components.component_labels,
+        source_codes,
+        target_codes,
+        len(titles),
+    )
+    _timed(
+        "component_labels (numpy union-find)",
+        components._union_find,  # noqa: SLF001
+        source_codes,
+        target_codes,
+        len(titles),
+    )
+    _timed("connected_components", components.connected_components, relationships)
+    _timed(
+        "largest_connected_component",
+        components.largest_connected_component,
+        relationships,
+    )
+    _timed("stable_lcc", stable_lcc, relationships)
+
+
+if __name__ == "__main__":
+    main()
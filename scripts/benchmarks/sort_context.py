@@ -0,0 +1,98 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark graph_context.sort_context on single communities of growing size.
+
+Usage: python -m scripts.benchmarks.sort_context [--max-context-tokens N]
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from hypergraph.index.operations.summarize_communities.graph_context.sort_context import (
+    sort_context,
+)
+from hypergraph.tokenizer.get_tokenizer import get_tokenizer
+from hypergraph_llm.tokenizer import Tokenizer
+
+EDGE_COUNTS = [1_000, 10_000, 100_000]
+
+
+class CountingTokenizer(Tokenizer):
+    """Tokenizer wrapper that counts calls and tokenized characters."""
+
+    def __init__(self, tokenizer: Tokenizer, **kwargs: Any) -> None:
+        self._tokenizer = tokenizer
+        self.calls = 0
+        self.characters = 0
+
+    def encode(self, text: str) -> list[int]:
+        """Encode the text, recording the call."""
+        self.calls += 1
+        self.characters += len(text)
+        return self._tokenizer.encode(text)
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode the tokens."""
+        return self._tokenizer.decode(tokens)
+
+
+def build_community(num_edges: int, seed: int = 0) -> list[dict]:
+    """Build the local context of a synthetic community with `num_edges` edges."""
+    rng = random.Random(seed)  # noqa: S311
+    titles = [f"ENTITY {i}" for i in range(max(num_edges // 4, 2))]
+    records = {
+        title: {
+            "title": title,
+            "degree": 0,
+            "node_details": {
+                "human_readable_id": i,
+                "title": title,
+                "description": f"{title} is a synthetic entity used for benchmarking.",
+                "degree": rng.randint(1, 50),
+            },
+            "edge_details": [],
+            "claim_details": [],
+        }
+        for i, title in enumerate(titles)
+    }
+    for i in range(num_edges):
+        source, target = rng.sample(titles, 2)
+        records[source]["edge_details"].append({
+            "human_readable_id": i,
+            "source": source,
+            "target": target,
+            "description": f"{source} is related to {target} in the benchmark.",
+            "combined_degree": rng.randint(2, 100),
+        })
+    return list(records.values())
+
+
+def main() -> None:
+    """Run the benchmark and print one line per community size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-context-tokens", type=int, default=16_000)
+    parser.add_argument("--edges", type=int, nargs="+", default=EDGE_COUNTS)
+    args = parser.parse_args()
+
+    base_tokenizer = get_tokenizer()
+    header = (
+        f"{'edges':>8} {'seconds':>9} {'tokenizer calls':>16} {'chars tokenized':>16}"
+    )
+    print(header)  # noqa: T201
+    for num_edges in args.edges:
+        local_context = build_community(num_edges)
+        tokenizer = CountingTokenizer(base_tokenizer)
+        start = time.perf_counter()
+        sort_context(
+            local_context, tokenizer, max_context_tokens=args.max_context_tokens
+        )
+        elapsed = time.perf_counter() - start
+        line = f"{num_edges:>8} {elapsed:>9.3f} {tokenizer.calls:>16} {tokenizer.characters:>16}"
+        print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
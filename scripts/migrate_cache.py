@@ -0,0 +1,40 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Re-key a file cache directory for the current cache version.
+
+Only entries written with `cache_parameters: true` in the model config can be
+re-keyed.
+
+Usage: python -m scripts.migrate_cache CACHE_DIR [--keep-stale]
+"""
+
+import argparse
+
+from hypergraph.cache.cache_key_creator import cache_key_creator
+from hypergraph_llm.cache import migrate_cache
+
+
+def main() -> None:
+    """Migrate the cache directory and print the number of entries per outcome."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("cache_dir", help="The base_dir of the file cache.")
+    parser.add_argument(
+        "--keep-stale",
+        action="store_true",
+        help="Copy entries instead of moving them.",
+    )
+    args = parser.parse_args()
+
+    result = migrate_cache(
+        args.cache_dir,
+        cache_key_creator=cache_key_creator,
+        keep_stale=args.keep_stale,
+    )
+    print(  # noqa: T201
+        f"migrated={result.migrated} unchanged={result.unchanged} skipped={result.skipped}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+"""Test migrating a cache directory."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from hypergraph.cache.cache_key_creator import cache_key_creator
+from hypergraph_cache import (
+    Cache,
+    CacheConfig,
+    CacheKeyCreator,
+    CacheType,
+    create_cache,
+)
+from hypergraph_llm.cache import create_cache_key, migrate_cache
+from hypergraph_llm.middleware import with_cache
+from hypergraph_llm.types import (
+    AsyncLLMEmbeddingFunction,
+    LLMEmbedding,
+    LLMEmbeddingResponse,
+    LLMEmbeddingUsage,
+)
+from hypergraph_storage import StorageConfig, StorageType
+
+
+def _previous_version_key(input_args: dict[str, Any]) -> str:
+    return f"{create_cache_key(input_args)}_v4"
+
+
+def _create_cache(base_dir: Path) -> Cache:
+    return create_cache(
+        CacheConfig(
+            type=CacheType.Json,
+            storage=StorageConfig(type=StorageType.File, base_dir=str(base_dir)),
+        )
+    ).child("embedding")
+
+
+async def test_migrate_cache(tmp_path: Path) -> None:
+    """Test that the pipeline finds migrated entries under its own cache keys."""
+    cache = _create_cache(tmp_path)
+    calls = 0
+
+    async def model(**kwargs: Any) -> LLMEmbeddingResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return LLMEmbeddingResponse(
+            data=[LLMEmbedding(embedding=[1.0], index=0, object="embedding")],
+            model="mock",
+            object="list",
+            usage=LLMEmbeddingUsage(prompt_tokens=1, total_tokens=1),
+        )
+
+    def cached_model(key_creator: CacheKeyCreator) -> AsyncLLMEmbeddingFunction:
+        return with_cache(
+            sync_middleware=None,  # type: ignore
+            async_middleware=model,
+            request_type="embedding",
+            cache=cache,
+            cache_key_creator=key_creator,
+            record_parameters=True,
+        )[1]
+
+    # An entry written by a previous cache version, and one without parameters
+    await cached_model(_previous_version_key)(
+        input=["text"], model="mock", api_key="secret"
+    )
+    (tmp_path / "embedding" / "legacy").write_text(json.dumps({"result": {}}))
+    [entry] = [p for p in (tmp_path / "embedding").iterdir() if p.name != "legacy"]
+    assert "secret" not in entry.read_text()
+
+    result = migrate_cache(tmp_path, cache_key_creator=cache_key_creator)
+    assert (result.migrated, result.unchanged, result.skipped) == (1, 0, 1)
+    assert not entry.exists()
+
+    # The pipeline looks the entry up under its migrated key
+    assert await cache.has(cache_key_creator({"input": ["text"], "model": "mock"}))
+    await cached_model(cache_key_creator)(
+        input=["text"], model="mock", api_key="secret"
+    )
+    assert calls == 1
+
+    result = migrate_cache(tmp_path, cache_key_creator=cache_key_creator)
+    assert (result.migrated, result.unchanged, result.skipped) == (0, 1, 1)
+
+
+async def test_parameters_not_recorded_by_default(tmp_path: Path) -> None:
+    """Test that entries only record their parameters when asked to."""
+    cache = _create_cache(tmp_path)
+
+    async def model(**kwargs: Any) -> LLMEmbeddingResponse:
+        await asyncio.sleep(0)
+        return LLMEmbeddingResponse(
+            data=[LLMEmbedding(embedding=[1.0], index=0, object="embedding")],
+            model="mock",
+            object="list",
+            usage=LLMEmbeddingUsage(prompt_tokens=1, total_tokens=1),
+        )
+
+    _, cached_model = with_cache(
+        sync_middleware=None,  # type: ignore
+        async_middleware=model,
+        request_type="embedding",
+        cache=cache,
+        cache_key_creator=cache_key_creator,
+    )
+    await cached_model(input=["text"], model="mock")
+
+    [entry] = (tmp_path / "embedding").iterdir()
+    assert "parameters" not in json.loads(entry.read_text())
+    assert migrate_cache(tmp_path).skipped == 1
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test the adaptive (AIMD) rate limiter."""
+
+import asyncio
+
+import pytest
+from hypergraph_llm.config import RateLimitConfig, RateLimitType
+from hypergraph_llm.metrics.memory_metrics_store import MemoryMetricsStore
+from hypergraph_llm.rate_limit import create_rate_limiter
+from hypergraph_llm.rate_limit.adaptive_rate_limiter import AdaptiveRateLimiter
+
+
+class RateLimitError(Exception):
+    """Stand-in for the provider's rate limit error."""
+
+
+def _create(endpoint: str = "test", **kwargs) -> AdaptiveRateLimiter:
+    rate_limiter = create_rate_limiter(
+        RateLimitConfig(type=RateLimitType.Adaptive, **kwargs), endpoint=endpoint
+    )
+    assert isinstance(rate_limiter, AdaptiveRateLimiter)
+    return rate_limiter
+
+
+def test_shared_per_endpoint():
+    """Test that model instances calling the same endpoint share one limiter."""
+    first = _create("https://a/gpt-4o", initial_concurrency=3)
+    assert _create("https://a/gpt-4o", initial_concurrency=3) is first
+    assert _create("https://b/gpt-4o", initial_concurrency=3) is not first
+
+
+def test_additive_increase_multiplicative_decrease():
+    """Test that successes grow the limit and a burst of 429s halves it once."""
+    rate_limiter = _create("aimd", initial_concurrency=4, max_concurrency=6)
+    metrics_store = MemoryMetricsStore(id="aimd")
+    rate_limiter.add_metrics_store(metrics_store)
+
+    # About one more slot per round of `limit` successful requests
+    for _ in range(5):
+        with rate_limiter.acquire(token_count=10):
+            pass
+    assert rate_limiter.limit == 5
+    assert metrics_store.get_metrics()["concurrency_limit"] == 5
+
+    for _ in range(100):
+        with rate_limiter.acquire(token_count=10):
+            pass
+    assert rate_limiter.limit == 6
+
+    # Three concurrent requests fail with 429s; only the first cuts the limit
+    slots = [rate_limiter.acquire(token_count=10) for _ in range(3)]
+    for slot in slots:
+        slot.__enter__()
+    for slot in slots:
+        # A falsy result means the error propagates to the caller
+        assert not slot.__exit__(RateLimitError, RateLimitError(), None)
+    assert rate_limiter.limit == 3
+    assert metrics_store.get_metrics()["concurrency_limit"] == 3
+
+    # Errors that are not rate limits leave the limit alone
+    slot = rate_limiter.acquire(token_count=10)
+    slot.__enter__()
+    assert not slot.__exit__(ValueError, ValueError("bad request"), None)
+    assert rate_limiter.limit == 3
+
+
+async def test_limits_in_flight_requests_in_fifo_order():
+    """Test that at most `limit` requests run at once and waiters go first come, first served."""
+    rate_limiter = _create("fifo", initial_concurrency=2, max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+    started: list[int] = []
+
+    async def request(index: int) -> None:
+        nonlocal in_flight, max_in_flight
+        async with rate_limiter.acquire_async(token_count=10):
+            started.append(index)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*[request(index) for index in range(10)])
+
+    assert max_in_flight == 2
+    assert started == list(range(10))
+
+
+async def test_cancelled_waiter_releases_its_place():
+    """Test that cancelling a waiting request does not leak a slot."""
+    rate_limiter = _create("cancel", initial_concurrency=1, max_concurrency=1)
+    release = asyncio.Event()
+
+    async def holder() -> None:
+        async with rate_limiter.acquire_async(token_count=10):
+            await release.wait()
+
+    async def waiter() -> None:
+        async with rate_limiter.acquire_async(token_count=10):
+            pass
+
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    release.set()
+    await holding
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    await asyncio.wait_for(waiter(), timeout=1)
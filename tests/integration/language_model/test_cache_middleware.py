@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test cache middleware."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+import pytest
+from hypergraph_cache import Cache, create_cache_key
+from hypergraph_cache.memory_cache import MemoryCache
+from hypergraph_llm.middleware import with_cache
+from hypergraph_llm.types import (
+    LLMEmbedding,
+    LLMEmbeddingResponse,
+    LLMEmbeddingUsage,
+)
+
+# The fakes also take a single string input, which the function types do not allow
+_CachedModels = tuple[
+    Callable[..., LLMEmbeddingResponse],
+    Callable[..., Coroutine[Any, Any, LLMEmbeddingResponse]],
+]
+
+
+def _embedding_response(texts: list[str], total_tokens: int) -> LLMEmbeddingResponse:
+    return LLMEmbeddingResponse(
+        data=[
+            LLMEmbedding(embedding=[float(len(text))], index=index, object="embedding")
+            for index, text in enumerate(texts)
+        ],
+        model="mock",
+        object="list",
+        usage=LLMEmbeddingUsage(prompt_tokens=total_tokens, total_tokens=total_tokens),
+    )
+
+
+def _input_cache_key(input_args: dict[str, Any]) -> str:
+    return create_cache_key({"input": input_args["input"]})
+
+
+def _cache_middleware(
+    sync_fn: Any, async_fn: Any, cache: Cache | None = None
+) -> _CachedModels:
+    return cast(
+        "_CachedModels",
+        with_cache(
+            sync_middleware=sync_fn,
+            async_middleware=async_fn,
+            request_type="embedding",
+            cache=cache or MemoryCache(),
+            cache_key_creator=_input_cache_key,
+        ),
+    )
+
+
+async def test_coalesces_concurrent_identical_requests() -> None:
+    """Test that identical requests in flight share one model call."""
+    calls: list[str] = []
+
+    async def model(**kwargs: Any):
+        calls.append(kwargs["input"])
+        await asyncio.sleep(0.1)
+        kwargs["metrics"]["total_tokens"] = 1
+        return _embedding_response([kwargs["input"]], 1)
+
+    _, cached_model = _cache_middleware(None, model)
+    metrics: list[dict[str, Any]] = [{} for _ in range(6)]
+    inputs = ["a", "a", "a", "a", "b", "b"]
+    responses = await asyncio.gather(*[
+        cached_model(input=text, metrics=m)
+        for text, m in zip(inputs, metrics, strict=True)
+    ])
+
+    assert sorted(calls) == ["a", "b"]
+    assert [r.first_embedding for r in responses] == [[1.0]] * 6
+    assert sum(m.get("coalesced_responses", 0) for m in metrics) == 4
+    assert all(m["total_tokens"] == 1 for m in metrics)
+
+    # Later requests are served from the cache
+    later_metrics: dict[str, Any] = {}
+    await cached_model(input="a", metrics=later_metrics)
+    assert sorted(calls) == ["a", "b"]
+    assert later_metrics["cached_responses"] == 1
+
+
+async def test_coalesced_requests_share_errors() -> None:
+    """Test that waiting requests fail with the error of the shared call."""
+    calls = 0
+
+    async def model(**kwargs: Any):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        msg = "Oh no!"
+        raise ValueError(msg)
+
+    _, cached_model = _cache_middleware(None, model)
+    results = await asyncio.gather(
+        *[cached_model(input="a", metrics={}) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+async def test_waiting_request_takes_over_when_first_is_cancelled() -> None:
+    """Test that cancelling the first request does not cancel the requests waiting on it."""
+    calls = 0
+
+    async def model(**kwargs: Any):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return _embedding_response([kwargs["input"]], 1)
+
+    _, cached_model = _cache_middleware(None, model)
+    first = asyncio.create_task(cached_model(input="a", metrics={}))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(cached_model(input="a", metrics={}))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert (await second).first_embedding == [1.0]
+    assert calls == 2
+
+
+def test_coalesces_concurrent_identical_requests_sync() -> None:
+    """Test that identical requests from different threads share one model call."""
+    calls = 0
+    lock = threading.Lock()
+
+    def model(**kwargs: Any):
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.2)
+        return _embedding_response([kwargs["input"]], 1)
+
+    cached_model, _ = _cache_middleware(model, None)
+    metrics: list[dict[str, Any]] = [{} for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(lambda m: cached_model(input="a", metrics=m), metrics)
+        )
+
+    assert calls == 1
+    assert [r.first_embedding for r in responses] == [[1.0]] * 4
+    assert sum(m.get("coalesced_responses", 0) for m in metrics) == 3
+
+
+async def test_caches_embeddings_per_text() -> None:
+    """Test that only the texts missing from the cache are embedded."""
+    requests: list[list[str]] = []
+
+    async def model(**kwargs: Any):
+        requests.append(kwargs["input"])
+        await asyncio.sleep(0)
+        return _embedding_response(kwargs["input"], 3)
+
+    _, cached_model = with_cache(
+        sync_middleware=None,  # type: ignore
+        async_middleware=model,
+        request_type="embedding",
+        cache=MemoryCache(),
+        cache_key_creator=create_cache_key,
+    )
+
+    metrics: dict[str, Any] = {}
+    response = await cached_model(input=["a", "bb"], metrics=metrics)
+    assert response.embeddings == [[1.0], [2.0]]
+    assert (metrics["embedding_cache_hits"], metrics["embedding_cache_misses"]) == (
+        0,
+        2,
+    )
+
+    metrics = {}
+    response = await cached_model(input=["bb", "ccc", "bb", "a"], metrics=metrics)
+    assert requests == [["a", "bb"], ["ccc"]]
+    assert response.embeddings == [[2.0], [3.0], [2.0], [1.0]]
+    assert [item.index for item in response.data] == [0, 1, 2, 3]
+    assert response.usage.total_tokens == 3
+    assert (metrics["embedding_cache_hits"], metrics["embedding_cache_misses"]) == (
+        3,
+        1,
+    )
+
+    metrics = {}
+    response = await cached_model(input=["ccc"], metrics=metrics)
+    assert len(requests) == 2
+    assert response.embeddings == [[3.0]]
+    assert metrics["cached_responses"] == 1
+
+
+def test_caches_embeddings_per_text_sync() -> None:
+    """Test that only the texts missing from the cache are embedded, from sync code."""
+    requests: list[list[str]] = []
+
+    def model(**kwargs: Any):
+        requests.append(kwargs["input"])
+        return _embedding_response(kwargs["input"], 3)
+
+    cache = MemoryCache()
+    cached_model, _ = _cache_middleware(model, None, cache)
+    cached_model(input=["a", "bb"], metrics={})
+    response = cached_model(input=["ccc", "a"], metrics={})
+
+    assert requests == [["a", "bb"], ["ccc"]]
+    assert response.embeddings == [[3.0], [1.0]]
+    # Each text is cached as its embedding alone
+    assert cache.get_sync(create_cache_key({"input": ["bb"]})) == {"embedding": [2.0]}
@@ -0,0 +1,205 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test histogram metrics."""
+
+import asyncio
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from hypergraph_cache import create_cache_key
+from hypergraph_cache.memory_cache import MemoryCache
+from hypergraph_llm.metrics import Histogram
+from hypergraph_llm.metrics.file_metrics_writer import FileMetricsWriter
+from hypergraph_llm.metrics.memory_metrics_store import MemoryMetricsStore
+from hypergraph_llm.middleware import with_cache, with_metrics, with_rate_limiting
+from hypergraph_llm.rate_limit.sliding_window_rate_limiter import (
+    SlidingWindowRateLimiter,
+)
+from hypergraph_llm.retry.exponential_retry import ExponentialRetry
+from hypergraph_llm.types import (
+    LLMEmbedding,
+    LLMEmbeddingResponse,
+    LLMEmbeddingUsage,
+)
+
+
+def test_histogram_percentiles() -> None:
+    """Test that percentiles are within the relative error of the buckets."""
+    histogram = Histogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.sum == pytest.approx(500.5)
+    assert histogram.percentile(0) == 0.001
+    assert histogram.percentile(100) == 1.0
+    for percentile in [50, 95, 99]:
+        expected = percentile / 100
+        assert expected <= histogram.percentile(percentile) <= expected * 1.1
+
+    other = Histogram()
+    other.record(0)
+    other.record(5.0)
+    histogram.merge(other)
+    assert histogram.count == 1002
+    assert histogram.percentile(0) == 0
+    assert histogram.percentile(100) == 5.0
+    assert histogram.buckets()[0] == (0.0, 1)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        histogram.merge(Histogram(growth=2))
+
+
+def test_memory_metrics_store_histograms() -> None:
+    """Test that histogram metrics are summed and reported with percentiles."""
+    store = MemoryMetricsStore(id="test")
+    for ms in range(1, 101):
+        store.update_metrics(
+            metrics={
+                "compute_duration_seconds": ms / 1000,
+                "successful_response_count": 1,
+            }
+        )
+
+    metrics = store.get_metrics()
+    assert metrics["compute_duration_seconds"] == pytest.approx(5.05)
+    assert 0.05 <= metrics["compute_duration_seconds_p50"] <= 0.055
+    assert 0.99 * 0.1 <= metrics["compute_duration_seconds_p99"] <= 0.1
+    assert metrics["compute_duration_seconds_max"] == 0.1
+    assert "successful_response_count_p50" not in metrics
+    keys = list(metrics)
+    assert keys.index("compute_duration_seconds_p50") == (
+        keys.index("compute_duration_seconds") + 1
+    )
+    assert store.get_histograms()["compute_duration_seconds"].count == 100
+
+    store.clear_metrics()
+    assert store.get_histograms() == {}
+
+
+def test_cache_hits_not_recorded_in_histograms() -> None:
+    """Test that replayed timings of cached responses are not recorded again."""
+
+    def model(**kwargs: Any) -> LLMEmbeddingResponse:
+        kwargs["metrics"]["compute_duration_seconds"] = 0.5
+        return LLMEmbeddingResponse(
+            data=[LLMEmbedding(embedding=[1.0], index=0, object="embedding")],
+            model="mock",
+            object="list",
+            usage=LLMEmbeddingUsage(prompt_tokens=1, total_tokens=1),
+        )
+
+    cached_model, _ = with_cache(
+        sync_middleware=model,  # type: ignore
+        async_middleware=None,  # type: ignore
+        request_type="embedding",
+        cache=MemoryCache(),
+        cache_key_creator=create_cache_key,
+    )
+    store = MemoryMetricsStore(id="test")
+    for _ in range(3):
+        request_metrics: dict[str, Any] = {}
+        cached_model(input=["text"], metrics=request_metrics)
+        store.update_metrics(metrics=request_metrics)
+
+    assert store.get_metrics()["cached_responses"] == 2
+    assert store.get_histograms()["compute_duration_seconds"].count == 1
+
+
+def test_file_metrics_writer_histograms(tmp_path) -> None:
+    """Test that the file writer writes the buckets of the histograms."""
+    histogram = Histogram()
+    histogram.record(0.5)
+    histogram.record(0.5)
+    writer = FileMetricsWriter(base_dir=str(tmp_path))
+    writer.write_metrics(
+        id="test",
+        metrics={"compute_duration_seconds": 1.0},
+        histograms={"compute_duration_seconds": histogram},
+    )
+
+    [path] = tmp_path.glob("*.jsonl")
+    record = json.loads(path.read_text(encoding="utf-8"))
+    written = record["histograms"]["compute_duration_seconds"]
+    assert written["count"] == 2
+    assert written["max"] == 0.5
+    [[upper_bound, count]] = written["buckets"]
+    assert 0.5 <= upper_bound < 0.55
+    assert count == 2
+
+
+class _NoopMetricsProcessor:
+    def process_metrics(self, **kwargs: Any) -> None:
+        return
+
+
+def test_time_to_first_token() -> None:
+    """Test that the time to the first chunk of a streaming response is recorded."""
+
+    def model(**kwargs: Any) -> Iterator[str]:
+        yield from ["a", "b"]
+
+    store = MemoryMetricsStore(id="test")
+    metrics_model, _ = with_metrics(
+        model_config=None,  # type: ignore
+        sync_middleware=model,  # type: ignore
+        async_middleware=None,  # type: ignore
+        metrics_processor=_NoopMetricsProcessor(),  # type: ignore
+        metrics_store=store,
+    )
+    request_metrics: dict[str, Any] = {}
+    response = metrics_model(stream=True, metrics=request_metrics)
+
+    assert request_metrics == {"streaming_responses": 1}
+    assert store.get_histograms() == {}
+    assert list(response) == ["a", "b"]
+    assert store.get_histograms()["time_to_first_token_seconds"].count == 1
+
+
+async def test_rate_limit_wait() -> None:
+    """Test that the time spent waiting for the rate limiter is recorded."""
+
+    async def model(**kwargs: Any) -> None:
+        await asyncio.sleep(0)
+
+    _, limited_model = with_rate_limiting(
+        sync_middleware=None,  # type: ignore
+        async_middleware=model,  # type: ignore
+        rate_limiter=SlidingWindowRateLimiter(
+            period_in_seconds=1, requests_per_period=10
+        ),
+        tokenizer=None,  # type: ignore
+    )
+    first: dict[str, Any] = {}
+    second: dict[str, Any] = {}
+    await limited_model(metrics=first)
+    await limited_model(metrics=second)
+
+    assert first["rate_limit_wait_seconds"] < 0.05
+    assert second["rate_limit_wait_seconds"] >= 0.05
+
+
+def test_retry_delay() -> None:
+    """Test that the time spent backing off is recorded."""
+    calls = 0
+
+    def model(**kwargs: Any) -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            msg = "Oh no!"
+            raise ValueError(msg)
+        return "ok"
+
+    retrier = ExponentialRetry(max_delay=0.01, jitter=False)
+    metrics: dict[str, Any] = {}
+    assert retrier.retry(func=model, input_args={"metrics": metrics}) == "ok"
+    assert metrics["retries"] == 2
+    assert metrics["retry_delay_seconds"] == pytest.approx(0.02)
+
+    metrics = {}
+    retrier.retry(func=model, input_args={"metrics": metrics})
+    assert "retry_delay_seconds" not in metrics
@@ -0,0 +1,150 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test the OpenMetrics exporter."""
+
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+
+import pytest
+from hypergraph.callbacks.openmetrics_workflow_callbacks import (
+    OpenMetricsWorkflowCallbacks,
+)
+from hypergraph.logger.progress import Progress
+from hypergraph_llm.config import MetricsConfig, MetricsWriterType
+from hypergraph_llm.metrics import create_metrics_store, openmetrics_exporter
+from hypergraph_llm.metrics.memory_metrics_store import MemoryMetricsStore
+
+
+@pytest.fixture(autouse=True)
+def _reset_exporter() -> Iterator[None]:
+    yield
+    openmetrics_exporter.shutdown()
+    openmetrics_exporter.clear()
+
+
+def _scrape(port: int, path: str = "/metrics") -> tuple[str, str]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}") as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+def test_render_metrics_store() -> None:
+    """Test that store metrics are rendered as counters, gauges and histograms."""
+    store = MemoryMetricsStore(id="openai/gpt-4o")
+    store.update_metrics(
+        metrics={
+            "attempted_request_count": 1,
+            "successful_response_count": 1,
+            "total_tokens": 30,
+            "compute_duration_seconds": 0.5,
+        }
+    )
+    store.update_metrics(
+        metrics={
+            "attempted_request_count": 1,
+            "successful_response_count": 1,
+            "cached_responses": 1,
+            "compute_duration_seconds": 0.5,
+        }
+    )
+    store.update_metrics(metrics={"in_flight_requests": 1})
+    openmetrics_exporter.add_metrics_store(store)
+
+    lines = openmetrics_exporter.render().splitlines()
+
+    label = '{model="openai/gpt-4o"}'
+    assert "# TYPE hypergraph_llm_total_tokens_total counter" in lines
+    assert f"hypergraph_llm_total_tokens_total{label} 30" in lines
+    assert "# TYPE hypergraph_llm_cache_hit_rate gauge" in lines
+    assert f"hypergraph_llm_cache_hit_rate{label} 0.5" in lines
+    assert f"hypergraph_llm_in_flight_requests{label} 1" in lines
+    assert "# TYPE hypergraph_llm_compute_duration_seconds histogram" in lines
+    assert (
+        'hypergraph_llm_compute_duration_seconds_bucket{model="openai/gpt-4o",le="+Inf"} 1'
+        in lines
+    )
+    assert f"hypergraph_llm_compute_duration_seconds_count{label} 1" in lines
+    assert f"hypergraph_llm_compute_duration_seconds_sum{label} 0.5" in lines
+    assert f"hypergraph_llm_compute_duration_seconds_p50{label} 0.5" in lines
+    assert not any(
+        line.startswith("hypergraph_llm_compute_duration_seconds_total")
+        for line in lines
+    )
+
+
+def test_serve_metrics_writer(tmp_path) -> None:
+    """Test that stores using the openmetrics writer are served over HTTP."""
+    config = MetricsConfig(
+        writer=MetricsWriterType.OpenMetrics,
+        openmetrics_port=0,
+        textfile_path=str(tmp_path / "hypergraph.prom"),
+        textfile_interval=60,
+    )
+    store = create_metrics_store(config=config, id="test/served")
+    store.update_metrics(metrics={"successful_response_count": 3})
+    # Serving the same address again returns the port of the running server
+    port = openmetrics_exporter.serve(0)
+
+    content_type, text = _scrape(port)
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert (
+        'hypergraph_llm_successful_response_count_total{model="test/served"} 3' in text
+    )
+
+    store.update_metrics(metrics={"successful_response_count": 1})
+    _, text = _scrape(port)
+    assert (
+        'hypergraph_llm_successful_response_count_total{model="test/served"} 4' in text
+    )
+
+    with pytest.raises(urllib.error.HTTPError):
+        _scrape(port, "/other")
+
+    openmetrics_exporter.write_textfile(tmp_path / "hypergraph.prom")
+    textfile = (tmp_path / "hypergraph.prom").read_text(encoding="utf-8")
+    assert (
+        'hypergraph_llm_successful_response_count_total{model="test/served"} 4'
+        in textfile
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["hypergraph.prom"]
+
+
+def test_workflow_progress() -> None:
+    """Test that pipeline progress is exported per workflow."""
+    callbacks = OpenMetricsWorkflowCallbacks()
+    callbacks.pipeline_start(["load_input_documents", "extract_graph"])
+    callbacks.workflow_start("load_input_documents", None)
+    callbacks.workflow_end("load_input_documents", None)
+    callbacks.workflow_start("extract_graph", None)
+    callbacks.progress(Progress(total_items=10, completed_items=4))
+
+    lines = openmetrics_exporter.render().splitlines()
+
+    assert 'hypergraph_workflow_running{workflow="load_input_documents"} 0' in lines
+    assert 'hypergraph_workflow_running{workflow="extract_graph"} 1' in lines
+    assert 'hypergraph_workflow_completed_items{workflow="extract_graph"} 4' in lines
+    assert 'hypergraph_workflow_total_items{workflow="extract_graph"} 10' in lines
+    assert "hypergraph_pipeline_errors_total 0" in lines
+
+
+def test_render_skips_failing_metrics_store() -> None:
+    """Test that a failing metrics store does not break rendering the others."""
+
+    class _FailingStore(MemoryMetricsStore):
+        def get_metrics(self):
+            msg = "Oh no!"
+            raise RuntimeError(msg)
+
+    openmetrics_exporter.add_metrics_store(_FailingStore(id="test/failing"))
+    store = MemoryMetricsStore(id="test/working")
+    store.update_metrics(metrics={"successful_response_count": 1})
+    openmetrics_exporter.add_metrics_store(store)
+
+    lines = openmetrics_exporter.render().splitlines()
+
+    assert (
+        'hypergraph_llm_successful_response_count_total{model="test/working"} 1'
+        in lines
+    )
+    assert not any("test/failing" in line for line in lines)
@@ -3,13 +3,19 @@
 
 """Test LiteLLM Rate Limiter."""
 
+import asyncio
 import threading
 import time
+from itertools import pairwise
 from math import ceil
 from queue import Queue
 
 from hypergraph_llm.config import RateLimitConfig, RateLimitType
-from hypergraph_llm.rate_limit import RateLimiter, create_rate_limiter
+from hypergraph_llm.rate_limit import (
+    AsyncRateLimiter,
+    RateLimiter,
+    create_rate_limiter,
+)
 
 from tests.integration.language_model.utils import (
     assert_max_num_values_per_period,
@@ -136,6 +142,32 @@ def test_token_in_request_exceeds_tpm():
     assert_max_num_values_per_period(binned_time_values, 1)
 
 
+def test_oversized_request_waits_only_for_tpm():
+    """Test that a request exceeding the TPM proceeds once the window is below the TPM.
+
+    It does not wait for the window to be empty.
+    """
+    rate_limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.SlidingWindow,
+            period_in_seconds=_period_in_seconds,
+            tokens_per_period=_tpm,
+        )
+    )
+
+    start_time = time.time()
+    with rate_limiter.acquire(token_count=_tokens_per_request):
+        pass
+    with rate_limiter.acquire(token_count=_tpm * 2):
+        pass
+    assert time.time() - start_time < _period_in_seconds / 2
+
+    # The window is now above the TPM, so the next request waits for it to drain
+    with rate_limiter.acquire(token_count=_tpm * 2):
+        pass
+    assert time.time() - start_time >= _period_in_seconds
+
+
 def test_rpm_and_tpm_with_rpm_as_limiting_factor():
     """Test that the rate limiter enforces RPM and TPM limits."""
     rate_limiter = create_rate_limiter(
@@ -347,3 +379,95 @@ def test_tpm_threaded():
     max_num_of_requests_per_bin = _tpm // _tokens_per_request
     assert_max_num_values_per_period(binned_time_values, max_num_of_requests_per_bin)
     assert_stagger(time_values, _stagger)
+
+
+async def _acquire_async(
+    rate_limiter: RateLimiter,
+    token_count: int,
+    start_time: float,
+    index: int,
+    admitted: list[int],
+) -> float:
+    assert isinstance(rate_limiter, AsyncRateLimiter)
+    async with rate_limiter.acquire_async(token_count=token_count):
+        admitted.append(index)
+        return time.time() - start_time
+
+
+async def test_rpm_async():
+    """Test that concurrent coroutines are admitted in arrival order within RPM limits."""
+    rate_limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.SlidingWindow,
+            period_in_seconds=_period_in_seconds,
+            requests_per_period=_rpm,
+        )
+    )
+
+    admitted: list[int] = []
+    start_time = time.time()
+    time_values = await asyncio.gather(*[
+        _acquire_async(rate_limiter, _tokens_per_request, start_time, index, admitted)
+        for index in range(_num_requests)
+    ])
+
+    assert admitted == list(range(_num_requests))
+    binned_time_values = bin_time_intervals(time_values, _period_in_seconds)
+    assert len(binned_time_values) == ceil(_num_requests / _rpm)
+    assert_max_num_values_per_period(binned_time_values, _rpm)
+    assert_stagger(time_values, _stagger)
+
+
+async def test_tpm_async():
+    """Test that concurrent coroutines are admitted in arrival order within TPM limits."""
+    rate_limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.SlidingWindow,
+            period_in_seconds=_period_in_seconds,
+            tokens_per_period=_tpm,
+        )
+    )
+
+    admitted: list[int] = []
+    start_time = time.time()
+    time_values = await asyncio.gather(*[
+        _acquire_async(rate_limiter, _tokens_per_request, start_time, index, admitted)
+        for index in range(_num_requests)
+    ])
+
+    assert admitted == list(range(_num_requests))
+    binned_time_values = bin_time_intervals(time_values, _period_in_seconds)
+    assert len(binned_time_values) == ceil((_num_requests * _tokens_per_request) / _tpm)
+    assert_max_num_values_per_period(binned_time_values, _tpm // _tokens_per_request)
+
+
+async def test_async_acquire_does_not_block_event_loop():
+    """Test that waiting for the rate limiter leaves the event loop free."""
+    rate_limiter = create_rate_limiter(
+        RateLimitConfig(
+            type=RateLimitType.SlidingWindow,
+            period_in_seconds=_period_in_seconds,
+            requests_per_period=_rpm,
+        )
+    )
+
+    ticks: list[float] = []
+    done = asyncio.Event()
+
+    async def tick():
+        while not done.is_set():
+            ticks.append(time.time())
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    start_time = time.time()
+    await asyncio.gather(*[
+        _acquire_async(rate_limiter, 0, start_time, index, [])
+        for index in range(_rpm + 1)
+    ])
+    done.set()
+    await ticker
+
+    # The limiter waited for a full period while the ticker kept running
+    assert time.time() - start_time >= _period_in_seconds
+    assert max(b - a for a, b in pairwise(ticks)) < 0.1
@@ -3,7 +3,9 @@
 
 """Test LiteLLM Retries."""
 
+import asyncio
 import time
+from itertools import pairwise
 from typing import Any
 
 import httpx
@@ -34,6 +36,15 @@ from hypergraph_llm.retry import create_retry
             3,
             0,  # Immediate retry, so no delay
         ),
+        (
+            RetryConfig(
+                type=RetryType.Cooldown,
+                max_retries=3,
+                base_delay=2.0,
+            ),
+            3,
+            2 + 4 + 8,  # Not rate limited, so exponential backoff
+        ),
     ],
 )
 def test_retries(config: RetryConfig, max_retries: int, expected_time: float) -> None:
@@ -83,6 +94,15 @@ def test_retries(config: RetryConfig, max_retries: int, expected_time: float) ->
             3,
             0,  # Immediate retry, so no delay
         ),
+        (
+            RetryConfig(
+                type=RetryType.Cooldown,
+                max_retries=3,
+                base_delay=2.0,
+            ),
+            3,
+            2 + 4 + 8,  # Not rate limited, so exponential backoff
+        ),
     ],
 )
 async def test_retries_async(
@@ -130,6 +150,12 @@ async def test_retries_async(
                 max_retries=3,
             )
         ),
+        (
+            RetryConfig(
+                type=RetryType.Cooldown,
+                max_retries=3,
+            )
+        ),
     ],
 )
 @pytest.mark.parametrize(
@@ -241,3 +267,82 @@ def test_exponential_backoff_skipping_exceptions(
     assert retries == 0, (
         f"Expected not to retry for '{exception}' exception. Got {retries} retries."
     )
+
+
+def _rate_limit_error(headers: dict[str, str]) -> exceptions.RateLimitError:
+    return exceptions.RateLimitError(
+        "Too many requests",
+        "openai",
+        "gpt-4o",
+        response=httpx.Response(
+            status_code=429,
+            headers=headers,
+            request=httpx.Request(method="POST", url="https://litellm.ai"),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected_delay"),
+    [
+        ({"retry-after": "1"}, 1.0),
+        ({"retry-after-ms": "1500"}, 1.5),
+        ({"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "1.2s"}, 1.2),
+        ({"x-ratelimit-reset-tokens": "1s500ms"}, 1.5),
+    ],
+)
+def test_cooldown_honors_reset_headers(
+    headers: dict[str, str], expected_delay: float
+) -> None:
+    """Test that a rate limited request waits as long as the provider asked."""
+    retry_service = create_retry(
+        RetryConfig(type=RetryType.Cooldown, max_retries=3),
+        endpoint=f"headers-{sorted(headers.items())}",
+    )
+    call_times: list[float] = []
+
+    def mock_func():
+        call_times.append(time.monotonic())
+        if len(call_times) == 1:
+            raise _rate_limit_error(headers)
+        return "ok"
+
+    assert retry_service.retry(func=mock_func, input_args={}) == "ok"
+    assert call_times[1] - call_times[0] == pytest.approx(expected_delay, abs=0.2)
+
+
+async def test_cooldown_pauses_all_requests_to_the_endpoint() -> None:
+    """Test that one 429 pauses every request and the gate releases them gradually."""
+    config = RetryConfig(type=RetryType.Cooldown, max_retries=3, release_interval=0.1)
+    retry_service = create_retry(config, endpoint="https://a/gpt-4o")
+    assert create_retry(config, endpoint="https://a/gpt-4o") is retry_service
+    assert create_retry(config, endpoint="https://b/gpt-4o") is not retry_service
+
+    call_times: list[float] = []
+    rate_limited = False
+
+    async def mock_func():
+        nonlocal rate_limited
+        call_times.append(time.monotonic())
+        if not rate_limited:
+            rate_limited = True
+            raise _rate_limit_error({"retry-after": "1"})
+        await asyncio.sleep(0)
+        return "ok"
+
+    start_time = time.monotonic()
+    first = asyncio.create_task(
+        retry_service.retry_async(func=mock_func, input_args={})
+    )
+    await asyncio.sleep(0.05)
+    results = await asyncio.gather(
+        first,
+        *[retry_service.retry_async(func=mock_func, input_args={}) for _ in range(4)],
+    )
+
+    assert results == ["ok"] * 5
+    # Only the rate limited call happened before the reset time
+    assert [t - start_time < 1.0 for t in call_times] == [True] + [False] * 5
+    # The paused requests were released one interval apart
+    released = sorted(call_times[1:])
+    assert all(b - a >= 0.09 for a, b in pairwise(released))
@@ -2,6 +2,7 @@
 # Licensed under the MIT License
 """Blob Storage Tests."""
 
+import asyncio
 import re
 from datetime import datetime
 
@@ -87,3 +88,45 @@ async def test_child():
             assert not has_test
     finally:
         parent._delete_container()  # noqa: SLF001
+
+
+async def test_chunked_transfer():
+    storage = AzureBlobStorage(
+        connection_string=WELL_KNOWN_BLOB_STORAGE_KEY,
+        container_name="testchunked",
+        max_concurrency=4,
+    )
+    try:
+        # Larger than a single download request, so it is read in chunks
+        data = bytes(range(256)) * (160 * 1024)
+        await storage.set("large.bin", data)
+        assert await storage.get("large.bin", as_bytes=True) == data
+        assert await storage.has("large.bin")
+
+        storage.set_sync("sync.txt", "Hello, World!")
+        assert storage.get_sync("sync.txt") == "Hello, World!"
+        assert await storage.get("sync.txt") == "Hello, World!"
+        storage.delete_sync("sync.txt")
+        assert not await storage.has("sync.txt")
+    finally:
+        storage._delete_container()  # noqa: SLF001
+
+
+def test_clients_per_event_loop():
+    storage = AzureBlobStorage(
+        connection_string=WELL_KNOWN_BLOB_STORAGE_KEY,
+        container_name="testloops",
+    )
+    clients = storage._async_container_client._clients  # noqa: SLF001
+    try:
+        asyncio.run(storage.set("test.txt", "Hello, World!"))
+        [first] = clients.values()
+        # The client of the closed event loop is closed and replaced
+        assert asyncio.run(storage.get("test.txt")) == "Hello, World!"
+        [second] = clients.values()
+        assert second is not first
+
+        asyncio.run(storage.close())
+        assert not clients
+    finally:
+        storage._delete_container()  # noqa: SLF001
@@ -29,6 +29,15 @@ async def test_find():
     assert output is None
 
 
+def test_get_set_sync():
+    storage = FileStorage(base_dir="tests/fixtures/text/input")
+    storage.set_sync("test_sync.txt", "Hello, World!")
+    assert storage.get_sync("test_sync.txt") == "Hello, World!"
+    assert storage.get_sync("test_sync.txt", as_bytes=True) == b"Hello, World!"
+    storage.delete_sync("test_sync.txt")
+    assert storage.get_sync("test_sync.txt") is None
+
+
 async def test_get_creation_date():
     storage = FileStorage(
         base_dir="tests/fixtures/text/input",
@@ -27,3 +27,35 @@ def test_file_metrics_writer_validation() -> None:
         writer=MetricsWriterType.File,
         base_dir="./metrics",
     )
+
+
+def test_openmetrics_metrics_writer_validation() -> None:
+    """Test that missing required parameters raise validation errors."""
+
+    with pytest.raises(
+        ValueError,
+        match="openmetrics_port or textfile_path must be specified for the OpenMetrics metrics writer\\.",
+    ):
+        _ = MetricsConfig(writer=MetricsWriterType.OpenMetrics)
+
+    with pytest.raises(
+        ValueError,
+        match="openmetrics_port must be between 0 and 65535\\.",
+    ):
+        _ = MetricsConfig(writer=MetricsWriterType.OpenMetrics, openmetrics_port=-1)
+
+    with pytest.raises(
+        ValueError,
+        match="textfile_interval must be a positive number\\.",
+    ):
+        _ = MetricsConfig(
+            writer=MetricsWriterType.OpenMetrics,
+            textfile_path="metrics.prom",
+            textfile_interval=0,
+        )
+
+    # passes validation
+    _ = MetricsConfig(writer=MetricsWriterType.OpenMetrics, openmetrics_port=9464)
+    _ = MetricsConfig(
+        writer=MetricsWriterType.OpenMetrics, textfile_path="metrics.prom"
+    )
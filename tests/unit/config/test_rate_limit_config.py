@@ -64,3 +64,37 @@ def test_sliding_window_validation() -> None:
         requests_per_period=100,
         tokens_per_period=1000,
     )
+
+
+def test_adaptive_validation() -> None:
+    """Test that invalid adaptive rate limit parameters raise validation errors."""
+
+    with pytest.raises(
+        ValueError,
+        match="initial_concurrency must be a positive integer for Adaptive rate limit\\.",
+    ):
+        _ = RateLimitConfig(type=RateLimitType.Adaptive, initial_concurrency=0)
+
+    with pytest.raises(
+        ValueError,
+        match="min_concurrency must not be greater than max_concurrency for Adaptive rate limit\\.",
+    ):
+        _ = RateLimitConfig(
+            type=RateLimitType.Adaptive, min_concurrency=8, max_concurrency=4
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="latency_tolerance must be greater than 1\\.0 for Adaptive rate limit\\.",
+    ):
+        _ = RateLimitConfig(type=RateLimitType.Adaptive, latency_tolerance=0.5)
+
+    # passes validation, no sliding window parameters required
+    _ = RateLimitConfig(type=RateLimitType.Adaptive)
+    _ = RateLimitConfig(
+        type=RateLimitType.Adaptive,
+        initial_concurrency=4,
+        min_concurrency=1,
+        max_concurrency=32,
+        latency_tolerance=2.0,
+    )
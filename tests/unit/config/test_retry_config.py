@@ -65,3 +65,43 @@ def test_immediate_validation() -> None:
         type=RetryType.Immediate,
         max_retries=3,
     )
+
+
+def test_cooldown_validation() -> None:
+    """Test that missing required parameters raise validation errors."""
+
+    with pytest.raises(
+        ValueError,
+        match="max_retries must be greater than 1 for Cooldown retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.Cooldown,
+            max_retries=1,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="base_delay must be greater than 1\\.0 for Cooldown retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.Cooldown,
+            base_delay=0.5,
+        )
+
+    with pytest.raises(
+        ValueError,
+        match="release_interval must not be negative for Cooldown retry\\.",
+    ):
+        _ = RetryConfig(
+            type=RetryType.Cooldown,
+            release_interval=-1,
+        )
+
+    # passes validation
+    _ = RetryConfig(type=RetryType.Cooldown)
+    _ = RetryConfig(
+        type=RetryType.Cooldown,
+        max_retries=5,
+        max_delay=60,
+        release_interval=0,
+    )
@@ -37,3 +37,13 @@ def test_litellm_tokenizer_validation() -> None:
         type=TokenizerType.Tiktoken,
         encoding_name="o200k-base",
     )
+
+    with pytest.raises(
+        ValueError,
+        match="token_count_cache_size must be a non-negative integer\\.",
+    ):
+        _ = TokenizerConfig(
+            type=TokenizerType.Tiktoken,
+            encoding_name="o200k-base",
+            token_count_cache_size=-1,
+        )
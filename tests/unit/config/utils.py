@@ -24,6 +24,7 @@ from hypergraph.config.models.snapshots_config import SnapshotsConfig
 from hypergraph.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
+from hypergraph.config.models.table_cache_config import TableCacheConfig
 from hypergraph_cache import CacheConfig
 from hypergraph_chunking.chunking_config import ChunkingConfig
 from hypergraph_input import InputConfig
@@ -114,6 +115,7 @@ def assert_model_configs(actual: ModelConfig, expected: ModelConfig) -> None:
         assert_metrics_configs(actual.metrics, expected.metrics)
     else:
         assert actual.metrics == expected.metrics
+    assert actual.cache_parameters == expected.cache_parameters
     assert actual.mock_responses == expected.mock_responses
 
 
@@ -188,6 +190,13 @@ def assert_snapshots_configs(
     assert actual.graphml == expected.graphml
 
 
+def assert_table_cache_configs(
+    actual: TableCacheConfig, expected: TableCacheConfig
+) -> None:
+    assert actual.enabled == expected.enabled
+    assert actual.max_bytes == expected.max_bytes
+
+
 def assert_extract_graph_configs(
     actual: ExtractGraphConfig, expected: ExtractGraphConfig
 ) -> None:
@@ -197,6 +206,8 @@ def assert_extract_graph_configs(
     assert actual.strict_entity_types == expected.strict_entity_types
     assert actual.strict_relationship_types == expected.strict_relationship_types
     assert actual.max_gleanings == expected.max_gleanings
+    assert actual.checkpoint == expected.checkpoint
+    assert actual.resume == expected.resume
     assert actual.completion_model_id == expected.completion_model_id
 
 
@@ -250,6 +261,7 @@ def assert_community_reports_configs(
     assert actual.text_prompt == expected.text_prompt
     assert actual.max_length == expected.max_length
     assert actual.max_input_length == expected.max_input_length
+    assert actual.context_workers == expected.context_workers
     assert actual.completion_model_id == expected.completion_model_id
 
 
@@ -342,7 +354,9 @@ def assert_basic_search_configs(
     assert actual.k == expected.k
 
 
-def assert_hypergraph_configs(actual: HyperGraphConfig, expected: HyperGraphConfig) -> None:
+def assert_hypergraph_configs(
+    actual: HyperGraphConfig, expected: HyperGraphConfig
+) -> None:
     completion_keys = sorted(actual.completion_models.keys())
     expected_completion_keys = sorted(expected.completion_models.keys())
     assert len(completion_keys) == len(expected_completion_keys)
@@ -368,6 +382,7 @@ def assert_hypergraph_configs(actual: HyperGraphConfig, expected: HyperGraphConf
     assert_text_embedding_configs(actual.embed_text, expected.embed_text)
     assert_chunking_configs(actual.chunking, expected.chunking)
     assert_snapshots_configs(actual.snapshots, expected.snapshots)
+    assert_table_cache_configs(actual.table_cache, expected.table_cache)
     assert_extract_graph_configs(actual.extract_graph, expected.extract_graph)
     assert_extract_graph_nlp_configs(
         actual.extract_graph_nlp, expected.extract_graph_nlp
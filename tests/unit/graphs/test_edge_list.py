@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests comparing the columnar edge list helpers with a row-by-row reference."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+from hypergraph.graphs.edge_list import normalize_edges, sorted_edge_list
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_fixture() -> pd.DataFrame:
+    """Load the realistic graph fixture as a relationships DataFrame."""
+    with open(FIXTURES_DIR / "graph.json") as f:
+        data = json.load(f)
+    return pd.DataFrame(data["edges"])
+
+
+def _reference_edge_list(edges: pd.DataFrame) -> list[tuple[str, str, float]]:
+    """Normalize, deduplicate and sort edges one row at a time."""
+    deduplicated: dict[tuple[str, str], float] = {}
+    for _, row in edges.iterrows():
+        source, target = sorted([str(row["source"]), str(row["target"])])
+        deduplicated.pop((source, target), None)
+        deduplicated[source, target] = float(row["weight"]) if "weight" in row else 1.0
+    return sorted(
+        (source, target, weight) for (source, target), weight in deduplicated.items()
+    )
+
+
+def test_sorted_edge_list_matches_reference():
+    edges = _load_fixture()
+    assert sorted_edge_list(normalize_edges(edges)) == _reference_edge_list(edges)
+
+
+def test_normalize_edges_keeps_last_reversed_pair():
+    edges = pd.DataFrame({
+        "source": ["B", "A", "C", "A"],
+        "target": ["A", "B", "A", "C"],
+        "weight": [1.0, 2.0, 3.0, 4.0],
+    })
+    normalized = normalize_edges(edges)
+    assert normalized["source"].tolist() == ["A", "A"]
+    assert normalized["target"].tolist() == ["B", "C"]
+    assert normalized["weight"].tolist() == [2.0, 4.0]
+
+
+def test_sorted_edge_list_defaults_weight():
+    edges = pd.DataFrame({"source": ["B", "A"], "target": ["C", "B"]})
+    assert sorted_edge_list(edges) == [("A", "B", 1.0), ("B", "C", 1.0)]
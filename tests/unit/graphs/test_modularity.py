@@ -260,3 +260,19 @@ def test_fixture_matches_nx():
         assert abs(nx_result - df_result) < 1e-10, (
             f"Mismatch for {n_communities} communities: NX={nx_result}, DF={df_result}"
         )
+
+
+def test_self_loops_and_unused_communities():
+    """Self-loops and communities without edges should match NX."""
+    edges = _make_edges(
+        ("A", "A", 2.0),
+        ("A", "B", 1.0),
+        ("B", "C", 1.0),
+        ("C", "C", 0.5),
+    )
+    partitions = {"A": 0, "B": 0, "C": 1, "D": 2}
+
+    nx_result = nx_modularity(_edges_to_nx(edges), partitions)
+    df_result = modularity(edges, partitions)
+
+    assert abs(nx_result - df_result) < 1e-10
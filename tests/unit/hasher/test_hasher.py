@@ -3,7 +3,15 @@
 
 """Test hasher"""
 
-from hypergraph_common.hasher import hash_data
+import json
+
+from hypergraph_common.hasher import (
+    canonical_json,
+    hash_data,
+    hash_json,
+    sha256_hasher,
+)
+from pydantic import BaseModel
 
 
 def test_hash_data() -> None:
@@ -102,3 +110,33 @@ def test_hash_data() -> None:
     assert hash_instance1 != hash_instance3, (
         "Hashes should be different for different class instances"
     )
+
+
+def test_hash_json() -> None:
+    """Test the canonical JSON serialization and hash."""
+
+    class Response(BaseModel):
+        """Test response format."""
+
+        answer: str
+
+    # Key order does not matter
+    assert hash_json({"a": 1, "b": [1, 2]}) == hash_json({"b": [1, 2], "a": 1})
+    assert hash_json({"a": 1}) != hash_json({"a": 2})
+
+    data = {
+        "messages": [{"role": "user", "content": "Hello"}],
+        "response_format": Response,
+        "example": Response(answer="42"),
+        "payload": b"bytes data",
+        "tags": {"b", "a"},
+        1: (1, 2),
+        "fallback": complex(1, 2),
+    }
+    serialized = canonical_json(data)
+    assert '"payload":{"__bytes__":"Ynl0ZXMgZGF0YQ=="}' in serialized
+    assert '"tags":["a","b"]' in serialized
+    assert '"example":{"answer":"42"}' in serialized
+    # Serializing the parsed output again yields the same string
+    assert canonical_json(json.loads(serialized)) == serialized
+    assert hash_json(data) == sha256_hasher(serialized)
@@ -78,3 +78,16 @@ class TestFilePipelineCache(unittest.IsolatedAsyncioTestCase):
         assert await self.cache.get("test1") == test1
         assert await self.cache.get("test2") == test2
         assert await self.cache.get("test3") == test3
+
+    async def test_get_set_sync(self):
+        self.cache.set_sync("test1", {"value": "this is a test file"})
+        assert os.path.exists(f"{TEMP_DIR}/test1")
+        assert self.cache.get_sync("test1") == {"value": "this is a test file"}
+        assert await self.cache.get("test1") == {"value": "this is a test file"}
+        assert self.cache.get_sync("NON_EXISTENT") is None
+
+        # Unreadable entries are dropped
+        with open(f"{TEMP_DIR}/test2", "w") as f:
+            f.write("not json")
+        assert self.cache.get_sync("test2") is None
+        assert not os.path.exists(f"{TEMP_DIR}/test2")
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+from hypergraph.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from hypergraph.index.operations.summarize_communities.explode_communities import (
+    explode_communities,
+)
+from hypergraph.index.operations.summarize_communities.graph_context.context_builder import (
+    build_local_context,
+)
+from hypergraph.index.workflows.create_community_reports import (
+    _prep_claims,
+    _prep_edges,
+    _prep_nodes,
+)
+from hypergraph.tokenizer.get_tokenizer import get_tokenizer
+
+
+def _load_inputs() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    entities = pd.read_parquet("tests/verbs/data/entities.parquet")
+    communities = pd.read_parquet("tests/verbs/data/communities.parquet")
+    relationships = pd.read_parquet("tests/verbs/data/relationships.parquet")
+    covariates = pd.read_parquet("tests/verbs/data/covariates.parquet")
+    return (
+        _prep_nodes(explode_communities(communities, entities)),
+        _prep_edges(relationships),
+        _prep_claims(covariates),
+    )
+
+
+def test_build_local_context_process_pool_matches_in_process():
+    tokenizer = get_tokenizer()
+    callbacks = NoopWorkflowCallbacks()
+    for max_context_tokens in [16_000, 500]:
+        expected = build_local_context(
+            *_load_inputs(), tokenizer, callbacks, max_context_tokens
+        )
+        actual = build_local_context(
+            *_load_inputs(),
+            tokenizer,
+            callbacks,
+            max_context_tokens,
+            num_workers=2,
+        )
+        pd.testing.assert_frame_equal(actual, expected)
@@ -2,7 +2,9 @@
 # Licensed under the MIT License
 import math
 import platform
+import random
 
+import pandas as pd
 from hypergraph.index.operations.summarize_communities.graph_context.sort_context import (
     sort_context,
 )
@@ -219,3 +221,128 @@ def test_sort_context_max_tokens():
     assert ctx is not None, "Context is none"
     num = tokenizer.num_tokens(ctx)
     assert num <= 800, f"num_tokens is not less than or equal to 800: {num}"
+
+
+def _legacy_sort_context(
+    local_context: list[dict], tokenizer, max_context_tokens: int | None = None
+) -> str:
+    """Reference implementation that re-renders the context after every edge."""
+
+    def _get_context_string(entities, edges, claims) -> str:
+        contexts = []
+        for label, data in [
+            ("Entities", entities),
+            ("Claims", claims),
+            ("Relationships", edges),
+        ]:
+            if data:
+                contexts.append(
+                    f"-----{label}-----\n{pd.DataFrame(data).to_csv(index=False, sep=',')}"
+                )
+        return "\n\n".join(contexts)
+
+    edges = [
+        {**e, "human_readable_id": int(e["human_readable_id"])}
+        for record in local_context
+        for e in record.get("edge_details", [])
+        if isinstance(e, dict)
+    ]
+    node_details = {record["title"]: record["node_details"] for record in local_context}
+    claim_details = {
+        record["title"]: [
+            c for c in record.get("claim_details", []) if isinstance(c, dict)
+        ]
+        for record in local_context
+        if isinstance(record.get("claim_details"), list)
+    }
+    edges.sort(key=lambda x: (-x["combined_degree"], x["human_readable_id"]))
+
+    edge_ids, node_ids, claim_ids = set(), set(), set()
+    sorted_edges, sorted_nodes, sorted_claims = [], [], []
+    context_string = ""
+    for edge in edges:
+        for title in [edge["source"], edge["target"]]:
+            node = node_details.get(title)
+            if node and node["human_readable_id"] not in node_ids:
+                node_ids.add(node["human_readable_id"])
+                sorted_nodes.append(node)
+            for claim in claim_details.get(title, []):
+                if claim["human_readable_id"] not in claim_ids:
+                    claim_ids.add(claim["human_readable_id"])
+                    sorted_claims.append(claim)
+        if edge["human_readable_id"] not in edge_ids:
+            edge_ids.add(edge["human_readable_id"])
+            sorted_edges.append(edge)
+        new_context_string = _get_context_string(
+            sorted_nodes, sorted_edges, sorted_claims
+        )
+        if (
+            max_context_tokens
+            and tokenizer.num_tokens(new_context_string) > max_context_tokens
+        ):
+            break
+        context_string = new_context_string
+    return context_string or _get_context_string(
+        sorted_nodes, sorted_edges, sorted_claims
+    )
+
+
+def _synthetic_context(num_edges: int) -> list[dict]:
+    rng = random.Random(42)
+    titles = [f"NODE {i}" for i in range(max(num_edges // 3, 2))]
+    context = {
+        title: {
+            "title": title,
+            "degree": 0,
+            "node_details": {
+                "human_readable_id": i,
+                "title": title,
+                "description": f'Entity "{title}", see\nnotes, {rng.random()}',
+                "degree": rng.randint(1, 20),
+            },
+            "edge_details": [],
+            "claim_details": [
+                {
+                    "human_readable_id": i,
+                    "subject_id": title,
+                    "type": "FACT",
+                    "status": "TRUE",
+                    "description": None if i % 5 else "claimed, twice",
+                }
+            ]
+            if i % 3 == 0
+            else [nan],
+        }
+        for i, title in enumerate(titles)
+    }
+    for i in range(num_edges):
+        source, target = rng.sample(titles, 2)
+        context[source]["edge_details"].append({
+            "human_readable_id": i,
+            "source": source,
+            "target": target,
+            "description": f"{source} relates to {target} ({rng.random():.3f})",
+            "combined_degree": rng.randint(1, 40),
+        })
+    return list(context.values())
+
+
+def test_sort_context_matches_incremental_rendering():
+    tokenizer = get_tokenizer()
+    local_context = _synthetic_context(300)
+    for max_context_tokens in [None, 1, 50, 500, 1_234, 4_000, 100_000]:
+        assert sort_context(
+            local_context, tokenizer=tokenizer, max_context_tokens=max_context_tokens
+        ) == _legacy_sort_context(
+            local_context, tokenizer, max_context_tokens=max_context_tokens
+        ), f"context mismatch for max_context_tokens={max_context_tokens}"
+
+
+def test_sort_context_matches_incremental_rendering_sample():
+    tokenizer = get_tokenizer()
+    for max_context_tokens in [None, 100, 300, 800]:
+        assert sort_context(
+            context, tokenizer=tokenizer, max_context_tokens=max_context_tokens
+        ) == _legacy_sort_context(
+            context, tokenizer, max_context_tokens=max_context_tokens
+        )
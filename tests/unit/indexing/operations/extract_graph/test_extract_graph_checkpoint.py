@@ -0,0 +1,165 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for checkpointed, resumable graph extraction."""
+
+import asyncio
+from itertools import pairwise
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from hypergraph.config.enums import AsyncType
+from hypergraph.index.operations.extract_graph import extract_graph as module
+from hypergraph.index.operations.extract_graph.checkpoint import (
+    CHECKPOINT_TABLE,
+    ExtractGraphCheckpoint,
+)
+from hypergraph.index.utils.derive_from_rows import ParallelizationError
+from hypergraph_storage import StorageConfig, StorageType, create_storage
+from hypergraph_storage.tables.parquet_table_provider import ParquetTableProvider
+
+TEXT_UNITS = pd.DataFrame({
+    "id": ["t1", "t2", "t3", "t4", "t5"],
+    "text": ["alpha beta", "beta gamma", "gamma delta", "", "alpha delta"],
+})
+
+
+@pytest.fixture
+def extracted(monkeypatch) -> list[str]:
+    """Replace the LLM extraction with one entity per word and one edge per pair."""
+    calls: list[str] = []
+
+    async def fake_extract(text, source_id, **kwargs):
+        calls.append(source_id)
+        await asyncio.sleep(0)
+        if text == "fail":
+            msg = "extraction failed"
+            raise RuntimeError(msg)
+        words = text.split()
+        entities = pd.DataFrame(
+            [
+                (word.upper(), "thing", f"{word} in {source_id}", source_id)
+                for word in words
+            ],
+            columns=pd.Index(["title", "type", "description", "source_id"]),
+        )
+        relationships = pd.DataFrame(
+            [
+                (
+                    first.upper(),
+                    second.upper(),
+                    1 / 3,
+                    f"{first} to {second}",
+                    source_id,
+                )
+                for first, second in pairwise(words)
+            ],
+            columns=pd.Index([
+                "source",
+                "target",
+                "weight",
+                "description",
+                "source_id",
+            ]),
+        )
+        return entities, relationships
+
+    monkeypatch.setattr(module, "_run_extract_graph", fake_extract)
+    return calls
+
+
+async def _extract(text_units, checkpoint=None, resume=False):
+    return await module.extract_graph(
+        text_units=text_units,
+        callbacks=MagicMock(),
+        text_column="text",
+        id_column="id",
+        model=MagicMock(),
+        prompt="",
+        entity_types=["thing"],
+        relationship_types=None,
+        max_gleanings=0,
+        num_threads=2,
+        async_type=AsyncType.AsyncIO,
+        checkpoint=checkpoint,
+        resume=resume,
+    )
+
+
+def _table_provider() -> ParquetTableProvider:
+    return ParquetTableProvider(create_storage(StorageConfig(type=StorageType.Memory)))
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_matches_in_memory(extracted):
+    """Merging from the checkpoint gives the same graph as merging in memory."""
+    entities, relationships = await _extract(TEXT_UNITS)
+    extracted.clear()
+    checkpoint = ExtractGraphCheckpoint(_table_provider(), flush_interval=2)
+    checkpointed = await _extract(TEXT_UNITS, checkpoint=checkpoint)
+
+    pd.testing.assert_frame_equal(checkpointed[0], entities)
+    pd.testing.assert_frame_equal(checkpointed[1], relationships)
+
+
+@pytest.mark.asyncio
+async def test_resume_extracts_missing_text_units(extracted):
+    """An interrupted run keeps its completed text units and a resumed run finishes the rest."""
+    checkpoint = ExtractGraphCheckpoint(_table_provider(), flush_interval=2)
+    failing = TEXT_UNITS.assign(
+        text=TEXT_UNITS["text"].where(TEXT_UNITS["id"] != "t3", "fail")
+    )
+    with pytest.raises(ParallelizationError):
+        await _extract(failing, checkpoint=checkpoint)
+    assert await checkpoint.start(resume=True) == {"t1", "t2", "t4", "t5"}
+
+    extracted.clear()
+    entities, relationships = await _extract(
+        TEXT_UNITS, checkpoint=checkpoint, resume=True
+    )
+    assert extracted == ["t3"]
+
+    # Merged in text unit order, as if the run had never been interrupted
+    assert entities.set_index("title").loc["GAMMA", "text_unit_ids"] == ["t2", "t3"]
+    assert entities.set_index("title").loc["DELTA", "text_unit_ids"] == ["t3", "t5"]
+    assert relationships[["source", "target"]].to_numpy().tolist() == [
+        ["ALPHA", "BETA"],
+        ["BETA", "GAMMA"],
+        ["GAMMA", "DELTA"],
+        ["ALPHA", "DELTA"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fresh_run_replaces_checkpoint(extracted):
+    """Without resume, every text unit is extracted again and the old checkpoint is replaced."""
+    table_provider = _table_provider()
+    checkpoint = ExtractGraphCheckpoint(table_provider, flush_interval=2)
+    await _extract(TEXT_UNITS, checkpoint=checkpoint)
+    extracted.clear()
+    await _extract(TEXT_UNITS.iloc[:2], checkpoint=checkpoint)
+
+    assert sorted(extracted) == ["t1", "t2"]
+    table = await table_provider.read_dataframe(CHECKPOINT_TABLE)
+    assert sorted(table["id"]) == ["t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_close_compacts_flushed_fragments(extracted):
+    """Each flush stores its rows in a fragment, and closing compacts them into one table."""
+    storage = create_storage(StorageConfig(type=StorageType.Memory))
+    table_provider = ParquetTableProvider(storage)
+    checkpoint = ExtractGraphCheckpoint(table_provider, flush_interval=1)
+    await checkpoint.start(resume=False)
+    for text_unit_id in ["t1", "t2", "t3"]:
+        await checkpoint.write(text_unit_id, pd.DataFrame(), pd.DataFrame())
+    assert sorted(storage.keys()) == [
+        f"{CHECKPOINT_TABLE}.parquet",
+        f"{CHECKPOINT_TABLE}.part-00001.parquet",
+        f"{CHECKPOINT_TABLE}.part-00002.parquet",
+    ]
+
+    await checkpoint.close()
+    assert storage.keys() == [f"{CHECKPOINT_TABLE}.parquet"]
+    assert await checkpoint.start(resume=True) == {"t1", "t2", "t3"}
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for entity resolution candidate blocking."""
+
+from hypergraph.index.operations.resolve_entities.blocking import build_blocks
+
+
+def test_token_and_acronym_keys():
+    """Shared tokens and acronyms put titles in the same block."""
+    blocks = build_blocks(
+        ["Captain Ahab", "Moby Dick", "Ahab", "USA", "United States of America"],
+        max_block_size=50,
+        similarity_threshold=0.4,
+    )
+    assert blocks == [["Ahab", "Captain Ahab"], ["United States of America", "USA"]]
+
+
+def test_similar_spellings():
+    """Titles with similar character n-grams are candidates."""
+    blocks = build_blocks(
+        ["Ishmael", "Ishmail", "Queequeg", "Moby-Dick", "MOBY DICK"],
+        max_block_size=50,
+        similarity_threshold=0.4,
+    )
+    assert blocks == [["Ishmael", "Ishmail"], ["MOBY DICK", "Moby-Dick"]]
+
+
+def test_no_candidates():
+    """Unrelated titles produce no blocks."""
+    assert (
+        build_blocks(["A", "B", "C"], max_block_size=50, similarity_threshold=0.4) == []
+    )
+
+
+def test_common_tokens_are_ignored():
+    """Tokens shared by more titles than fit in a block are not blocking keys."""
+    titles = [f"Company {name}" for name in ("Alpha", "Bravo", "Delta", "Kilo")]
+    assert build_blocks(titles, max_block_size=3, similarity_threshold=0.9) == []
+
+
+def test_block_size_is_bounded():
+    """Large candidate groups are split into blocks of at most max_block_size."""
+    titles = [f"Pequod{'!' * index}" for index in range(10)]
+    blocks = build_blocks(titles, max_block_size=4, similarity_threshold=0.9)
+    assert [len(block) for block in blocks] == [4, 4, 2]
+    assert sorted(title for block in blocks for title in block) == sorted(titles)
+
+
+def test_deterministic_blocks():
+    """Blocks do not depend on the input order."""
+    titles = ["Captain Ahab", "Ahab", "The Pequod", "Pequod", "Ishmael", "Ishmail"]
+    assert build_blocks(
+        titles, max_block_size=50, similarity_threshold=0.4
+    ) == build_blocks(titles[::-1], max_block_size=50, similarity_threshold=0.4)
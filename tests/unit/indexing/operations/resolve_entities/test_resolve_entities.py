@@ -94,9 +94,9 @@ async def test_simple_duplicates(
     sample_entities, sample_relationships, mock_callbacks
 ):
     """Ahab → Captain Ahab, Pequod → The Pequod."""
-    # LLM response: entity 1 (Captain Ahab) and 3 (Ahab) are the same;
-    # entity 4 (The Pequod) and 6 (Pequod) are the same.
-    model = _make_mock_model("1, 3\n4, 6")
+    # Each candidate block is sorted, so the LLM sees "1. Ahab\n2. Captain Ahab"
+    # and "1. Pequod\n2. The Pequod"; entity 2 is the canonical name in both.
+    model = _make_mock_model("2, 1")
 
     result_entities, result_relationships = await resolve_entities(
         entities=sample_entities.copy(),
@@ -170,8 +170,8 @@ async def test_single_entity_skips():
 
 
 @pytest.mark.asyncio
-async def test_all_entities_processed(mock_callbacks):
-    """All entities are sent to the LLM in a single call."""
+async def test_only_candidate_blocks_processed(mock_callbacks):
+    """Entities without duplicate candidates are never sent to the LLM."""
     entities = pd.DataFrame({
         "title": ["A", "B", "C", "D", "E"],
         "description": [""] * 5,
@@ -189,8 +189,60 @@ async def test_all_entities_processed(mock_callbacks):
         num_threads=1,
     )
 
-    # Model should have been called once (single call for all entities)
-    assert model.completion_async.call_count == 1
+    model.completion_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_one_call_per_block(
+    sample_entities, sample_relationships, mock_callbacks
+):
+    """Each candidate block gets its own prompt with only its entities."""
+    model = _make_mock_model("NO_DUPLICATES")
+
+    await resolve_entities(
+        entities=sample_entities.copy(),
+        relationships=sample_relationships.copy(),
+        callbacks=mock_callbacks,
+        model=model,
+        prompt="{entity_list}",
+        num_threads=4,
+    )
+
+    prompts = sorted(
+        call.kwargs["messages"] for call in model.completion_async.call_args_list
+    )
+    assert prompts == ["1. Ahab\n2. Captain Ahab", "1. Pequod\n2. The Pequod"]
+
+
+@pytest.mark.asyncio
+async def test_block_failure_is_isolated(
+    sample_entities, sample_relationships, mock_callbacks
+):
+    """A failed block leaves its entities unchanged without affecting other blocks."""
+
+    def completion_async(messages: str) -> MagicMock:
+        if "Pequod" in messages:
+            msg = "LLM unavailable"
+            raise RuntimeError(msg)
+        result = MagicMock()
+        result.content = "2, 1"
+        return result
+
+    model = AsyncMock()
+    model.completion_async = AsyncMock(side_effect=completion_async)
+
+    result_entities, _ = await resolve_entities(
+        entities=sample_entities.copy(),
+        relationships=sample_relationships.copy(),
+        callbacks=mock_callbacks,
+        model=model,
+        prompt="{entity_list}",
+        num_threads=2,
+    )
+
+    titles = list(result_entities["title"])
+    assert titles.count("Captain Ahab") == 2
+    assert "Pequod" in titles
 
 
 @pytest.mark.asyncio
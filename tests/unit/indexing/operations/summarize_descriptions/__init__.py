@@ -0,0 +1,2 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the summarize_descriptions operation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+from hypergraph.index.operations.summarize_descriptions.summarize_descriptions import (
+    summarize_descriptions,
+)
+from hypergraph.index.typing.stats import SummarizationStats
+
+
+def _make_mock_model() -> MagicMock:
+    """Create a mock LLM model counting one token per word."""
+    model = MagicMock()
+    model.tokenizer.num_tokens = lambda text: len(text.split())
+    result = MagicMock()
+    result.content = "summary"
+    model.completion_async = AsyncMock(return_value=result)
+    return model
+
+
+@pytest.mark.asyncio
+async def test_summarization_strategies():
+    """Only multi-description lists call the LLM, and only large ones reduce iteratively."""
+    entities = pd.DataFrame({
+        "title": ["A", "B", "C"],
+        "description": [
+            ["a single description"],
+            ["first", "second", "third"],
+            ["one two three", "four five six", "seven eight nine"],
+        ],
+    })
+    relationships = pd.DataFrame({
+        "source": ["A"],
+        "target": ["B"],
+        "description": [["knows", "likes"]],
+    })
+    model = _make_mock_model()
+    stats = SummarizationStats()
+
+    entity_summaries, relationship_summaries = await summarize_descriptions(
+        entities_df=entities,
+        relationships_df=relationships,
+        callbacks=MagicMock(),
+        model=model,
+        max_summary_length=10,
+        max_input_tokens=8,
+        prompt="{entity_name} {description_list} {max_length}",
+        num_threads=2,
+        stats=stats,
+    )
+
+    assert list(entity_summaries["description"]) == [
+        "a single description",
+        "summary",
+        "summary",
+    ]
+    assert list(relationship_summaries["description"]) == ["summary"]
+    assert (stats.passthrough, stats.single, stats.multi_round) == (1, 2, 1)
+    # One call per single-call list, two rounds for the multi-round list
+    assert model.completion_async.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_longest_inputs_first():
+    """Nodes and edges share one queue, ordered by descending input length."""
+    entities = pd.DataFrame({
+        "title": ["A", "B"],
+        "description": [["a", "b"], ["a much longer", "description list"]],
+    })
+    relationships = pd.DataFrame({
+        "source": ["A"],
+        "target": ["B"],
+        "description": [["medium length", "edge"]],
+    })
+    model = _make_mock_model()
+
+    await summarize_descriptions(
+        entities_df=entities,
+        relationships_df=relationships,
+        callbacks=MagicMock(),
+        model=model,
+        max_summary_length=10,
+        max_input_tokens=100,
+        prompt="{entity_name}",
+        num_threads=1,
+    )
+
+    prompts = [
+        call.kwargs["messages"] for call in model.completion_async.call_args_list
+    ]
+    assert prompts == ['"B"', '["A", "B"]', '"A"']
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate():
+    """A failed summary fails the whole operation with the original error."""
+    entities = pd.DataFrame({"title": ["A"], "description": [["a", "b"]]})
+    relationships = pd.DataFrame({"source": [], "target": [], "description": []})
+    model = _make_mock_model()
+    model.completion_async = AsyncMock(side_effect=ValueError("LLM unavailable"))
+
+    with pytest.raises(ValueError, match="LLM unavailable"):
+        await summarize_descriptions(
+            entities_df=entities,
+            relationships_df=relationships,
+            callbacks=MagicMock(),
+            model=model,
+            max_summary_length=10,
+            max_input_tokens=100,
+            prompt="{entity_name}",
+            num_threads=2,
+        )
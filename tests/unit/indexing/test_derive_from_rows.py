@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Unit tests for the derive_from_rows scheduler."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+from hypergraph.config.enums import AsyncType
+from hypergraph.index.utils.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows,
+    derive_from_rows_stream,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_type", [AsyncType.AsyncIO, AsyncType.Threaded])
+async def test_results_in_row_order(async_type: AsyncType):
+    """derive_from_rows returns one result per row, in row order."""
+    df = pd.DataFrame({"id": [3, 1, 2], "text": ["c", "a", "b"]})
+
+    async def transform(row):
+        await asyncio.sleep(row["id"] / 100)
+        return f"{row['id']}:{row['text']}"
+
+    results = await derive_from_rows(
+        df, transform, num_threads=3, async_type=async_type
+    )
+    assert results == ["3:c", "1:a", "2:b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_completion_order():
+    """The stream yields (position, result) pairs as soon as rows complete."""
+    df = pd.DataFrame({"delay": [3, 1, 2]})
+
+    async def transform(row):
+        await asyncio.sleep(row["delay"] / 100)
+        return row["delay"]
+
+    pairs = [
+        pair async for pair in derive_from_rows_stream(df, transform, num_threads=3)
+    ]
+    assert pairs == [(1, 1), (2, 2), (0, 3)]
+
+
+@pytest.mark.asyncio
+async def test_bounded_in_flight_rows():
+    """No more than num_threads rows are transformed at the same time."""
+    df = pd.DataFrame({"value": range(50)})
+    in_flight = 0
+    max_in_flight = 0
+
+    async def transform(row):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return row["value"]
+
+    results = await derive_from_rows(df, transform, num_threads=4)
+    assert results == list(range(50))
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_raised_after_all_rows():
+    """Failed rows are reported once every other row has been processed."""
+    df = pd.DataFrame({"value": range(5)})
+    processed = []
+
+    def transform(row):
+        if row["value"] == 1:
+            msg = "bad row"
+            raise ValueError(msg)
+        processed.append(row["value"])
+        return row["value"]
+
+    with pytest.raises(ParallelizationError, match="1 Errors occurred"):
+        await derive_from_rows(df, transform, num_threads=2)
+    assert sorted(processed) == [0, 2, 3, 4]
+
+
+class _Abort(BaseException):
+    """A BaseException that is not an Exception, like KeyboardInterrupt."""
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+@pytest.mark.parametrize("error", [_Abort, asyncio.CancelledError])
+async def test_worker_base_exception_raised(error: type[BaseException]):
+    """A worker stopped by a BaseException fails the stream instead of hanging it."""
+    df = pd.DataFrame({"value": range(10)})
+
+    async def transform(row):
+        if row["value"] == 3:
+            raise error
+        await asyncio.sleep(0)
+        return row["value"]
+
+    with pytest.raises(error):
+        async for _ in derive_from_rows_stream(df, transform, num_threads=2):
+            pass
@@ -0,0 +1,128 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+import unittest
+
+import pandas as pd
+from hypergraph_storage import (
+    StorageConfig,
+    StorageType,
+    create_storage,
+)
+from hypergraph_storage.tables.cached_table_provider import CachedTableProvider
+from hypergraph_storage.tables.parquet_table_provider import ParquetTableProvider
+
+
+class TestCachedTableProvider(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.storage = create_storage(StorageConfig(type=StorageType.Memory))
+        self.table_provider = CachedTableProvider(
+            ParquetTableProvider(storage=self.storage), max_bytes=1024**2
+        )
+
+    async def asyncTearDown(self):
+        await self.storage.clear()
+
+    async def test_read_through(self):
+        df = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+        await self.table_provider.write_dataframe("rows", df)
+
+        assert await self.storage.has("rows.parquet")
+        assert self.table_provider.list() == ["rows"]
+
+        await self.table_provider.read_dataframe("rows")
+        result = await self.table_provider.read_dataframe("rows")
+        pd.testing.assert_frame_equal(result, df)
+        assert self.table_provider.stats.hits == 1
+        assert self.table_provider.stats.misses == 1
+        assert self.table_provider.stats.bytes_served > 0
+
+        # Reads are copies, so modifying them does not change the cached table
+        result["value"] = 0
+        result = await self.table_provider.read_dataframe("rows")
+        assert result["value"].tolist() == [1, 2, 3]
+
+    async def test_read_columns_and_filters(self):
+        df = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+        await self.table_provider.write_dataframe("rows", df)
+        await self.table_provider.read_dataframe("rows")
+
+        result = await self.table_provider.read_dataframe(
+            "rows", columns=["value"], filters=[("id", "in", ["a", "c"])]
+        )
+        assert result.columns.tolist() == ["value"]
+        assert result["value"].tolist() == [1, 3]
+        assert self.table_provider.stats.hits == 1
+
+    async def test_reads_match_storage(self):
+        df = pd.DataFrame(
+            {"id": ["a", "b"], "values": [[1, 2], [3]]}, index=pd.Index([2, 0])
+        )
+        await self.table_provider.write_dataframe("rows", df)
+        await self.table_provider.read_dataframe("rows")
+
+        storage_tables = ParquetTableProvider(storage=self.storage)
+        for columns in (None, ["values"], ["values", "id"]):
+            expected = await storage_tables.read_dataframe("rows", columns=columns)
+            result = await self.table_provider.read_dataframe("rows", columns=columns)
+            pd.testing.assert_frame_equal(result, expected)
+        assert self.table_provider.stats.hits == 3
+
+    async def test_write_drops_table(self):
+        await self.table_provider.write_dataframe(
+            "rows", pd.DataFrame({"id": ["a"], "value": [1]})
+        )
+        await self.table_provider.read_dataframe("rows")
+        await self.table_provider.write_dataframe(
+            "rows", pd.DataFrame({"id": ["b"], "value": [2]})
+        )
+
+        result = await self.table_provider.read_dataframe("rows")
+        assert result["id"].tolist() == ["b"]
+        assert self.table_provider.stats.misses == 2
+
+    async def test_read_miss(self):
+        await ParquetTableProvider(storage=self.storage).write_dataframe(
+            "rows", pd.DataFrame({"id": ["a"], "value": [1]})
+        )
+
+        await self.table_provider.read_dataframe("rows", columns=["id"])
+        await self.table_provider.read_dataframe("rows")
+        result = await self.table_provider.read_dataframe("rows")
+
+        assert result["value"].tolist() == [1]
+        assert self.table_provider.stats.misses == 2
+        assert self.table_provider.stats.hits == 1
+
+    async def test_evict_least_recently_used(self):
+        df = pd.DataFrame({"id": [str(i) for i in range(100)], "value": range(100)})
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        table_provider = CachedTableProvider(
+            ParquetTableProvider(storage=self.storage), max_bytes=size * 2
+        )
+
+        for table_name in ("first", "second", "third"):
+            await table_provider.write_dataframe(table_name, df)
+        await table_provider.read_dataframe("first")
+        await table_provider.read_dataframe("second")
+        await table_provider.read_dataframe("first")
+        await table_provider.read_dataframe("third")
+
+        assert table_provider.stats.evictions == 1
+        await table_provider.read_dataframe("first")
+        await table_provider.read_dataframe("second")
+        assert table_provider.stats.hits == 2
+        assert table_provider.stats.misses == 4
+
+    async def test_open_drops_table(self):
+        await self.table_provider.write_dataframe(
+            "rows", pd.DataFrame({"id": ["a"], "value": [1]})
+        )
+        await self.table_provider.read_dataframe("rows")
+        async with self.table_provider.open("rows", truncate=False) as table:
+            await table.write({"id": "b", "value": 2})
+
+        result = await self.table_provider.read_dataframe("rows")
+        assert result["id"].tolist() == ["a", "b"]
+        assert self.table_provider.stats.hits == 0
+        assert self.table_provider.stats.misses == 2
@@ -117,3 +117,26 @@ class TestCSVTableProvider(unittest.IsolatedAsyncioTestCase):
         tables = self.table_provider.list()
         assert len(tables) == 3
         assert set(tables) == {"table1", "table2", "table3"}
+
+    async def test_read_columns_and_filters(self):
+        """Test reading a subset of columns and rows."""
+        df = pd.DataFrame({
+            "id": ["a", "b", "c"],
+            "value": [1, 2, 3],
+            "text": ["x", "y", "z"],
+        })
+        await self.table_provider.write_dataframe("test", df)
+
+        result = await self.table_provider.read_dataframe(
+            "test", columns=["id"], filters=[("value", ">=", 2)]
+        )
+        pd.testing.assert_frame_equal(result, pd.DataFrame({"id": ["b", "c"]}))
+
+        result = await self.table_provider.read_dataframe(
+            "test", filters=[[("id", "=", "a")], [("value", "in", [3])]]
+        )
+        assert result["id"].tolist() == ["a", "c"]
+        assert list(result.columns) == ["id", "value", "text"]
+
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            await self.table_provider.read_dataframe("test", filters=[("id", "~", "a")])
@@ -0,0 +1,174 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+import unittest
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from hypergraph_storage import (
+    StorageConfig,
+    StorageType,
+    create_storage,
+)
+from hypergraph_storage.file_storage import FileStorage
+from hypergraph_storage.tables.parquet_table_provider import ParquetTableProvider
+
+
+class TestParquetTableMemory(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.storage = create_storage(StorageConfig(type=StorageType.Memory))
+        self.table_provider = ParquetTableProvider(
+            storage=self.storage, row_group_size=2
+        )
+
+    async def asyncTearDown(self):
+        await self.storage.clear()
+
+    async def _write_rows(self, table_name: str, ids: range, truncate: bool = True):
+        async with self.table_provider.open(table_name, truncate=truncate) as table:
+            for i in ids:
+                await table.write({"id": str(i), "value": i})
+
+    async def test_write_row_groups(self):
+        await self._write_rows("rows", range(5))
+
+        data = await self.storage.get("rows.parquet", as_bytes=True)
+        metadata = pq.ParquetFile(BytesIO(data)).metadata
+        assert metadata.num_row_groups == 3
+        assert metadata.num_rows == 5
+
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == list(range(5))
+
+    async def test_read_rows(self):
+        df = pd.DataFrame({"id": ["a", "b", "c"], "tags": [["x"], [], ["y", "z"]]})
+        await self.table_provider.write_dataframe("rows", df)
+
+        table = self.table_provider.open("rows")
+        rows = [row async for row in table]
+
+        assert rows == [
+            {"id": "a", "tags": ["x"]},
+            {"id": "b", "tags": []},
+            {"id": "c", "tags": ["y", "z"]},
+        ]
+        assert await table.length() == 3
+        assert await table.has("c")
+        assert not await table.has("d")
+
+    async def test_append_fragments(self):
+        await self._write_rows("rows", range(3), truncate=False)
+        await self._write_rows("rows", range(3, 5), truncate=False)
+        await self._write_rows("rows", range(5, 6), truncate=False)
+
+        assert self.table_provider.list() == ["rows"]
+        assert sorted(self.storage.keys()) == [
+            "rows.parquet",
+            "rows.part-00001.parquet",
+            "rows.part-00002.parquet",
+        ]
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == list(range(6))
+        assert df.index.tolist() == list(range(6))
+        async with self.table_provider.open("rows") as table:
+            assert await table.length() == 6
+            assert [row["value"] async for row in table] == list(range(6))
+
+        await self._write_rows("rows", range(10, 12))
+        assert self.storage.keys() == ["rows.parquet"]
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == [10, 11]
+
+        await self._write_rows("rows", range(12, 13), truncate=False)
+        await self.table_provider.write_dataframe("rows", pd.DataFrame({"x": [1]}))
+        assert self.storage.keys() == ["rows.parquet"]
+
+    async def test_flush(self):
+        table = self.table_provider.open("rows")
+        await table.write({"id": "0", "value": 0})
+        await table.flush()
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == [0]
+
+        for i in range(1, 4):
+            await table.write({"id": str(i), "value": i})
+            await table.flush()
+        await table.close()
+
+        assert sorted(self.storage.keys()) == [
+            "rows.parquet",
+            "rows.part-00001.parquet",
+            "rows.part-00002.parquet",
+            "rows.part-00003.parquet",
+        ]
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == list(range(4))
+
+    async def test_schema_change(self):
+        async with self.table_provider.open("rows") as table:
+            await table.write({"id": "a", "value": 1})
+            await table.write({"id": "b", "value": 2})
+            await table.write({"id": "c", "other": "x"})
+
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["id"].tolist() == ["a", "b", "c"]
+        assert df["other"].tolist()[2] == "x"
+
+    async def test_truncate_without_rows(self):
+        await self._write_rows("rows", range(2))
+        await self._write_rows("rows", range(0))
+
+        df = await self.table_provider.read_dataframe("rows")
+        assert df["value"].tolist() == [0, 1]
+
+
+class TestParquetTableFile(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.storage = FileStorage(base_dir=self.temp_dir.name)
+        self.table_provider = ParquetTableProvider(
+            storage=self.storage, row_group_size=2
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_stream_file(self):
+        async with self.table_provider.open("rows") as table:
+            for i in range(5):
+                await table.write({"id": str(i), "value": i})
+            assert not (Path(self.temp_dir.name) / "rows.parquet").exists()
+
+        async with self.table_provider.open("rows", truncate=False) as table:
+            await table.write({"id": "5", "value": 5})
+
+        assert sorted(path.name for path in Path(self.temp_dir.name).iterdir()) == [
+            "rows.parquet",
+            "rows.part-00001.parquet",
+        ]
+        metadata = pq.ParquetFile(self.storage.get_path("rows.parquet")).metadata
+        assert metadata.num_row_groups == 3
+        async with self.table_provider.open("rows") as table:
+            assert await table.length() == 6
+            assert [row["value"] async for row in table] == list(range(6))
+
+    async def test_read_memory_mapped(self):
+        df = pd.DataFrame({"id": ["a", "b"], "value": [1, 2], "tags": [["x"], []]})
+        await self.table_provider.write_dataframe("rows", df)
+
+        result = await self.table_provider.read_dataframe("rows")
+        pd.testing.assert_frame_equal(result, df)
+
+        # Replacing the file does not affect the DataFrames read from it
+        await self.table_provider.write_dataframe("rows", df.iloc[:1])
+        pd.testing.assert_frame_equal(result, df)
+
+        arrow_provider = ParquetTableProvider(storage=self.storage, arrow_strings=True)
+        result = await arrow_provider.read_dataframe("rows", columns=["id", "value"])
+        assert result["id"].dtype == pd.ArrowDtype(pa.string())
+        assert result["value"].dtype == "int64"
+        assert result["id"].tolist() == ["a"]
@@ -88,3 +88,24 @@ class TestParquetTableProvider(unittest.IsolatedAsyncioTestCase):
 
         # Now it exists
         assert await self.table_provider.has("test_table")
+
+    async def test_read_columns_and_filters(self):
+        df = pd.DataFrame({
+            "id": ["a", "b", "c"],
+            "value": [1, 2, 3],
+            "text": ["x", "y", "z"],
+        })
+        await self.table_provider.write_dataframe("test", df)
+
+        result = await self.table_provider.read_dataframe(
+            "test", columns=["text", "id"], filters=[("value", ">=", 2)]
+        )
+        pd.testing.assert_frame_equal(
+            result, pd.DataFrame({"text": ["y", "z"], "id": ["b", "c"]})
+        )
+
+        result = await self.table_provider.read_dataframe(
+            "test", filters=[[("id", "=", "a")], [("value", "in", [3])]]
+        )
+        assert result["id"].tolist() == ["a", "c"]
+        assert list(result.columns) == ["id", "value", "text"]
@@ -2,6 +2,7 @@
 # Licensed under the MIT License
 
 from hypergraph.tokenizer.get_tokenizer import get_tokenizer
+from hypergraph_llm.tokenizer.tiktoken_tokenizer import TiktokenTokenizer
 
 
 def test_encode_basic():
@@ -18,3 +19,49 @@ def test_num_tokens_empty_input():
     result = len(tokenizer.encode(""))
 
     assert result == 0, "Token count for empty input should be 0"
+
+
+def test_num_tokens_batch():
+    tokenizer = get_tokenizer()
+    texts = ["abc def", "", "hello world " * 50] * 4
+
+    assert tokenizer.num_tokens_batch(texts) == [
+        len(tokenizer.encode(text)) for text in texts
+    ]
+    assert tokenizer.num_tokens_batch([]) == []
+
+
+def test_num_tokens_cache():
+    class CountingTokenizer(TiktokenTokenizer):
+        calls = 0
+
+        def _count_tokens(self, text: str) -> int:
+            self.calls += 1
+            return super()._count_tokens(text)
+
+    tokenizer = CountingTokenizer(encoding_name="o200k_base", token_count_cache_size=2)
+    assert tokenizer.num_tokens("abc def") == 2
+    assert tokenizer.num_tokens_batch(["abc def", "abc"]) == [2, 1]
+    assert tokenizer.calls == 2
+
+    # "abc def" is the least recently used count and is evicted
+    tokenizer.num_tokens("def")
+    tokenizer.num_tokens("abc")
+    assert tokenizer.calls == 3
+    tokenizer.num_tokens("abc def")
+    assert tokenizer.calls == 4
+
+
+def test_num_prompt_tokens():
+    tokenizer = get_tokenizer()
+    messages = [
+        {"role": "system", "content": "abc def"},
+        {"role": "user", "name": "someone", "content": [{"text": "abc"}]},
+    ]
+
+    expected = 3 + 2 * 3 + 1
+    expected += sum(
+        len(tokenizer.encode(text))
+        for text in ["system", "abc def", "user", "someone", "abc"]
+    )
+    assert tokenizer.num_prompt_tokens(messages) == expected  # type: ignore